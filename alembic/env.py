@@ -20,6 +20,7 @@ from app.database import DATABASE_URL
 import app.models.meetup  # noqa: F401
 import app.models.user  # noqa: F401
 import app.models.participation  # noqa: F401
+import app.models.event_outbox  # noqa: F401
 
 config = context.config
 if config.config_file_name is not None:
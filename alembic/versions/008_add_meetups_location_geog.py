@@ -0,0 +1,32 @@
+"""add meetups.location_geog (geography 생성 컬럼 + GiST) — nearby 인덱스 사용
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # location(geometry)에서 파생되는 STORED 생성 컬럼 → INSERT/UPDATE 시 DB가 자동 유지
+    op.execute(
+        "ALTER TABLE meetups ADD COLUMN IF NOT EXISTS location_geog geography(POINT, 4326) "
+        "GENERATED ALWAYS AS (location::geography) STORED;"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meetups_location_geog_gist "
+        "ON meetups USING GIST (location_geog);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_meetups_location_geog_gist;")
+    op.execute("ALTER TABLE meetups DROP COLUMN IF EXISTS location_geog;")
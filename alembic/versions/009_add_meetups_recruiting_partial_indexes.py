@@ -0,0 +1,38 @@
+"""add partial indexes for RECRUITING bbox queries (GiST + keyset btree)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 지도에 표시되는 모집 중 모임만 담는 부분 GiST → 종료/취소 모임이 쌓여도 bbox 스캔 크기 일정
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meetups_location_recruiting_gist "
+        "ON meetups USING GIST (location) WHERE status = 'RECRUITING';"
+    )
+    # keyset 페이지네이션 (created_at DESC, id DESC) 정렬용
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meetups_recruiting_created_at_id "
+        "ON meetups (created_at DESC, id DESC) WHERE status = 'RECRUITING';"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meetups_status_created_at_id "
+        "ON meetups (status, created_at DESC, id DESC);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_meetups_status_created_at_id;")
+    op.execute("DROP INDEX IF EXISTS idx_meetups_recruiting_created_at_id;")
+    op.execute("DROP INDEX IF EXISTS idx_meetups_location_recruiting_gist;")
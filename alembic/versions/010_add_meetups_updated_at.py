@@ -0,0 +1,48 @@
+"""add meetups.updated_at + touch trigger + index (bbox 증분 동기화용)
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "meetups",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute("UPDATE meetups SET updated_at = COALESCE(confirmed_at, created_at, now());")
+    # join/leave(current_count, midpoint), 상태 변경, POI 확정 모두 meetups 행 UPDATE → 트리거 하나로 갱신
+    # clock_timestamp(): 트랜잭션 시작 시각(now())이 아닌 실제 갱신 시각
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meetups_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_meetups_touch_updated_at "
+        "BEFORE UPDATE ON meetups FOR EACH ROW EXECUTE FUNCTION meetups_touch_updated_at();"
+    )
+    op.create_index("idx_meetups_updated_at", "meetups", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_meetups_updated_at", table_name="meetups")
+    op.execute("DROP TRIGGER IF EXISTS trg_meetups_touch_updated_at ON meetups;")
+    op.execute("DROP FUNCTION IF EXISTS meetups_touch_updated_at();")
+    op.drop_column("meetups", "updated_at")
@@ -0,0 +1,34 @@
+"""add meetups.geohash (ST_GeoHash 생성 컬럼 + btree INCLUDE(status, category)) — heatmap 집계용
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # location에서 파생되는 STORED 생성 컬럼 (INSERT/UPDATE 시 DB가 유지).
+    # COLLATE "C": 바이트 순 비교 → prefix 범위 조건(geohash >= 'wydm' AND geohash < 'wydn')이 셀 순서와 일치
+    op.execute(
+        'ALTER TABLE meetups ADD COLUMN IF NOT EXISTS geohash varchar(12) COLLATE "C" '
+        "GENERATED ALWAYS AS (ST_GeoHash(location, 12)) STORED;"
+    )
+    # status/category를 INCLUDE → heatmap 집계가 테이블 힙 접근 없이 index-only scan 가능
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meetups_geohash "
+        "ON meetups (geohash) INCLUDE (status, category);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_meetups_geohash;")
+    op.execute("ALTER TABLE meetups DROP COLUMN IF EXISTS geohash;")
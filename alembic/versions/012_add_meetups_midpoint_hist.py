@@ -0,0 +1,26 @@
+"""add meetups.midpoint_hist (JSONB) — midpoint 증분 중앙값 히스토그램
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 모임은 NULL → 다음 join/leave 때 참여자 전체로 한 번 재구축 후 증분 갱신
+    op.add_column("meetups", sa.Column("midpoint_hist", postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("meetups", "midpoint_hist")
@@ -0,0 +1,24 @@
+"""add meetups.midpoint_strategy — 모임별 midpoint 계산 전략 (NULL 이면 카테고리/전역 기본값)
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17 00:00:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("meetups", sa.Column("midpoint_strategy", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("meetups", "midpoint_strategy")
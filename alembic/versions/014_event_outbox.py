@@ -0,0 +1,30 @@
+"""add event_outbox — 실시간 이벤트 트랜잭셔널 아웃박스 (relay 가 id 순으로 발행 후 삭제)
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17 00:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("channel", sa.String(100), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_outbox")
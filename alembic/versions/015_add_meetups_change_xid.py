@@ -0,0 +1,57 @@
+"""add meetups.change_xid — 변경 트랜잭션 id (bbox 증분 동기화 커서, 시계·커밋 지연과 무관)
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 생성/변경한 트랜잭션 id (xid8 → bigint). 기존 행은 이 마이그레이션의 트랜잭션 id
+    op.add_column(
+        "meetups",
+        sa.Column(
+            "change_xid",
+            sa.BigInteger(),
+            server_default=sa.text("(pg_current_xact_id()::text::bigint)"),
+            nullable=False,
+        ),
+    )
+    # updated_at 트리거에서 함께 갱신
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meetups_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp();
+            NEW.change_xid := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.create_index("idx_meetups_change_xid", "meetups", ["change_xid"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_meetups_change_xid", table_name="meetups")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meetups_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.drop_column("meetups", "change_xid")
@@ -1,12 +1,82 @@
 # 모임 조회 CRUD (BBox 등)
 
-from typing import List
+import base64
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_, text, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.models.meetup import Meetup
 
+# keyset 커서: (created_at, id) — created_at 내림차순, 동률은 id 내림차순
+BboxCursor = Tuple[datetime, int]
+
+# 목록 응답(MeetupResponse)에 필요한 컬럼만 projection.
+# 좌표는 DB에서 ST_Y/ST_X로 꺼내 float로 받음 → ORM 엔티티·identity map·WKB 디코딩 없음
+MEETUP_LIST_COLUMNS = (
+    Meetup.id,
+    Meetup.status,
+    Meetup.category,
+    Meetup.title,
+    Meetup.description,
+    Meetup.capacity,
+    Meetup.current_count,
+    func.ST_Y(Meetup.location).label("lat"),
+    func.ST_X(Meetup.location).label("lng"),
+    func.ST_Y(Meetup.midpoint).label("midpoint_lat"),
+    func.ST_X(Meetup.midpoint).label("midpoint_lng"),
+    Meetup.created_at,
+    Meetup.confirmed_poi_name,
+    Meetup.confirmed_poi_lat,
+    Meetup.confirmed_poi_lng,
+    Meetup.confirmed_poi_address,
+    Meetup.confirmed_at,
+)
+
+
+def encode_bbox_cursor(created_at: datetime, meetup_id: int) -> str:
+    """(created_at, id) → 불투명 커서 문자열 (URL-safe base64)."""
+    raw = f"{created_at.isoformat()}|{meetup_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_bbox_cursor(cursor: str) -> BboxCursor:
+    """불투명 커서 → (created_at, id). 형식 오류 시 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_raw, id_raw = base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_raw), int(id_raw)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def current_sync_xmin(db: Session) -> int:
+    """
+    증분 동기화 기준: 현재 스냅샷의 xmin (아직 진행 중인 가장 오래된 트랜잭션 id).
+    이보다 작은 트랜잭션은 모두 끝났으므로, 조회 전에 구한 xmin 이상(change_xid >= xmin)만 다시 보면
+    늦게 커밋된 변경도 빠지지 않음 (앱 서버 시계·커밋 지연과 무관).
+    """
+    return int(db.execute(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")).scalar_one())
+
+
+def encode_sync_cursor(sync_xmin: int) -> str:
+    """증분 동기화 기준(스냅샷 xmin) → 불투명 커서 문자열."""
+    return base64.urlsafe_b64encode(f"x|{sync_xmin}".encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> int:
+    """불투명 동기화 커서 → 스냅샷 xmin. 형식 오류(이전 시각 기반 커서 포함) 시 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        tag, raw = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        if tag != "x":
+            raise ValueError(tag)
+        return int(raw)
+    except Exception as e:
+        raise ValueError("invalid sync cursor") from e
+
 
 def get_meetups_in_bbox(
     db: Session,
@@ -14,18 +84,241 @@ def get_meetups_in_bbox(
     min_lng: float,
     max_lat: float,
     max_lng: float,
-) -> List[Meetup]:
+    statuses: Optional[Sequence[str]] = None,
+    categories: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[BboxCursor] = None,
+) -> List[Row]:
     """
     사각형 영역(min_lat, min_lng, max_lat, max_lng) 내의 모임 조회.
-    min/max가 뒤바뀌어 와도 sorted()로 보정. created_at 내림차순.
+    min/max가 뒤바뀌어 와도 sorted()로 보정. (created_at, id) 내림차순.
+    반환: MEETUP_LIST_COLUMNS projection 행 (ORM 엔티티 아님).
+
+    - statuses/categories: 지정 시 해당 값만 (status=RECRUITING 단일 필터는 부분 GiST 인덱스 사용)
+    - cursor: 이전 페이지 마지막 행의 (created_at, id). 그보다 "이전" 행만 반환 (keyset)
+    - limit: 최대 반환 수 (호출자가 상한 지정)
     """
     lat_lo, lat_hi = sorted([min_lat, max_lat])
     lng_lo, lng_hi = sorted([min_lng, max_lng])
     # PostGIS: ST_MakeEnvelope(xmin, ymin, xmax, ymax, srid) → lng, lat 순
     envelope = func.ST_MakeEnvelope(lng_lo, lat_lo, lng_hi, lat_hi, 4326)
+    q = db.query(*MEETUP_LIST_COLUMNS).filter(func.ST_Intersects(Meetup.location, envelope))
+    if statuses:
+        # 단일 값은 = 로 비교해야 플래너가 부분 인덱스 조건(status = 'RECRUITING')과 매칭
+        q = q.filter(Meetup.status == statuses[0]) if len(statuses) == 1 else q.filter(Meetup.status.in_(statuses))
+    if categories:
+        q = q.filter(Meetup.category.in_(categories))
+    if cursor is not None:
+        q = q.filter(tuple_(Meetup.created_at, Meetup.id) < tuple_(cursor[0], cursor[1]))
+    q = q.order_by(Meetup.created_at.desc(), Meetup.id.desc())
+    if limit is not None:
+        q = q.limit(limit)
+    return q.all()
+
+
+def get_meetup_clusters_in_bbox(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    grid_deg: float,
+) -> List[Row]:
+    """
+    BBox 내 모임을 grid_deg 격자(ST_SnapToGrid)로 묶어 셀별 집계.
+    반환 행: count, lat, lng(셀 내 평균 좌표), meetup_id(셀 내 최소 id, count=1일 때 단건 식별용)
+    결과 행 수는 (bbox 면적 / 격자 면적)으로 상한 → 모임 수와 무관하게 일정.
+    """
+    lat_lo, lat_hi = sorted([min_lat, max_lat])
+    lng_lo, lng_hi = sorted([min_lng, max_lng])
+    envelope = func.ST_MakeEnvelope(lng_lo, lat_lo, lng_hi, lat_hi, 4326)
+    cell = func.ST_SnapToGrid(Meetup.location, grid_deg)
+    q = (
+        db.query(
+            func.count(Meetup.id).label("count"),
+            func.avg(func.ST_Y(Meetup.location)).label("lat"),
+            func.avg(func.ST_X(Meetup.location)).label("lng"),
+            func.min(Meetup.id).label("meetup_id"),
+        )
+        .filter(func.ST_Intersects(Meetup.location, envelope))
+        .group_by(cell)
+    )
+    return q.all()
+
+
+def get_meetup_points_in_bbox(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    limit: int,
+) -> List[Row]:
+    """
+    클러스터 확장 줌 이상에서 사용하는 경량 단건 조회 (id, lat, lng, status, category).
+    전체 MeetupResponse 대신 마커 표시에 필요한 컬럼만 반환, limit으로 상한.
+    """
+    lat_lo, lat_hi = sorted([min_lat, max_lat])
+    lng_lo, lng_hi = sorted([min_lng, max_lng])
+    envelope = func.ST_MakeEnvelope(lng_lo, lat_lo, lng_hi, lat_hi, 4326)
     q = (
-        db.query(Meetup)
+        db.query(
+            Meetup.id.label("meetup_id"),
+            func.ST_Y(Meetup.location).label("lat"),
+            func.ST_X(Meetup.location).label("lng"),
+            Meetup.status,
+            Meetup.category,
+        )
         .filter(func.ST_Intersects(Meetup.location, envelope))
         .order_by(Meetup.created_at.desc())
+        .limit(limit)
     )
     return q.all()
+
+
+def get_meetup_lat_lng(db: Session, meetup_id: int) -> Optional[Tuple[float, float]]:
+    """모임 위치 (lat, lng)만 조회. 없으면 None. (캐시 무효화 등 내부용, WKB 디코딩 없음)"""
+    row = (
+        db.query(func.ST_Y(Meetup.location), func.ST_X(Meetup.location))
+        .filter(Meetup.id == meetup_id)
+        .first()
+    )
+    if row is None:
+        return None
+    return (float(row[0]), float(row[1]))
+
+
+# MVT 타일: 타일 경계(EPSG:3857)를 4326으로 변환해 location GiST 인덱스로 필터 후 ST_AsMVTGeom
+_TILE_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(:z, :x, :y) AS geom
+    ),
+    mvtgeom AS (
+        SELECT
+            ST_AsMVTGeom(ST_Transform(m.location, 3857), bounds.geom, :extent, :buffer, true) AS geom,
+            m.id,
+            m.status,
+            m.category
+        FROM meetups m, bounds
+        WHERE ST_Intersects(m.location, ST_Transform(ST_Expand(bounds.geom, :margin), 4326))
+    )
+    SELECT ST_AsMVT(mvtgeom.*, :layer, :extent, 'geom') FROM mvtgeom
+    """
+)
+
+
+def get_meetup_tile(
+    db: Session,
+    z: int,
+    x: int,
+    y: int,
+    layer: str = "meetups",
+    extent: int = 4096,
+    buffer: int = 64,
+) -> bytes:
+    """
+    (z, x, y) 타일의 Mapbox Vector Tile 바이너리 생성 (속성: id, status, category).
+    buffer 픽셀만큼 이웃 타일 영역의 점도 포함 → 타일 경계 마커 잘림 방지.
+    """
+    # buffer 픽셀 → EPSG:3857 미터 (세계 폭 / 2^z / extent * buffer)
+    margin = 40075016.68557849 / (2 ** z) / extent * buffer
+    result = db.execute(
+        _TILE_SQL,
+        {"z": z, "x": x, "y": y, "layer": layer, "extent": extent, "buffer": buffer, "margin": margin},
+    ).scalar()
+    return bytes(result) if result is not None else b""
+
+
+def get_recruiting_meetup_rows(db: Session) -> List[Row]:
+    """
+    RECRUITING 모임 전체를 MEETUP_LIST_COLUMNS projection 행으로 조회.
+    (인메모리 인덱스 워밍·정합성 검사용)
+    """
+    return db.query(*MEETUP_LIST_COLUMNS).filter(Meetup.status == "RECRUITING").all()
+
+
+def get_meetups_in_radius(
+    db: Session,
+    lat: float,
+    lng: float,
+    radius_m: float,
+    limit: int,
+) -> List[Row]:
+    """
+    (lat, lng) 반경 radius_m 내 모임, 가까운 순. MEETUP_LIST_COLUMNS + distance_m(미터) 행 반환.
+    저장된 geography 생성 컬럼 사용 → idx_meetups_location_geog_gist 인덱스 스캔 (행마다 텍스트 변환 없음).
+    """
+    user_geog = func.ST_GeogFromText(f"SRID=4326;POINT({lng} {lat})")
+    distance_m = func.ST_Distance(Meetup.location_geog, user_geog)  # geography → 미터
+    q = (
+        db.query(*MEETUP_LIST_COLUMNS, distance_m.label("distance_m"))
+        .filter(func.ST_DWithin(Meetup.location_geog, user_geog, radius_m))
+        .order_by(distance_m)
+        .limit(limit)
+    )
+    return q.all()
+
+
+def get_meetups_changed_in_bbox(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    since_xid: int,
+    limit: int,
+) -> List[Row]:
+    """
+    since_xid(이전 조회의 스냅샷 xmin) 이후 트랜잭션이 생성/변경한(change_xid >= since_xid) bbox 내 모임.
+    필터 미적용 (제거 판정은 호출자). change_xid 오름차순, limit 개. 반환: MEETUP_LIST_COLUMNS projection 행.
+    """
+    lat_lo, lat_hi = sorted([min_lat, max_lat])
+    lng_lo, lng_hi = sorted([min_lng, max_lng])
+    envelope = func.ST_MakeEnvelope(lng_lo, lat_lo, lng_hi, lat_hi, 4326)
+    q = (
+        db.query(*MEETUP_LIST_COLUMNS)
+        .filter(Meetup.change_xid >= since_xid, func.ST_Intersects(Meetup.location, envelope))
+        .order_by(Meetup.change_xid.asc())
+        .limit(limit)
+    )
+    return q.all()
+
+
+def get_meetup_geohash_counts(
+    db: Session,
+    ranges: Sequence[Tuple[str, Optional[str]]],
+    precision: int,
+) -> List[Row]:
+    """
+    geohash 범위 목록(geohash.cover_ranges) 내 모임을 (앞 precision 자리, status, category)별로 집계.
+    반환 행: cell, status, category, count. geometry 컬럼은 읽지 않음
+    → idx_meetups_geohash(INCLUDE status, category) 범위 스캔만으로 집계.
+    """
+    conds = [
+        and_(Meetup.geohash >= lo, Meetup.geohash < hi) if hi is not None else Meetup.geohash >= lo
+        for lo, hi in ranges
+    ]
+    cell = func.left(Meetup.geohash, precision)
+    q = (
+        db.query(
+            cell.label("cell"),
+            Meetup.status,
+            Meetup.category,
+            func.count().label("count"),
+        )
+        .filter(or_(*conds))
+        .group_by(cell, Meetup.status, Meetup.category)
+    )
+    return q.all()
+
+
+def get_meetup_seat_rows(db: Session, meetup_ids: Sequence[int]) -> List[Row]:
+    """좌석 예약(seat_admission) 시드·정합성 검사용: id, status, capacity, current_count."""
+    if not meetup_ids:
+        return []
+    return (
+        db.query(Meetup.id, Meetup.status, Meetup.capacity, Meetup.current_count)
+        .filter(Meetup.id.in_(meetup_ids))
+        .all()
+    )
@@ -1,21 +1,60 @@
-# 참여/취소 CRUD (비관적 락으로 정원 초과 방지)
-import statistics
+# 참여/취소 CRUD (조건부 UPDATE ... RETURNING 으로 정원 초과 방지, SELECT FOR UPDATE 없음)
+# async 핸들러는 AsyncSession.run_sync 로 호출 (asyncpg, 이벤트 루프 비차단), 동기 Session 에서도 그대로 사용
+import os
 import math
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from geoalchemy2 import WKTElement
 from shapely.geometry import Point
+from sqlalchemy import delete, func, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.meetup import Meetup, MeetupStatus
 from app.models.participation import Participation
 from app.models.user import User
+from app.services.median_histogram import apply_midpoint_deltas, build_midpoint_hist
+from app.services.midpoint_strategy import compute_midpoint, resolve_strategy
 
 # 200m 그리드 익명화: 정확한 위치 저장 방지(프라이버시), approx에 저장해 중간지점/POI 계산은 그대로 활용
 GRID_METERS = 200
 GRID_DEG = 0.0018  # 위도·경도 약 200m (위도 기준 근사)
 
+# join/leave 시 midpoint 갱신 방식
+# - histogram (기본): meetups.midpoint_hist 증분 갱신 (참여자 재조회 없음)
+# - sql: UPDATE ... percentile_cont ... RETURNING 한 문장으로 DB에서 계산·저장 (히스토그램 미사용)
+MIDPOINT_MODE = os.getenv("MIDPOINT_MODE", "histogram").lower()
+# > 0 이면 join/leave 는 midpoint 를 계산하지 않고, 모임별로 이 간격(ms)마다 한 번 재계산·발행
+# (app.services.midpoint_coalescer)
+MIDPOINT_COALESCE_MS = int(os.getenv("MIDPOINT_COALESCE_MS", "0"))
+
+# 참여자 좌표 중앙값을 DB에서 계산해 바로 저장하고 결과 좌표 반환 (왕복 1회).
+# percentile_cont(0.5) = 짝수 개일 때 가운데 두 값의 평균 (statistics.median 과 동일). 참여자 없으면 NULL.
+# midpoint_hist 는 NULL 로 비워 histogram 모드로 돌아가면 재구축되게 함
+_MIDPOINT_SQL = text(
+    """
+    UPDATE meetups AS m
+    SET midpoint = sub.pt, midpoint_hist = NULL
+    FROM (
+        SELECT ST_SetSRID(
+            ST_MakePoint(
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY p.approx_lng),
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY p.approx_lat)
+            ),
+            4326
+        ) AS pt
+        FROM participations p
+        WHERE p.meetup_id = :meetup_id
+          AND p.approx_lat IS NOT NULL
+          AND p.approx_lng IS NOT NULL
+    ) AS sub
+    WHERE m.id = :meetup_id
+    RETURNING ST_Y(m.midpoint) AS lat, ST_X(m.midpoint) AS lng
+    """
+)
+
 
 def _snap_to_grid(lat: float, lng: float) -> Tuple[float, float]:
     """
@@ -47,13 +86,16 @@ class LeaveError(Exception):
 
 def recalculate_midpoint(db: Session, meetup_id: int) -> Optional[Tuple[float, float]]:
     """
-    참여자들의 approx_lat/lng 중앙값으로 중간지점 계산.
+    참여자들의 approx_lat/lng 로 중간지점 계산 (모임의 midpoint 전략: median / geometric_median / minimax).
 
-    - median 사용 이유: mean 대비 outlier에 강건 → 더 공평한 중간 위치.
+    - median(기본) 사용 이유: mean 대비 outlier에 강건 → 더 공평한 중간 위치.
     - NULL 안전: approx_lat/lng 둘 다 NOT NULL 인 행만 사용.
     - 트랜잭션 소유권: 이 함수는 commit/rollback을 호출하지 않음 (호출자가 처리).
+    - 참여자 전체를 다시 읽는 전체 재계산. median 이면 midpoint_hist(증분용 히스토그램)도 함께 재구축.
     반환: (lat, lng) 또는 None
     """
+    # 같은 트랜잭션에서 add/delete 한 참여 행이 조회에 반영되도록 (세션 autoflush=False)
+    db.flush()
     meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
     if not meetup:
         return None
@@ -68,127 +110,444 @@ def recalculate_midpoint(db: Session, meetup_id: int) -> Optional[Tuple[float, f
         .all()
     )
 
+    strategy = resolve_strategy(meetup.midpoint_strategy, meetup.category)
+    # 히스토그램은 median 에만 쓰임. 다른 전략이면 비워 두고, median 으로 바뀌면 그때 재구축
+    meetup.midpoint_hist = build_midpoint_hist(coords) if strategy == "median" else None
     if not coords:
         meetup.midpoint = None
         return None
 
-    lats = [lat for lat, _ in coords]
-    lngs = [lng for _, lng in coords]
-    median_lat = statistics.median(lats)
-    median_lng = statistics.median(lngs)
+    mid_lat, mid_lng = compute_midpoint(strategy, [(lat, lng) for lat, lng in coords])  # type: ignore[misc]
 
     # ✅ PostGIS POINT 저장 (주의: Point(lng, lat) 순서)
-    pt = Point(median_lng, median_lat)
+    pt = Point(mid_lng, mid_lat)
     meetup.midpoint = WKTElement(pt.wkt, srid=4326)
 
-    return (median_lat, median_lng)
+    return (mid_lat, mid_lng)
 
 
-def join_meetup(db: Session, meetup_id: int, user_id: int, lat: float, lng: float) -> int:
+# 일괄 재계산 (app.jobs.rebuild_midpoints): 한 배치의 모임들 median 을 GROUP BY 한 번으로 계산·저장.
+# 참여자가 없는 모임도 unnest 로 남겨 midpoint NULL 로 정리
+_BULK_MEDIAN_SQL = text(
     """
-    모임 참여.
+    UPDATE meetups AS m
+    SET midpoint = sub.pt, midpoint_hist = NULL
+    FROM (
+        SELECT
+            ids.id AS meetup_id,
+            ST_SetSRID(
+                ST_MakePoint(
+                    percentile_cont(0.5) WITHIN GROUP (ORDER BY p.approx_lng),
+                    percentile_cont(0.5) WITHIN GROUP (ORDER BY p.approx_lat)
+                ),
+                4326
+            ) AS pt
+        FROM unnest(CAST(:ids AS integer[])) AS ids(id)
+        LEFT JOIN participations p
+            ON p.meetup_id = ids.id
+           AND p.approx_lat IS NOT NULL
+           AND p.approx_lng IS NOT NULL
+        GROUP BY ids.id
+    ) AS sub
+    WHERE m.id = sub.meetup_id
+    RETURNING m.id, ST_Y(m.midpoint) AS lat, ST_X(m.midpoint) AS lng, m.current_count
+    """
+)
 
-    - FOR UPDATE로 meetup 행 잠금 → 동시 join 시에도 정원 초과 방지.
-    - 참여 시 좌표를 200m 그리드로 스냅 후 approx_lat/approx_lng에 저장 (프라이버시 보호, 중간지점/POI는 approx 기준 유지).
+# 일괄 재계산 (median 이외 전략): Python 에서 계산한 좌표 배열을 한 문장으로 저장
+_BULK_SET_MIDPOINT_SQL = text(
+    """
+    UPDATE meetups AS m
+    SET midpoint = CASE WHEN v.lat IS NULL THEN NULL ELSE ST_SetSRID(ST_MakePoint(v.lng, v.lat), 4326) END,
+        midpoint_hist = NULL
+    FROM unnest(
+        CAST(:ids AS integer[]),
+        CAST(:lats AS double precision[]),
+        CAST(:lngs AS double precision[])
+    ) AS v(id, lat, lng)
+    WHERE m.id = v.id
+    RETURNING m.id, v.lat, v.lng, m.current_count
+    """
+)
 
-    반환: 갱신된 current_count
 
-    ⚠️ 이 함수는 commit/rollback 하지 않음. 호출자(라우터)가 트랜잭션을 제어.
+def bulk_rebuild_median_midpoints(db: Session, meetup_ids: Sequence[int]) -> List[Row]:
+    """
+    meetup_ids 의 median midpoint 를 UPDATE ... FROM (GROUP BY meetup_id) 한 문장으로 재계산.
+    midpoint_hist 는 NULL (다음 join/leave 때 재구축). 반환 행: id, lat, lng, current_count. commit 하지 않음.
     """
-    if db.query(User).filter(User.id == user_id).first() is None:
-        raise JoinError("User not found", 404)
+    if not meetup_ids:
+        return []
+    return db.execute(_BULK_MEDIAN_SQL, {"ids": list(meetup_ids)}).all()
 
-    meetup = (
-        db.query(Meetup)
-        .filter(Meetup.id == meetup_id)
-        .with_for_update()
-        .first()
+
+def bulk_rebuild_strategy_midpoints(db: Session, meetups: Sequence[Tuple[int, str]]) -> List[Row]:
+    """
+    (meetup_id, 전략) 목록의 midpoint 를 재계산 (geometric_median / minimax 등 SQL 로 못 하는 전략).
+    참여 좌표 조회 1회 + 저장 1회. 반환 행: id, lat, lng, current_count. commit 하지 않음.
+    """
+    if not meetups:
+        return []
+    ids = [meetup_id for meetup_id, _ in meetups]
+    coords: Dict[int, List[Tuple[float, float]]] = {meetup_id: [] for meetup_id in ids}
+    rows = (
+        db.query(Participation.meetup_id, Participation.approx_lat, Participation.approx_lng)
+        .filter(
+            Participation.meetup_id.in_(ids),
+            Participation.approx_lat.isnot(None),
+            Participation.approx_lng.isnot(None),
+        )
+        .all()
+    )
+    for meetup_id, lat, lng in rows:
+        coords[meetup_id].append((lat, lng))
+    lats: List[Optional[float]] = []
+    lngs: List[Optional[float]] = []
+    for meetup_id, strategy in meetups:
+        midpoint = compute_midpoint(strategy, coords[meetup_id])
+        lats.append(midpoint[0] if midpoint else None)
+        lngs.append(midpoint[1] if midpoint else None)
+    return db.execute(_BULK_SET_MIDPOINT_SQL, {"ids": ids, "lats": lats, "lngs": lngs}).all()
+
+
+def recalculate_midpoint_sql(db: Session, meetup_id: int) -> Optional[Tuple[float, float]]:
+    """
+    MIDPOINT_MODE=sql: 중앙값 계산과 저장을 UPDATE ... RETURNING 한 문장으로 (Python 재조회·재기록 없음).
+    세션의 Meetup 객체 midpoint 는 갱신되지 않으므로 반환값을 사용할 것. commit/rollback 하지 않음.
+    """
+    db.flush()  # 대기 중인 참여 행 INSERT/DELETE 를 먼저 반영
+    row = db.execute(_MIDPOINT_SQL, {"meetup_id": meetup_id}).first()
+    if row is None or row.lat is None:
+        return None
+    return (float(row.lat), float(row.lng))
+
+
+# join/leave 대상 모임 상태 (UPDATE ... RETURNING 결과): midpoint 갱신에 필요한 컬럼만
+_MEETUP_STATE_COLUMNS = (
+    Meetup.id,
+    Meetup.current_count,
+    Meetup.midpoint_strategy,
+    Meetup.category,
+    Meetup.midpoint_hist,
+)
+
+
+def _write_midpoint(
+    db: Session,
+    meetup_id: int,
+    midpoint: Optional[Tuple[float, float]],
+    hist: Optional[Dict[str, Any]],
+) -> None:
+    """midpoint + midpoint_hist 저장 (UPDATE 한 문장, ORM 객체 적재 없음)."""
+    db.execute(
+        update(Meetup)
+        .where(Meetup.id == meetup_id)
+        .values(
+            midpoint=WKTElement(Point(midpoint[1], midpoint[0]).wkt, srid=4326) if midpoint is not None else None,
+            midpoint_hist=hist,
+        )
+        .execution_options(synchronize_session=False)
     )
-    if meetup is None:
-        raise JoinError("Meetup not found", 404)
 
-    status_val = meetup.status if isinstance(meetup.status, str) else getattr(meetup.status, "value", meetup.status)
-    if status_val == MeetupStatus.CONFIRMED.value:
-        raise JoinError("Meetup already confirmed; joining/leaving is not allowed", 409)
 
-    if meetup.current_count >= meetup.capacity:
-        raise JoinError("Meetup is full (capacity reached)", 400)
+def update_midpoint_incremental(
+    db: Session,
+    state: Row,
+    coords: Sequence[Tuple[float, float]],
+    add: bool,
+) -> Optional[Tuple[float, float]]:
+    """
+    참여 좌표 추가/제거를 midpoint_hist 에 반영해 중앙값 갱신 (참여자 재조회 없음).
+    히스토그램이 없거나(기존 모임) DB와 어긋나면 recalculate_midpoint 로 재구축.
+    state 는 같은 트랜잭션에서 UPDATE ... RETURNING 으로 잠근 모임 행. commit/rollback 하지 않음.
+    """
+    result = apply_midpoint_deltas(state.midpoint_hist, coords, add) if state.midpoint_hist else None
+    if result is None:
+        return recalculate_midpoint(db, state.id)
 
-    existing = (
-        db.query(Participation)
-        .filter(
-            Participation.meetup_id == meetup_id,
-            Participation.user_id == user_id,
+    hist, midpoint = result
+    _write_midpoint(db, state.id, midpoint, hist)
+    return midpoint
+
+
+def _refresh_midpoint(
+    db: Session,
+    state: Row,
+    coords: Sequence[Tuple[float, float]],
+    add: bool,
+) -> Optional[Tuple[float, float]]:
+    """
+    join/leave 후 midpoint 갱신. 반환: (lat, lng) 또는 None.
+    median 이 아닌 전략은 참여자 전체가 필요하므로 항상 전체 재계산, median 은 MIDPOINT_MODE 에 따름.
+    MIDPOINT_COALESCE_MS > 0 이면 발행만 미룸: median 히스토그램은 여기서 증분 갱신해 DB midpoint 를 최신으로 유지,
+    참여자 전체가 필요한 계산(다른 전략 / MIDPOINT_MODE=sql)은 coalescer 재계산으로 미루고 None.
+    """
+    strategy = resolve_strategy(state.midpoint_strategy, state.category)
+    if strategy == "median" and MIDPOINT_MODE != "sql":
+        return update_midpoint_incremental(db, state, coords, add)
+    if MIDPOINT_COALESCE_MS > 0:
+        return None
+    if strategy != "median":
+        return recalculate_midpoint(db, state.id)
+    return recalculate_midpoint_sql(db, state.id)
+
+
+def recompute_midpoint_locked(db: Session, meetup_id: int) -> Optional[Tuple[int, Optional[Tuple[float, float]]]]:
+    """
+    모임 행을 FOR UPDATE 로 잠그고 현재 midpoint 확정 (midpoint coalescer 용).
+    median 히스토그램 모드는 join/leave 가 이미 midpoint·히스토그램을 갱신했으므로 저장된 값 사용
+    (히스토그램이 없으면 재구축), 그 외는 참여자 전체 재계산.
+    반환: (current_count, midpoint) — 모임이 없으면 None. commit/rollback 하지 않음.
+    """
+    row = (
+        db.query(
+            Meetup.current_count,
+            Meetup.midpoint_strategy,
+            Meetup.category,
+            Meetup.midpoint_hist.isnot(None).label("has_hist"),
+            func.ST_Y(Meetup.midpoint).label("lat"),
+            func.ST_X(Meetup.midpoint).label("lng"),
         )
+        .filter(Meetup.id == meetup_id)
+        .with_for_update()
         .first()
     )
-    if existing is not None:
-        raise JoinError("Already joined this meetup", 400)
+    if row is None:
+        return None
+    strategy = resolve_strategy(row.midpoint_strategy, row.category)
+    if strategy == "median" and MIDPOINT_MODE == "sql":
+        return row.current_count, recalculate_midpoint_sql(db, meetup_id)
+    if strategy == "median" and row.has_hist:
+        return row.current_count, (float(row.lat), float(row.lng)) if row.lat is not None else None
+    return row.current_count, recalculate_midpoint(db, meetup_id)
+
+
+def _diagnose_join_failure(db: Session, meetup_id: int) -> JoinError:
+    """조건부 UPDATE 가 0행일 때만 원인 조회 (성공 경로에는 추가 왕복 없음)."""
+    row = db.query(Meetup.status, Meetup.current_count, Meetup.capacity).filter(Meetup.id == meetup_id).first()
+    if row is None:
+        return JoinError("Meetup not found", 404)
+    if row.status == MeetupStatus.CONFIRMED.value:
+        return JoinError("Meetup already confirmed; joining/leaving is not allowed", 409)
+    if row.status != MeetupStatus.RECRUITING.value:
+        return JoinError("Meetup is not recruiting", 409)
+    return JoinError("Meetup is full (capacity reached)", 400)
+
+
+def _violated_constraint(e: IntegrityError) -> str:
+    """
+    IntegrityError 가 가리키는 제약 이름 (드라이버 무관). 알 수 없으면 "".
+    psycopg2: e.orig.diag.constraint_name / asyncpg(AsyncSession): e.orig.__cause__.constraint_name
+    """
+    diag = getattr(e.orig, "diag", None)
+    name = getattr(diag, "constraint_name", None) if diag is not None else None
+    if not name:
+        name = getattr(getattr(e.orig, "__cause__", None), "constraint_name", None)
+    return name or ""
+
+
+def join_meetup(
+    db: Session,
+    meetup_id: int,
+    user_id: int,
+    lat: float,
+    lng: float,
+) -> Tuple[int, Optional[Tuple[float, float]]]:
+    """
+    모임 참여. SELECT ... FOR UPDATE 없이 두 문장으로 처리:
+
+    1. INSERT participations ... ON CONFLICT (uq_participation_user_meetup) DO NOTHING RETURNING id
+       → 0행이면 이미 참여 중. 사용자/모임이 없으면 FK 위반으로 판별.
+    2. UPDATE meetups SET current_count = current_count + 1
+       WHERE id = ? AND current_count < capacity AND status = 'RECRUITING' RETURNING ...
+       → 정원·상태 검사와 증가가 원자적. 0행일 때만 원인 조회.
+
+    - 행 잠금은 2번 UPDATE 부터 commit 까지만 유지 (이전: SELECT FOR UPDATE 부터 여러 왕복 동안).
+    - 참여 시 좌표를 200m 그리드로 스냅 후 approx_lat/approx_lng에 저장 (프라이버시 보호, 중간지점/POI는 approx 기준 유지).
+    - midpoint 는 전략/MIDPOINT_MODE 에 따라 히스토그램 증분, SQL 한 문장 또는 전체 재계산.
+
+    반환: (갱신된 current_count, 갱신된 midpoint (lat, lng) 또는 None) — 라우터는 commit 후 재조회 없이 발행
+    (MIDPOINT_COALESCE_MS > 0 이면 발행은 coalescer 가 담당, median 히스토그램 이외 전략은 midpoint 계산을 미뤄 None)
 
+    ⚠️ 이 함수는 commit/rollback 하지 않음. 실패 시 호출자(라우터)가 rollback → 1번 INSERT 도 취소됨.
+    """
     # 200m 그리드로 스냅 후 저장 → 정확한 위치 노출 방지, midpoint/POI는 approx 기준으로 동작
     grid_lat, grid_lng = _snap_to_grid(lat, lng)
 
+    insert_stmt = (
+        pg_insert(Participation)
+        .values(meetup_id=meetup_id, user_id=user_id, approx_lat=grid_lat, approx_lng=grid_lng)
+        .on_conflict_do_nothing(constraint="uq_participation_user_meetup")
+        .returning(Participation.id)
+    )
     try:
-        db.add(
-            Participation(
-                meetup_id=meetup_id,
-                user_id=user_id,
-                approx_lat=grid_lat,
-                approx_lng=grid_lng,
-            )
+        inserted = db.execute(insert_stmt).first()
+    except IntegrityError as e:
+        # FK 위반: 어느 FK 인지로 사용자/모임 부재 구분 (트랜잭션은 중단 상태 → 추가 조회 불가)
+        if _violated_constraint(e).endswith("user_id_fkey"):
+            raise JoinError("User not found", 404)
+        raise JoinError("Meetup not found", 404)
+    if inserted is None:
+        raise JoinError("Already joined this meetup", 400)
+
+    state = db.execute(
+        update(Meetup)
+        .where(
+            Meetup.id == meetup_id,
+            Meetup.current_count < Meetup.capacity,
+            Meetup.status == MeetupStatus.RECRUITING.value,
         )
-        meetup.current_count += 1
+        .values(current_count=Meetup.current_count + 1)
+        .returning(*_MEETUP_STATE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if state is None:
+        raise _diagnose_join_failure(db, meetup_id)
 
-        # ✅ 같은 트랜잭션 안에서 midpoint 재계산 (commit은 호출자가)
-        recalculate_midpoint(db, meetup_id)
+    # ✅ 같은 트랜잭션 안에서 midpoint 갱신 (commit은 호출자가)
+    midpoint = _refresh_midpoint(db, state, [(grid_lat, grid_lng)], add=True)
+    return state.current_count, midpoint
 
-        return meetup.current_count
 
-    except IntegrityError:
-        # 동시에 같은 user가 join하면 UniqueConstraint 위반 가능
-        # rollback은 호출자(라우터)에서 수행
-        raise JoinError("Already joined", 400)
+def leave_meetup(db: Session, meetup_id: int, user_id: int) -> Tuple[int, Optional[Tuple[float, float]]]:
+    """
+    모임 참여 취소. SELECT ... FOR UPDATE 없이 두 문장으로 처리:
+
+    1. DELETE FROM participations WHERE meetup_id = ? AND user_id = ? RETURNING approx_lat, approx_lng
+    2. UPDATE meetups SET current_count = current_count - 1 WHERE id = ? AND status <> 'CONFIRMED' RETURNING ...
+    어느 쪽이든 0행이면 그때만 원인 조회 (모임 없음 404 / 확정됨 409 / 미참여 400).
+    취소 후 midpoint 갱신 (전략/MIDPOINT_MODE 에 따름).
 
+    반환: (갱신된 current_count, 갱신된 midpoint (lat, lng) 또는 None)
 
-def leave_meetup(db: Session, meetup_id: int, user_id: int) -> int:
+    ⚠️ 이 함수는 commit/rollback 하지 않음. 실패 시 호출자(라우터)가 rollback → 1번 DELETE 도 취소됨.
     """
-    모임 참여 취소.
+    deleted = db.execute(
+        delete(Participation)
+        .where(Participation.meetup_id == meetup_id, Participation.user_id == user_id)
+        .returning(Participation.approx_lat, Participation.approx_lng)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if deleted is None:
+        if db.query(Meetup.id).filter(Meetup.id == meetup_id).first() is None:
+            raise LeaveError("Meetup not found", 404)
+        raise LeaveError("Not joined", 400)
+
+    state = db.execute(
+        update(Meetup)
+        .where(Meetup.id == meetup_id, Meetup.status != MeetupStatus.CONFIRMED.value)
+        .values(current_count=Meetup.current_count - 1)
+        .returning(*_MEETUP_STATE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if state is None:
+        # 참여 행이 있었으므로 모임은 존재 → 확정된 모임
+        raise LeaveError("Meetup already confirmed; joining/leaving is not allowed", 409)
 
-    - FOR UPDATE로 meetup 행 잠금
-    - participation 삭제 후 current_count 감소
-    - 취소 후 midpoint 재계산
+    lat, lng = deleted.approx_lat, deleted.approx_lng
+    if lat is not None and lng is not None:
+        midpoint = _refresh_midpoint(db, state, [(lat, lng)], add=False)
+    else:
+        # 좌표 없는 (레거시) 참여 행: midpoint 변화 없음, 현재 값만 다시 계산해 반환
+        midpoint = recalculate_midpoint(db, meetup_id)
 
-    반환: 갱신된 current_count
+    return state.current_count, midpoint
 
-    ⚠️ 이 함수는 commit/rollback 하지 않음. 호출자(라우터)가 트랜잭션을 제어.
+
+def join_meetup_bulk(
+    db: Session,
+    meetup_id: int,
+    members: Sequence[Tuple[int, float, float]],
+) -> Tuple[int, Optional[Tuple[float, float]], List[Tuple[int, str]]]:
+    """
+    여러 명 한 번에 참여 (호스트가 일행 초대). members: (user_id, lat, lng) 목록, 요청 순서대로 좌석 배정.
+
+    1. 모임 행 FOR UPDATE 1회 — 남은 좌석을 일행에게 나눠 주려면 배치 동안 current_count 고정 필요
+    2. 사용자 존재 확인 1회, 기존 참여 확인 1회
+    3. 참여 행 multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING user_id 1회
+    4. current_count += 추가 인원 UPDATE ... RETURNING 1회, midpoint 갱신 1회
+
+    모임 자체의 오류(없음 404 / 확정·모집 종료 409)는 JoinError, 사용자별 실패는 결과로 보고:
+    joined / duplicate_in_request / user_not_found / already_joined / capacity_exceeded.
+
+    반환: (current_count, midpoint, [(user_id, 결과)] 요청 순서) — 추가된 인원이 없으면 midpoint 는 None.
+    ⚠️ commit/rollback 하지 않음.
     """
     meetup = (
-        db.query(Meetup)
+        db.query(Meetup.status, Meetup.capacity, Meetup.current_count)
         .filter(Meetup.id == meetup_id)
         .with_for_update()
         .first()
     )
     if meetup is None:
-        raise LeaveError("Meetup not found", 404)
-
-    status_val = meetup.status if isinstance(meetup.status, str) else getattr(meetup.status, "value", meetup.status)
-    if status_val == MeetupStatus.CONFIRMED.value:
-        raise LeaveError("Meetup already confirmed; joining/leaving is not allowed", 409)
-
-    participation = (
-        db.query(Participation)
-        .filter(
-            Participation.meetup_id == meetup_id,
-            Participation.user_id == user_id,
-        )
-        .first()
-    )
-    if participation is None:
-        raise LeaveError("Not joined", 400)
-
-    db.delete(participation)
-    meetup.current_count -= 1
-
-    recalculate_midpoint(db, meetup_id)
+        raise JoinError("Meetup not found", 404)
+    if meetup.status == MeetupStatus.CONFIRMED.value:
+        raise JoinError("Meetup already confirmed; joining/leaving is not allowed", 409)
+    if meetup.status != MeetupStatus.RECRUITING.value:
+        raise JoinError("Meetup is not recruiting", 409)
+
+    # 같은 요청 안 중복은 첫 항목만 처리
+    first: Dict[int, Tuple[float, float]] = {}
+    for user_id, lat, lng in members:
+        first.setdefault(user_id, (lat, lng))
+    user_ids = list(first)
+    known = {uid for (uid,) in db.query(User.id).filter(User.id.in_(user_ids)).all()}
+    joined = {
+        uid
+        for (uid,) in db.query(Participation.user_id)
+        .filter(Participation.meetup_id == meetup_id, Participation.user_id.in_(user_ids))
+        .all()
+    }
+
+    seats = max(meetup.capacity - meetup.current_count, 0)
+    status: Dict[int, str] = {}
+    rows: List[Dict[str, Any]] = []
+    for user_id, (lat, lng) in first.items():
+        if user_id not in known:
+            status[user_id] = "user_not_found"
+        elif user_id in joined:
+            status[user_id] = "already_joined"
+        elif len(rows) >= seats:
+            status[user_id] = "capacity_exceeded"
+        else:
+            grid_lat, grid_lng = _snap_to_grid(lat, lng)
+            rows.append({"meetup_id": meetup_id, "user_id": user_id, "approx_lat": grid_lat, "approx_lng": grid_lng})
+
+    inserted = set()
+    if rows:
+        inserted = {
+            uid
+            for (uid,) in db.execute(
+                pg_insert(Participation)
+                .values(rows)
+                .on_conflict_do_nothing(constraint="uq_participation_user_meetup")
+                .returning(Participation.user_id)
+            ).all()
+        }
+    coords: List[Tuple[float, float]] = []
+    for row in rows:
+        if row["user_id"] in inserted:
+            status[row["user_id"]] = "joined"
+            coords.append((row["approx_lat"], row["approx_lng"]))
+        else:
+            status[row["user_id"]] = "already_joined"
+
+    results: List[Tuple[int, str]] = []
+    seen = set()
+    for user_id, _, _ in members:
+        results.append((user_id, "duplicate_in_request" if user_id in seen else status[user_id]))
+        seen.add(user_id)
 
-    return meetup.current_count
+    if not coords:
+        # 추가된 인원 없음 → 카운트·midpoint 변경 없음 (호출자는 발행 생략)
+        return meetup.current_count, None, results
+
+    state = db.execute(
+        update(Meetup)
+        .where(Meetup.id == meetup_id)
+        .values(current_count=Meetup.current_count + len(coords))
+        .returning(*_MEETUP_STATE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+    midpoint = _refresh_midpoint(db, state, coords, add=True)
+    return state.current_count, midpoint, results
@@ -0,0 +1 @@
+# 배치/운영 작업 (CLI: python -m app.jobs.<name>)
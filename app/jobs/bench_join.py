@@ -0,0 +1,200 @@
+# 단일 모임 동시 join 처리량 벤치마크 (실행 중인 API 서버 대상)
+#
+#   python -m app.jobs.bench_join --base-url http://localhost:8000 --joins 2000 --concurrency 64
+#
+# 1. 벤치용 사용자 N명을 DB에 직접 생성 (nickname 'bench-join-*')
+# 2. POST /meetups 로 정원 N+1(또는 --capacity) 모임 생성
+# 3. N명이 동시에 POST /meetups/{id}/join → joins/s, 지연시간 p50/p95/p99, 상태 코드 분포
+# 4. GET /meetups/{id} 의 current_count 가 성공 수 + 1(호스트) 인지 확인 후 정리
+#
+# --sse-streams K: join 동안 같은 모임 SSE 스트림 K개를 열고 heartbeat(": ping") 간격 측정
+#   서버를 SSE_HEARTBEAT_SEC=0.5 로 띄우면 간격이 0.5s 에서 벗어나는 만큼이 이벤트 루프 지연
+#   (DB 왕복이 루프를 막으면 간격이 join 부하에 따라 늘어남)
+#
+# HTTP 로만 측정하므로 join 구현이 다른 커밋(예: SELECT FOR UPDATE 버전)에서도 같은 방법으로 비교 가능
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from typing import List, Optional, Sequence
+
+import httpx
+from sqlalchemy import delete
+
+from app.database import SessionLocal
+from app.models.meetup import Meetup
+from app.models.user import User
+
+BENCH_NICKNAME_PREFIX = "bench-join-"
+
+
+def _create_users(n: int) -> List[int]:
+    db = SessionLocal()
+    try:
+        users = [User(nickname=f"{BENCH_NICKNAME_PREFIX}{i}") for i in range(n)]
+        db.add_all(users)
+        db.commit()
+        return [u.id for u in users]
+    finally:
+        db.close()
+
+
+def _cleanup(meetup_id: Optional[int]) -> None:
+    db = SessionLocal()
+    try:
+        if meetup_id is not None:
+            db.execute(delete(Meetup).where(Meetup.id == meetup_id))
+        db.execute(delete(User).where(User.nickname.like(f"{BENCH_NICKNAME_PREFIX}%")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+async def _watch_heartbeats(client: httpx.AsyncClient, meetup_id: int, gaps: List[float]) -> None:
+    """SSE 스트림 하나를 읽으며 heartbeat 사이 간격(초) 기록. 취소될 때까지."""
+    last: Optional[float] = None
+    async with client.stream("GET", f"/meetups/{meetup_id}/midpoint/stream", timeout=None) as resp:
+        async for line in resp.aiter_lines():
+            if not line.startswith(": ping"):
+                continue
+            now = time.perf_counter()
+            if last is not None:
+                gaps.append(now - last)
+            last = now
+
+
+def _print_heartbeat_gaps(label: str, gaps: List[float]) -> None:
+    if not gaps:
+        print(f"heartbeat gaps ({label}): no samples (SSE_HEARTBEAT_SEC 를 join 시간보다 짧게)")
+        return
+    gaps.sort()
+    print(
+        f"heartbeat gap ms ({label}, n={len(gaps)}): "
+        f"p50={_percentile(gaps, 0.50) * 1000:.0f} "
+        f"p99={_percentile(gaps, 0.99) * 1000:.0f} "
+        f"max={gaps[-1] * 1000:.0f}"
+    )
+
+
+async def run(
+    base_url: str,
+    joins: int,
+    concurrency: int,
+    capacity: Optional[int],
+    keep: bool,
+    sse_streams: int = 0,
+    sse_idle_sec: float = 5.0,
+) -> None:
+    user_ids = await asyncio.to_thread(_create_users, joins + 1)
+    host_id, joiner_ids = user_ids[0], user_ids[1:]
+    meetup_id: Optional[int] = None
+    limits = httpx.Limits(max_connections=concurrency + sse_streams, max_keepalive_connections=concurrency)
+    watchers: List[asyncio.Task] = []
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as client:
+            resp = await client.post(
+                "/meetups",
+                json={
+                    "title": "bench join",
+                    "capacity": capacity or joins + 1,
+                    "host_user_id": host_id,
+                    "lat": 37.4979,
+                    "lng": 127.0276,
+                },
+            )
+            resp.raise_for_status()
+            meetup_id = resp.json()["id"]
+
+            idle_gaps: List[float] = []
+            load_gaps: List[float] = []
+            if sse_streams:
+                # 부하 전 기준선 → 부하 중 순서로 같은 스트림에서 측정
+                watchers = [
+                    asyncio.create_task(_watch_heartbeats(client, meetup_id, idle_gaps)) for _ in range(sse_streams)
+                ]
+                await asyncio.sleep(sse_idle_sec)
+                for task in watchers:
+                    task.cancel()
+                await asyncio.gather(*watchers, return_exceptions=True)
+                watchers = [
+                    asyncio.create_task(_watch_heartbeats(client, meetup_id, load_gaps)) for _ in range(sse_streams)
+                ]
+
+            sem = asyncio.Semaphore(concurrency)
+            latencies: List[float] = []
+            codes: Counter = Counter()
+
+            async def join(user_id: int) -> None:
+                body = {
+                    "user_id": user_id,
+                    "lat": 37.45 + random.random() * 0.1,
+                    "lng": 126.95 + random.random() * 0.15,
+                }
+                async with sem:
+                    t0 = time.perf_counter()
+                    r = await client.post(f"/meetups/{meetup_id}/join", json=body)
+                    latencies.append(time.perf_counter() - t0)
+                    codes[r.status_code] += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(join(uid) for uid in joiner_ids))
+            elapsed = time.perf_counter() - started
+            for task in watchers:
+                task.cancel()
+            await asyncio.gather(*watchers, return_exceptions=True)
+
+            detail = (await client.get(f"/meetups/{meetup_id}")).json()
+            latencies.sort()
+            ok = codes.get(200, 0)
+            print(f"joins={joins} concurrency={concurrency} elapsed={elapsed:.2f}s -> {joins / elapsed:.0f} joins/s")
+            print(
+                "latency ms: "
+                f"p50={_percentile(latencies, 0.50) * 1000:.1f} "
+                f"p95={_percentile(latencies, 0.95) * 1000:.1f} "
+                f"p99={_percentile(latencies, 0.99) * 1000:.1f}"
+            )
+            print(f"status codes: {dict(codes)}")
+            if sse_streams:
+                _print_heartbeat_gaps("idle", idle_gaps)
+                _print_heartbeat_gaps("under join load", load_gaps)
+            print(f"current_count={detail['current_count']} (expected {ok + 1})")
+            if detail["current_count"] != ok + 1:
+                print("MISMATCH: current_count does not match successful joins", file=sys.stderr)
+    finally:
+        if not keep:
+            await asyncio.to_thread(_cleanup, meetup_id)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="단일 모임 동시 join 처리량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--joins", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--capacity", type=int, help="모임 정원 (기본: joins + 1, 작게 주면 정원 검사 확인)")
+    parser.add_argument("--keep", action="store_true", help="벤치 데이터(모임·사용자) 삭제하지 않음")
+    parser.add_argument("--sse-streams", type=int, default=0, help="join 동안 열어 둘 SSE 스트림 수 (heartbeat 간격 측정)")
+    parser.add_argument("--sse-idle-sec", type=float, default=5.0, help="부하 전 heartbeat 기준선 측정 시간")
+    args = parser.parse_args(argv)
+    asyncio.run(
+        run(
+            args.base_url,
+            args.joins,
+            args.concurrency,
+            args.capacity,
+            args.keep,
+            sse_streams=args.sse_streams,
+            sse_idle_sec=args.sse_idle_sec,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# SSE 동시 접속 idle 비용 벤치마크 (실행 중인 API 서버 대상, Linux)
+#
+#   SSE_HEARTBEAT_SEC=15 uvicorn app.main:app --workers 1 --port 8000 &
+#   python -m app.jobs.bench_sse_clients --pid $(pgrep -f "uvicorn app.main:app" | head -1) --clients 5000
+#
+# 1. 접속 전 서버 프로세스 RSS·CPU 사용률(--idle-sec 동안) 측정
+# 2. SSE 클라이언트 N개 접속 (--meetups 개 모임에 고르게, --global 이면 /meetups/stream)
+# 3. 접속 유지 상태에서 다시 RSS·CPU 사용률 측정 → 클라이언트당 메모리, idle CPU, Redis 연결 수 출력
+#
+# 서버 프로세스 수치는 /proc/<pid> 에서 읽으므로 같은 호스트에서 실행 (--workers 1 권장)
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from app.realtime.sse_pubsub import redis_client
+
+
+def _proc_sample(pid: int) -> Tuple[float, int]:
+    """(누적 CPU 시간 초, RSS 바이트)."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    cpu = (int(fields[11]) + int(fields[12])) / ticks  # utime + stime
+    with open(f"/proc/{pid}/status") as f:
+        rss_kb = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+    return cpu, rss_kb * 1024
+
+
+async def _measure(pid: int, seconds: float) -> Tuple[float, int]:
+    """seconds 동안 CPU 사용률(%)과 종료 시점 RSS."""
+    cpu0, _ = _proc_sample(pid)
+    t0 = time.monotonic()
+    await asyncio.sleep(seconds)
+    cpu1, rss = _proc_sample(pid)
+    return (cpu1 - cpu0) / (time.monotonic() - t0) * 100, rss
+
+
+async def _redis_clients() -> Optional[int]:
+    try:
+        return len(await redis_client.client_list())
+    except Exception:
+        return None
+
+
+async def _open_stream(host: str, port: int, path: str, ready: asyncio.Event, opened: List[int], target: int) -> None:
+    """raw 소켓으로 SSE 요청 후 응답 헤더까지 읽고 연결 유지 (클라이언트 측 비용 최소화)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    opened[0] += 1
+    if opened[0] >= target:
+        ready.set()
+    try:
+        while await reader.read(4096):
+            pass
+    finally:
+        writer.close()
+
+
+async def run(
+    pid: int,
+    host: str,
+    port: int,
+    clients: int,
+    meetups: int,
+    global_stream: bool,
+    idle_sec: float,
+) -> None:
+    base_cpu, base_rss = await _measure(pid, idle_sec)
+    base_redis = await _redis_clients()
+    print(f"before: cpu={base_cpu:.2f}%  rss={base_rss / 2**20:.1f} MiB  redis clients={base_redis}")
+
+    ready = asyncio.Event()
+    opened = [0]
+    paths = [
+        "/meetups/stream" if global_stream else f"/meetups/{i % meetups + 1}/midpoint/stream" for i in range(clients)
+    ]
+    started = time.monotonic()
+    tasks = [asyncio.create_task(_open_stream(host, port, p, ready, opened, clients)) for p in paths]
+    await ready.wait()
+    print(f"opened {clients} SSE clients in {time.monotonic() - started:.1f}s")
+
+    await asyncio.sleep(1.0)  # 구독 안정화
+    cpu, rss = await _measure(pid, idle_sec)
+    redis_now = await _redis_clients()
+    print(f"after:  cpu={cpu:.2f}%  rss={rss / 2**20:.1f} MiB  redis clients={redis_now}")
+    print(
+        f"per client: rss={(rss - base_rss) / clients / 1024:.1f} KiB  "
+        f"idle cpu={(cpu - base_cpu) / clients * 1000:.3f} m%"
+        + (f"  redis connections={(redis_now - base_redis) / clients:.3f}" if redis_now and base_redis else "")
+    )
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SSE 동시 접속 idle CPU·메모리 벤치마크")
+    parser.add_argument("--pid", type=int, required=True, help="측정할 uvicorn 워커 프로세스 pid")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--meetups", type=int, default=100, help="클라이언트를 나눠 붙일 모임 수 (id 1..N)")
+    parser.add_argument("--global", dest="global_stream", action="store_true", help="/meetups/stream 에 접속")
+    parser.add_argument("--idle-sec", type=float, default=10.0, help="CPU 사용률 측정 시간")
+    args = parser.parse_args(argv)
+    asyncio.run(
+        run(args.pid, args.host, args.port, args.clients, args.meetups, args.global_stream, args.idle_sec)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# midpoint 일괄 재계산 작업 (데이터 보정·전략 변경 후)
+#
+#   python -m app.jobs.rebuild_midpoints                           # 전체 모임
+#   python -m app.jobs.rebuild_midpoints --status RECRUITING --publish
+#   python -m app.jobs.rebuild_midpoints --category MEAL --batch-size 200
+#   python -m app.jobs.rebuild_midpoints --ids 12 34 56
+#
+# id 순 keyset 배치마다:
+# - median 모임: UPDATE ... FROM (SELECT meetup_id, percentile_cont ... GROUP BY meetup_id) 한 문장
+# - 그 외 전략: 참여 좌표 조회 1회 + Python 계산 + unnest UPDATE 한 문장
+# 배치마다 commit (행 잠금 시간 최소화), 진행률 출력
+# --publish 시 배치의 midpoint_updated 를 같은 트랜잭션에서 event_outbox 에 기록 (실행 중인 API 워커 relay 가 발행)
+
+import argparse
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple, get_args
+
+from sqlalchemy.orm import Session
+
+from app.crud.participation_crud import bulk_rebuild_median_midpoints, bulk_rebuild_strategy_midpoints
+from app.database import SessionLocal
+from app.models.meetup import Meetup, MeetupStatus
+from app.realtime import outbox
+from app.realtime.sse_pubsub import midpoint_event
+from app.schemas.meetup import MeetupCategoryLiteral
+from app.services.midpoint_strategy import resolve_strategy
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _filtered(
+    db: Session,
+    statuses: Optional[Sequence[str]],
+    categories: Optional[Sequence[str]],
+    ids: Optional[Sequence[int]],
+):
+    q = db.query(Meetup.id, Meetup.midpoint_strategy, Meetup.category)
+    if statuses:
+        q = q.filter(Meetup.status.in_(statuses))
+    if categories:
+        q = q.filter(Meetup.category.in_(categories))
+    if ids:
+        q = q.filter(Meetup.id.in_(ids))
+    return q
+
+
+def rebuild_midpoints(
+    statuses: Optional[Sequence[str]] = None,
+    categories: Optional[Sequence[str]] = None,
+    ids: Optional[Sequence[int]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    publish: bool = False,
+) -> int:
+    """필터에 맞는 모임 midpoint 일괄 재계산. 반환: 처리한 모임 수."""
+    db = SessionLocal()
+    try:
+        total = _filtered(db, statuses, categories, ids).count()
+        print(f"rebuild_midpoints: {total} meetups, batch size {batch_size}", flush=True)
+        done = published = 0
+        last_id = 0
+        started = time.monotonic()
+        while True:
+            batch = (
+                _filtered(db, statuses, categories, ids)
+                .filter(Meetup.id > last_id)
+                .order_by(Meetup.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            median_ids: List[int] = []
+            others: List[Tuple[int, str]] = []
+            for row in batch:
+                strategy = resolve_strategy(row.midpoint_strategy, row.category)
+                if strategy == "median":
+                    median_ids.append(row.id)
+                else:
+                    others.append((row.id, strategy))
+            try:
+                updated = bulk_rebuild_median_midpoints(db, median_ids) + bulk_rebuild_strategy_midpoints(db, others)
+                if publish:
+                    for r in updated:
+                        outbox.add_event(
+                            db,
+                            midpoint_event(
+                                r.id,
+                                {"lat": float(r.lat), "lng": float(r.lng)} if r.lat is not None else None,
+                                r.current_count,
+                            ),
+                        )
+                    published += len(updated)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+            done += len(batch)
+            elapsed = time.monotonic() - started
+            print(
+                # total 은 시작 시점 개수 → 실행 중 생성된 모임으로 0 이거나 done 보다 작을 수 있음
+                f"  {done}/{total} ({min(done / total, 1) if total else 1:.0%})  last_id={last_id}  "
+                f"{done / elapsed if elapsed else 0:.0f} meetups/s" + (f"  published={published}" if publish else ""),
+                flush=True,
+            )
+        return done
+    finally:
+        db.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="모임 midpoint 일괄 재계산")
+    parser.add_argument(
+        "--status", nargs="+", choices=[s.value for s in MeetupStatus], help="대상 상태 (예: RECRUITING CONFIRMED)"
+    )
+    parser.add_argument("--category", nargs="+", choices=get_args(MeetupCategoryLiteral), help="대상 카테고리 (예: MEAL)")
+    parser.add_argument("--ids", nargs="+", type=int, help="대상 모임 id")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--publish", action="store_true", help="배치마다 midpoint_updated 이벤트 발행 (event_outbox 경유)")
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+    rebuild_midpoints(args.status, args.category, args.ids, args.batch_size, args.publish)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
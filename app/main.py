@@ -3,10 +3,15 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine
+from app.database import async_engine, engine, ensure_postgis
+from app.realtime import outbox, publisher, viewport_registry
+from app.realtime.event_listener import register_event_handler, start_event_listener, stop_event_listener
+from app.realtime.sse_pubsub import hub
 from app.models.base import Base
 from app.models.meetup import Meetup  # noqa: F401 — 테이블 메타데이터 등록용
 from app.routers.meetups import router as meetups_router
+from app.routers.metrics import router as metrics_router
+from app.services import bbox_cache, meetup_index, midpoint_coalescer, seat_admission, tile_cache
 
 
 def _run_alembic_upgrade() -> None:
@@ -30,15 +35,55 @@ app = FastAPI(
 
 @app.on_event("startup")
 def _startup_migrate() -> None:
-    """기동 시 Alembic upgrade head 실행 (동기 블로킹을 스레드로 처리)."""
+    """기동 시 PostGIS 확장 확인(1회) 후 Alembic upgrade head 실행 (동기 블로킹을 스레드로 처리)."""
+    ensure_postgis()
     try:
         _run_alembic_upgrade()
     except Exception:
         pass  # DB 미기동 등 실패 시에도 앱은 기동 (예: 로컬에서 DB 없이 실행 시)
 
 
+@app.on_event("startup")
+async def _startup_event_listener() -> None:
+    """meetup:* 이벤트 → 서버 내부 캐시 무효화 핸들러 등록 후 워커당 1개 구독 시작."""
+    register_event_handler(tile_cache.on_meetup_event)
+    register_event_handler(bbox_cache.on_meetup_event)
+    if meetup_index.MEETUP_INDEX_ENABLED:
+        # 인메모리 bbox 인덱스: 워밍 + 주기적 DB 정합성 검사 + 이벤트 갱신
+        register_event_handler(meetup_index.on_meetup_event)
+        meetup_index.start_meetup_index()
+    if seat_admission.SEAT_ADMISSION_ENABLED:
+        # join 좌석 예약: 상태 변경 시 카운터 초기화 + 주기적 드리프트 교정
+        register_event_handler(seat_admission.on_meetup_event)
+        seat_admission.start_seat_admission()
+    start_event_listener()
+    # midpoint 병합: 중단된 작업(워커 종료·오류) 이어받기
+    midpoint_coalescer.start_midpoint_coalescer()
+    # event_outbox → Redis 발행 (워커당 1개, drain 은 한 번에 한 워커)
+    outbox.start_outbox_relay()
+    # 내구성 불필요한 이벤트(poi_updated) 일괄 발행
+    publisher.start_publisher()
+    # /meetups/stream?bbox= 뷰포트별 이벤트 분배
+    viewport_registry.start_viewport_fanout()
+
+
+@app.on_event("shutdown")
+async def _shutdown_event_listener() -> None:
+    await stop_event_listener()
+    await viewport_registry.stop_viewport_fanout()
+    await hub.close()  # SSE·리스너 공유 pubsub 연결 반납
+    await outbox.stop_outbox_relay()
+    await publisher.stop_publisher()  # 남은 이벤트 발행 후 종료
+    await meetup_index.stop_meetup_index()
+    await midpoint_coalescer.stop_midpoint_coalescer()
+    await seat_admission.stop_seat_admission()
+    # 백그라운드 작업 정리 후 async 풀 연결 반납
+    await async_engine.dispose()
+
+
 # ✅ 라우터 등록은 app 생성 후에!
 app.include_router(meetups_router)
+app.include_router(metrics_router)
 
 # CORS 설정
 app.add_middleware(
@@ -47,6 +92,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # /meetups/bbox keyset 커서, 응답 캐시 적중 여부, 증분 동기화 커서
+    expose_headers=["X-Next-Cursor", "X-Cache", "X-Sync-Cursor"],
 )
 
 
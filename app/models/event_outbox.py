@@ -0,0 +1,17 @@
+# EventOutbox 모델: 실시간 이벤트 트랜잭셔널 아웃박스
+
+from sqlalchemy import BigInteger, Column, DateTime, String, Text
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class EventOutbox(Base):
+    """상태 변경과 같은 트랜잭션에서 기록하는 발행 대기 이벤트. relay 가 Redis 발행 후 삭제."""
+
+    __tablename__ = "event_outbox"
+
+    id = Column(BigInteger, primary_key=True)
+    channel = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  # 발행할 JSON 문자열 그대로
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -2,9 +2,11 @@
 
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Float, Integer, String, Text, DateTime
+from sqlalchemy import BigInteger, Column, Computed, Float, Integer, String, Text, DateTime, text
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from geoalchemy2 import Geometry
+from sqlalchemy.dialects.postgresql import JSONB
+from geoalchemy2 import Geography, Geometry
 
 from app.models.base import Base
 
@@ -33,10 +35,36 @@ class Meetup(Base):
     title = Column(String(100), nullable=False)  # 제목
     description = Column(Text, nullable=True)  # 설명(선택)
     capacity = Column(Integer, nullable=False, default=10)  # 최대 인원
-    current_count = Column(Integer, nullable=False, default=0)  # 현재 참여 인원 (동시성은 FOR UPDATE로 보장)
+    current_count = Column(Integer, nullable=False, default=0)  # 현재 참여 인원 (동시성은 조건부 UPDATE 의 current_count < capacity 조건으로 보장)
     location = Column(Geometry(geometry_type="POINT", srid=4326), nullable=False)  # WGS84 좌표
+    # location의 geography 사본 (DB 생성 컬럼, 읽기 전용). nearby의 ST_DWithin이 GiST 인덱스를 타도록 함
+    # 조회 결과로는 쓰지 않으므로 deferred → SELECT 목록에서 제외
+    location_geog = deferred(
+        Column(
+            Geography(geometry_type="POINT", srid=4326),
+            Computed("location::geography", persisted=True),
+        )
+    )
+    # location의 geohash(12자리) 사본 (DB 생성 컬럼, 읽기 전용). prefix 범위/GROUP BY로 heatmap 집계
+    geohash = deferred(
+        Column(
+            String(12, collation="C"),
+            Computed("ST_GeoHash(location, 12)", persisted=True),
+        )
+    )
     midpoint = Column(Geometry(geometry_type="POINT", srid=4326), nullable=True)  # 참여자들의 중앙값 기반 중간지점 (PostGIS로 공간 쿼리 가능)
+    # midpoint 계산 전략 (median / geometric_median / minimax). NULL 이면 카테고리별·전역 기본값
+    midpoint_strategy = Column(String(20), nullable=True)
+    # midpoint 증분 계산용 좌표 히스토그램 (app.services.median_histogram). join/leave 에서만 읽으므로 deferred
+    midpoint_hist = deferred(Column(JSONB(none_as_null=True), nullable=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())  # 생성 시각(타임존 포함)
+    # 마지막 변경 시각. DB 트리거(trg_meetups_touch_updated_at)가 UPDATE마다 갱신 → bbox 증분 동기화 기준
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # 마지막으로 생성/변경한 트랜잭션 id (같은 트리거가 갱신). bbox 증분 동기화 커서 = 조회 시점 스냅샷 xmin
+    # → 커서보다 작은 트랜잭션은 모두 끝났으므로 늦게 커밋된 변경도 다음 동기화에서 빠지지 않음
+    change_xid = deferred(
+        Column(BigInteger, nullable=False, server_default=text("(pg_current_xact_id()::text::bigint)"))
+    )
     # POI 확정: 호스트가 선택한 최종 장소 (실시간 poi_confirmed 이벤트로 브로드캐스트)
     confirmed_poi_name = Column(String(200), nullable=True)
     confirmed_poi_lat = Column(Float, nullable=True)
@@ -0,0 +1,83 @@
+# 워커 내부용 meetup 이벤트 리스너
+# meetup:*:midpoint / meetup:*:poi 를 워커 공유 pubsub 연결(SubscriptionHub)로 구독하고,
+# 등록된 핸들러(캐시 무효화 등)에 (event_name, payload)를 전달.
+# SSE 스트림과 달리 클라이언트에게 전달하지 않고 서버 내부 상태 갱신에만 사용.
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.realtime.sse_pubsub import MEETUP_EVENT_PATTERNS, event_name_for, hub
+
+logger = logging.getLogger(__name__)
+
+MeetupEventHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+RECONNECT_DELAY_SEC = 1.0
+RECONNECT_DELAY_MAX_SEC = 30.0
+LISTENER_QUEUE_MAX = 10000
+
+_handlers: List[MeetupEventHandler] = []
+_task: Optional[asyncio.Task] = None
+
+
+def register_event_handler(handler: MeetupEventHandler) -> None:
+    """이벤트 핸들러 등록. 핸들러는 (event_name, payload)를 받는 async 함수."""
+    if handler not in _handlers:
+        _handlers.append(handler)
+
+
+async def _dispatch(channel: str, data: str) -> None:
+    event_name = event_name_for(channel, data)
+    try:
+        payload = json.loads(data)
+    except Exception:
+        return
+    if not isinstance(payload, dict) or payload.get("meetup_id") is None:
+        return
+    for handler in list(_handlers):
+        try:
+            await handler(event_name, payload)
+        except Exception:
+            # 핸들러 하나의 실패가 다른 핸들러/리스너를 멈추지 않도록
+            logger.exception("meetup event handler failed: %s", event_name)
+
+
+async def _listen_forever() -> None:
+    """허브 패턴 구독 후 blocking 수신. Redis 끊김 시 허브가 재연결, 최초 구독 실패는 지수 백오프로 재시도."""
+    delay = RECONNECT_DELAY_SEC
+    while True:
+        try:
+            # 내부 핸들러는 메시지를 버리면 캐시 무효화가 누락되므로 큐를 넉넉히
+            sub = await hub.subscribe(patterns=MEETUP_EVENT_PATTERNS, maxsize=LISTENER_QUEUE_MAX)
+            break
+        except Exception:
+            logger.warning("meetup event listener subscribe failed; retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX_SEC)
+    try:
+        while True:
+            channel, data = await sub.get()  # type: ignore[misc]
+            await _dispatch(channel, data)
+    finally:
+        await hub.unsubscribe(sub)
+
+
+def start_event_listener() -> None:
+    """앱 startup 시 호출. 핸들러가 하나도 없으면 구독하지 않음."""
+    global _task
+    if _task is None and _handlers:
+        _task = asyncio.create_task(_listen_forever())
+
+
+async def stop_event_listener() -> None:
+    """앱 shutdown 시 호출."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,129 @@
+# 실시간 이벤트 트랜잭셔널 아웃박스 + relay
+# - 상태 변경과 같은 트랜잭션에서 event_outbox 행 추가 (add_event) → commit 되면 이벤트도 반드시 남음
+#   (이전: commit 후 바로 Redis 발행, 오류는 무시 → Redis 장애 시 이벤트 유실 + 요청이 발행을 기다림)
+# - 워커마다 relay 태스크 하나: id 순 배치 조회(FOR UPDATE SKIP LOCKED) → 파이프라인 발행 → 삭제, 한 트랜잭션
+#   발행 실패 시 rollback → 행이 남아 다음 배치에서 재시도 (at-least-once, 중복 가능)
+# - 한 번에 한 워커만 drain (advisory lock) → 같은 모임 이벤트는 커밋 순서대로 발행
+# - 요청은 commit 후 notify() 만 호출 (같은 워커 relay 즉시 깨움, 다른 워커 커밋분은 폴링으로)
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import AsyncSessionLocal
+from app.models.event_outbox import EventOutbox
+from app.realtime.sse_pubsub import Event, publish_events
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 500
+OUTBOX_POLL_SEC = 0.2
+OUTBOX_RETRY_DELAY_SEC = 1.0
+OUTBOX_RETRY_DELAY_MAX_SEC = 30.0
+# pg_try_advisory_xact_lock 키 (relay drain 직렬화)
+OUTBOX_LOCK_KEY = 0x6F7574626F78  # "outbox"
+
+_task: Optional[asyncio.Task] = None
+_wake: Optional[asyncio.Event] = None
+stats: Dict[str, Any] = {"published": 0, "batches": 0, "errors": 0, "last_lag_ms": None, "max_lag_ms": 0}
+
+
+def add_event(db: Union[Session, AsyncSession], event: Event) -> None:
+    """이벤트를 현재 트랜잭션에 추가 (commit 은 호출자). Session / AsyncSession 모두 사용 가능."""
+    channel, payload = event
+    db.add(EventOutbox(channel=channel, payload=payload))
+
+
+def notify() -> None:
+    """commit 후 호출: 이 워커의 relay 를 바로 깨움 (폴링 간격만큼 기다리지 않도록)."""
+    if _wake is not None:
+        _wake.set()
+
+
+async def _drain_once() -> int:
+    """배치 하나 발행·삭제. 반환: 발행 건수 (다른 워커가 drain 중이면 0)."""
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            locked = (
+                await db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": OUTBOX_LOCK_KEY})
+            ).scalar()
+            if not locked:
+                return 0
+            rows = (
+                await db.execute(
+                    select(EventOutbox.id, EventOutbox.channel, EventOutbox.payload, EventOutbox.created_at)
+                    .order_by(EventOutbox.id)
+                    .limit(OUTBOX_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if not rows:
+                return 0
+            # 발행이 실패하면 예외 → rollback → 행 유지
+            await publish_events([(r.channel, r.payload) for r in rows])
+            await db.execute(
+                delete(EventOutbox)
+                .where(EventOutbox.id.in_([r.id for r in rows]))
+                .execution_options(synchronize_session=False)
+            )
+    lag_ms = int((datetime.now(timezone.utc) - rows[0].created_at).total_seconds() * 1000)
+    stats["published"] += len(rows)
+    stats["batches"] += 1
+    stats["last_lag_ms"] = lag_ms
+    stats["max_lag_ms"] = max(stats["max_lag_ms"], lag_ms)
+    return len(rows)
+
+
+async def _run() -> None:
+    delay = OUTBOX_RETRY_DELAY_SEC
+    while True:
+        _wake.clear()  # type: ignore[union-attr]
+        try:
+            published = await _drain_once()
+            delay = OUTBOX_RETRY_DELAY_SEC
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Redis/DB 장애: 행은 남아 있으므로 지수 백오프 후 재시도
+            stats["errors"] += 1
+            logger.warning("event outbox relay failed, retrying in %.1fs", delay, exc_info=True)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, OUTBOX_RETRY_DELAY_MAX_SEC)
+            continue
+        if published >= OUTBOX_BATCH_SIZE:
+            continue  # 밀린 이벤트: 바로 다음 배치
+        try:
+            await asyncio.wait_for(_wake.wait(), OUTBOX_POLL_SEC)  # type: ignore[union-attr]
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_outbox_relay() -> None:
+    """앱 startup 에서 호출 (워커당 1개)."""
+    global _task, _wake
+    if _task is not None and not _task.done():
+        return
+    _wake = asyncio.Event()
+    _task = asyncio.create_task(_run())
+
+
+async def stop_outbox_relay() -> None:
+    """앱 shutdown 시 relay 종료 (남은 행은 다른 워커/다음 기동 때 발행)."""
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"running": _task is not None and not _task.done(), "batch_size": OUTBOX_BATCH_SIZE, **stats}
@@ -0,0 +1,141 @@
+# 워커 내부 비동기 일괄 발행기 (내구성 불필요한 이벤트용, 예: poi_updated)
+# - 핸들러는 enqueue() 만 호출하고 기다리지 않음 (Redis 왕복이 요청 경로에서 빠짐)
+# - 백그라운드 태스크가 PUBLISHER_FLUSH_MS 마다 또는 PUBLISHER_BATCH_SIZE 건이 모이면 파이프라인 한 번으로 발행
+# - 큐는 PUBLISHER_QUEUE_MAX 로 제한: 가득 차면 새 이벤트를 버림 (Redis 장애 시 메모리 무한 증가 방지)
+# - shutdown 시 남은 이벤트를 모두 발행 후 종료
+# 상태 변경 이벤트(midpoint/상태/POI 확정)는 유실되면 안 되므로 app.realtime.outbox 사용
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from app.realtime.sse_pubsub import Event, publish_events
+
+logger = logging.getLogger(__name__)
+
+PUBLISHER_FLUSH_MS = int(os.getenv("PUBLISHER_FLUSH_MS", "5"))
+PUBLISHER_BATCH_SIZE = int(os.getenv("PUBLISHER_BATCH_SIZE", "100"))
+PUBLISHER_QUEUE_MAX = int(os.getenv("PUBLISHER_QUEUE_MAX", "10000"))
+
+_queue: Optional["asyncio.Queue[Optional[Event]]"] = None
+_task: Optional[asyncio.Task] = None
+stats: Dict[str, Any] = {
+    "enqueued": 0,
+    "published": 0,
+    "dropped": 0,
+    "flushes": 0,
+    "errors": 0,
+    "max_depth": 0,
+    "last_flush_ms": None,
+    "max_flush_ms": 0.0,
+}
+
+
+def enqueue(event: Event) -> bool:
+    """이벤트를 발행 큐에 넣음 (기다리지 않음). 큐가 가득 찼거나 발행기가 꺼져 있으면 False (버림)."""
+    if _queue is None:
+        stats["dropped"] += 1
+        return False
+    if _queue.qsize() >= PUBLISHER_QUEUE_MAX:
+        stats["dropped"] += 1
+        return False
+    _queue.put_nowait(event)
+    stats["enqueued"] += 1
+    stats["max_depth"] = max(stats["max_depth"], _queue.qsize())
+    return True
+
+
+# shutdown 신호 (큐에 넣으면 발행 태스크가 앞선 이벤트를 모두 발행한 뒤 종료)
+_STOP = None
+
+
+def _take_batch(queue: "asyncio.Queue[Optional[Event]]", batch: List[Event]) -> bool:
+    """큐에 이미 있는 이벤트를 배치가 찰 때까지 꺼냄. 종료 신호를 만나면 True."""
+    while len(batch) < PUBLISHER_BATCH_SIZE:
+        try:
+            event = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return False
+        if event is _STOP:
+            return True
+        batch.append(event)
+    return False
+
+
+async def _flush(batch: List[Event]) -> None:
+    if not batch:
+        return
+    started = time.perf_counter()
+    try:
+        await publish_events(batch)
+        stats["published"] += len(batch)
+    except Exception:
+        # 내구성 없는 이벤트: 재시도 없이 버림 (다음 갱신 이벤트가 최신 상태를 다시 전달)
+        stats["errors"] += 1
+        stats["dropped"] += len(batch)
+        logger.warning("batched publish failed: %d events dropped", len(batch), exc_info=True)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    stats["flushes"] += 1
+    stats["last_flush_ms"] = elapsed_ms
+    stats["max_flush_ms"] = max(stats["max_flush_ms"], elapsed_ms)
+
+
+async def _run(queue: "asyncio.Queue[Optional[Event]]") -> None:
+    window = PUBLISHER_FLUSH_MS / 1000
+    stopping = False
+    while not stopping:
+        first = await queue.get()
+        if first is _STOP:
+            return
+        batch: List[Event] = [first]
+        # 첫 이벤트 이후 창(window) 동안 또는 배치가 찰 때까지 모음
+        deadline = time.monotonic() + window
+        stopping = _take_batch(queue, batch)
+        while not stopping and len(batch) < PUBLISHER_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if event is _STOP:
+                stopping = True
+                break
+            batch.append(event)
+            stopping = _take_batch(queue, batch)
+        await _flush(batch)
+
+
+def start_publisher() -> None:
+    """앱 startup 에서 호출 (워커당 1개)."""
+    global _queue, _task
+    if _task is not None and not _task.done():
+        return
+    # 종료 신호 자리 1칸 여유
+    _queue = asyncio.Queue(maxsize=PUBLISHER_QUEUE_MAX + 1)
+    _task = asyncio.create_task(_run(_queue))
+
+
+async def stop_publisher() -> None:
+    """앱 shutdown 시 호출: 새 이벤트 수신 중단 → 남은 이벤트 모두 발행 후 종료."""
+    global _queue, _task
+    queue, task = _queue, _task
+    _queue, _task = None, None
+    if task is None or queue is None:
+        return
+    queue.put_nowait(_STOP)
+    await task
+
+
+def get_stats() -> Dict[str, Any]:
+    return {
+        "running": _task is not None and not _task.done(),
+        "depth": _queue.qsize() if _queue is not None else 0,
+        "queue_max": PUBLISHER_QUEUE_MAX,
+        "flush_ms": PUBLISHER_FLUSH_MS,
+        "batch_size": PUBLISHER_BATCH_SIZE,
+        **stats,
+    }
@@ -1,24 +1,66 @@
 # SSE + Redis Pub/Sub: 실시간 midpoint 갱신
 # SSE: 폴링 없이 서버→클라이언트 푸시로 실시간 UX (long-lived connection → 예외 처리 필수)
-# Redis Pub/Sub: 멀티 워커 환경에서도 확장 가능, 발행/구독 분리
+# Redis Pub/Sub: 멀티 워커 환경에서도 확장 가능, 발행/구독 분리 (구독은 워커당 연결 하나를 SubscriptionHub 로 공유)
+# 상태 변경 이벤트는 *_event() 로 직렬화해 event_outbox 에 기록 → relay(app.realtime.outbox)가 publish_events 로 발행
+# 모임 이벤트는 모임별 Redis Stream(meetup:{id}:events, 길이 제한)에도 추가 → 스트림 id 가 SSE id:
+#   재접속 시 Last-Event-ID 이후를 XRANGE 로 재전송 (전체 재조회 대신 증분 따라잡기)
 
 import asyncio
 import json
 import os
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import redis.asyncio as redis
 
+from app.realtime.subscription_hub import SubscriptionHub
+
 # Docker 환경에서는 localhost가 아니라 서비스명(redis)을 사용해야 함
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 CHANNEL_PREFIX = "meetup:"
 CHANNEL_SUFFIX = ":midpoint"
 CHANNEL_SUFFIX_POI = ":poi"
-HEARTBEAT_INTERVAL = 15.0
+STREAM_SUFFIX = ":events"
+# 모임별 이벤트 스트림 보관 길이(근사) / 마지막 이벤트 후 보관 시간
+SSE_REPLAY_MAXLEN = int(os.getenv("SSE_REPLAY_MAXLEN", "1000"))
+SSE_REPLAY_TTL_SEC = int(os.getenv("SSE_REPLAY_TTL_SEC", "86400"))
+# 재접속 한 번에 재전송할 최대 이벤트 수 (넘으면 resync_required → 클라이언트 전체 재조회)
+SSE_REPLAY_MAX = int(os.getenv("SSE_REPLAY_MAX", "500"))
+# 연결 유지용 주석 라인(": ping") 간격. 부하 시험에서는 짧게 두고 간격 흔들림으로 이벤트 루프 지연 관측
+HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_SEC", "15"))
+# 워커당 Redis 명령 연결 상한 / 빈 연결을 기다리는 최대 시간 (초과 시 연결 오류 → 호출자가 Redis 장애로 처리)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SEC = float(os.getenv("REDIS_POOL_TIMEOUT_SEC", "5"))
 
 # 모듈 단일 클라이언트 재사용 (매 루프마다 새 연결 생성 방지)
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+# 연결 풀은 상한이 있는 blocking 풀: SSE 접속 때의 XREVRANGE/XRANGE 가 몰려도 접속자 수만큼 연결이 생겨
+# 유휴 상태로 남지 않고 REDIS_MAX_CONNECTIONS 개를 나눠 씀 (기본 풀은 상한 없이 늘어나고 줄지 않음)
+redis_client = redis.Redis(
+    connection_pool=redis.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SEC,
+    )
+)
+
+# 워커당 pubsub 연결 하나 (SSE 스트림·내부 이벤트 리스너 공유)
+hub = SubscriptionHub(redis_client)
+
+MEETUP_EVENT_PATTERNS = (f"{CHANNEL_PREFIX}*{CHANNEL_SUFFIX}", f"{CHANNEL_PREFIX}*{CHANNEL_SUFFIX_POI}")
+
+
+# 스트림 추가 + 발행을 원자적으로: 스트림 id 를 payload 맨 앞 "event_id" 로 넣어 발행
+# (payload 는 항상 비어 있지 않은 JSON 객체. 재전송 시에도 _with_event_id 로 같은 형태를 만듦)
+_XADD_PUBLISH_LUA = """
+local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'c', ARGV[3], 'd', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('PUBLISH', ARGV[3], '{"event_id":"' .. id .. '",' .. string.sub(ARGV[4], 2))
+return id
+"""
+_xadd_publish = redis_client.register_script(_XADD_PUBLISH_LUA)
+
+_EVENT_ID_PREFIX = '{"event_id":"'
 
 
 def _channel(meetup_id: int) -> str:
@@ -29,12 +71,68 @@ def _channel_poi(meetup_id: int) -> str:
     return f"{CHANNEL_PREFIX}{meetup_id}{CHANNEL_SUFFIX_POI}"
 
 
-async def publish_midpoint_update(
+def _stream_key(meetup_id: int) -> str:
+    return f"{CHANNEL_PREFIX}{meetup_id}{STREAM_SUFFIX}"
+
+
+def meetup_id_of_channel(channel: str) -> Optional[int]:
+    """meetup:{id}:midpoint / meetup:{id}:poi → id. 모임 채널이 아니면 None."""
+    if not channel.startswith(CHANNEL_PREFIX):
+        return None
+    middle = channel[len(CHANNEL_PREFIX):].partition(":")[0]
+    return int(middle) if middle.isdigit() else None
+
+
+def _with_event_id(event_id: str, data: str) -> str:
+    """_XADD_PUBLISH_LUA 와 같은 형태로 event_id 삽입."""
+    return f'{_EVENT_ID_PREFIX}{event_id}",{data[1:]}'
+
+
+def _event_id_of(data: str) -> Optional[str]:
+    """발행 payload 맨 앞의 event_id (JSON 파싱 없이). 없으면 None."""
+    if not data.startswith(_EVENT_ID_PREFIX):
+        return None
+    end = data.find('"', len(_EVENT_ID_PREFIX))
+    return data[len(_EVENT_ID_PREFIX):end] if end > 0 else None
+
+
+def _parse_stream_id(event_id: str) -> Optional[Tuple[int, int]]:
+    """Redis Stream id "ms-seq" → 비교용 튜플. 형식이 아니면 None."""
+    ms, sep, seq = event_id.partition("-")
+    if not sep or not ms.isdigit() or not seq.isdigit():
+        return None
+    return int(ms), int(seq)
+
+
+def event_name_for(channel: str, data: str) -> str:
+    """
+    채널 + payload → SSE event 이름.
+    meetup:*:poi 채널은 payload의 type에 따라 poi_confirmed / meetup_status_changed / poi_updated 구분,
+    그 외(meetup:*:midpoint)는 midpoint_updated.
+    """
+    if not channel.endswith(CHANNEL_SUFFIX_POI):
+        return "midpoint_updated"
+    try:
+        t = json.loads(data).get("type")
+    except Exception:
+        return "poi_updated"
+    if t == "meetup_status_changed":
+        return "meetup_status_changed"
+    if t == "poi_confirmed":
+        return "poi_confirmed"
+    return "poi_updated"
+
+
+# (채널, JSON payload) — 발행 전 직렬화된 이벤트 (event_outbox 에 그대로 저장)
+Event = Tuple[str, str]
+
+
+def midpoint_event(
     meetup_id: int,
     midpoint: Optional[Dict[str, float]],
     current_count: int,
-) -> None:
-    """join/leave commit 후 라우터에서 호출. Redis에 midpoint + current_count 이벤트 발행."""
+) -> Event:
+    """midpoint + current_count 이벤트 (join/leave, midpoint 재계산 후)."""
     payload = {
         "type": "midpoint_updated",
         "meetup_id": meetup_id,
@@ -42,145 +140,197 @@ async def publish_midpoint_update(
         "current_count": current_count,
         "ts": datetime.now(timezone.utc).isoformat(),
     }
-    try:
-        await redis_client.publish(_channel(meetup_id), json.dumps(payload))
-    except Exception:
-        pass  # Redis 미기동 시 스트림만 실패, join/leave는 유지
+    return _channel(meetup_id), json.dumps(payload)
 
 
-async def publish_poi_update(
-    meetup_id: int,
-    midpoint: Optional[Dict[str, float]],
-    pois: List[Dict[str, Any]],
-) -> None:
-    """POI 갱신 시 SSE 구독자에게 poi_updated 이벤트 발행."""
+def poi_confirmed_event(meetup_id: int, poi: Dict[str, Any]) -> Event:
+    """POI 확정 이벤트 — meetup:{id}:poi 채널, SSE에서 event: poi_confirmed 로 전달."""
     payload = {
+        "type": "poi_confirmed",
         "meetup_id": meetup_id,
-        "midpoint": midpoint,
-        "pois": pois,
+        "poi": poi,
         "ts": datetime.now(timezone.utc).isoformat(),
     }
-    try:
-        await redis_client.publish(_channel_poi(meetup_id), json.dumps(payload, ensure_ascii=False))
-    except Exception:
-        pass
+    return _channel_poi(meetup_id), json.dumps(payload, ensure_ascii=False)
 
 
-async def publish_poi_confirmed(
-    meetup_id: int,
-    poi: Dict[str, Any],
-) -> None:
-    """POI 확정 시 meetup:{id}:poi 채널로 발행 → SSE에서 event: poi_confirmed 로 전달."""
+def meetup_status_changed_event(meetup_id: int, status: str) -> Event:
+    """모임 상태 변경 이벤트 — meetup:{id}:poi 채널, SSE에서 event: meetup_status_changed 로 전달."""
     payload = {
-        "type": "poi_confirmed",
+        "type": "meetup_status_changed",
         "meetup_id": meetup_id,
-        "poi": poi,
+        "status": status,
         "ts": datetime.now(timezone.utc).isoformat(),
     }
-    try:
-        await redis_client.publish(_channel_poi(meetup_id), json.dumps(payload, ensure_ascii=False))
-    except Exception:
-        pass
+    return _channel_poi(meetup_id), json.dumps(payload)
+
+
+async def publish_events(events: List[Event]) -> None:
+    """
+    이벤트 여러 건을 파이프라인 한 번으로 발행 (outbox relay·일괄 발행기 용). Redis 오류는 호출자에게 전달.
+    모임 채널 이벤트는 모임 스트림 추가 + event_id 삽입 발행 (Lua 한 번).
+    """
+    if not events:
+        return
+    pipe = redis_client.pipeline(transaction=False)
+    for channel, payload in events:
+        meetup_id = meetup_id_of_channel(channel)
+        if meetup_id is None:
+            pipe.publish(channel, payload)
+        else:
+            await _xadd_publish(
+                keys=[_stream_key(meetup_id)],
+                args=[SSE_REPLAY_MAXLEN, SSE_REPLAY_TTL_SEC, channel, payload],
+                client=pipe,
+            )
+    await pipe.execute()
 
 
-async def publish_meetup_status_changed(meetup_id: int, status: str) -> None:
-    """모임 상태 변경 시 meetup:{id}:poi 채널로 발행 → SSE에서 event: meetup_status_changed 로 전달."""
+def poi_updated_event(
+    meetup_id: int,
+    midpoint: Optional[Dict[str, float]],
+    pois: List[Dict[str, Any]],
+) -> Event:
+    """POI 추천 갱신 이벤트 — meetup:{id}:poi 채널, SSE에서 event: poi_updated 로 전달 (app.realtime.publisher 로 발행)."""
     payload = {
-        "type": "meetup_status_changed",
         "meetup_id": meetup_id,
-        "status": status,
+        "midpoint": midpoint,
+        "pois": pois,
         "ts": datetime.now(timezone.utc).isoformat(),
     }
+    return _channel_poi(meetup_id), json.dumps(payload, ensure_ascii=False)
+
+
+def _frame(channel: str, data: str, with_id: bool) -> str:
+    # poi 채널: payload의 type에 따라 poi_confirmed / meetup_status_changed / poi_updated 구분
+    event_name = event_name_for(channel, data)
+    event_id = _event_id_of(data) if with_id else None
+    if event_id is not None:
+        return f"id: {event_id}\nevent: {event_name}\ndata: {data}\n\n"
+    return f"event: {event_name}\ndata: {data}\n\n"
+
+
+# 스트림이 비어 있을 때의 위치 (이후 추가되는 모든 이벤트가 이 id 보다 큼)
+EMPTY_STREAM_ID = "0-0"
+
+
+def _resync_frame(meetup_id: int, tail_id: Optional[str]) -> str:
+    # tail_id: 재조회 후 이어받을 위치 (Redis 오류로 모르면 id 없이)
+    id_line = f"id: {tail_id}\n" if tail_id else ""
+    return f'{id_line}event: resync_required\ndata: {{"meetup_id": {meetup_id}}}\n\n'
+
+
+def _opened_frame(meetup_id: int, tail_id: Optional[str]) -> str:
+    id_line = f"id: {tail_id}\n" if tail_id else ""
+    return f'{id_line}event: stream_opened\ndata: {{"meetup_id": {meetup_id}}}\n\n'
+
+
+async def _tail_id(meetup_id: int) -> Optional[str]:
+    """모임 스트림의 마지막 이벤트 id (비어 있으면 EMPTY_STREAM_ID). Redis 오류 시 None."""
     try:
-        await redis_client.publish(_channel_poi(meetup_id), json.dumps(payload))
+        last = await redis_client.xrevrange(_stream_key(meetup_id), max="+", min="-", count=1)
     except Exception:
-        pass
+        return None
+    return last[0][0] if last else EMPTY_STREAM_ID
 
 
-async def stream_midpoint_events(meetup_id: int) -> AsyncGenerator[str, None]:
+async def _replay(meetup_id: int, last_event_id: str) -> Tuple[List[str], Optional[Tuple[int, int]]]:
     """
-    GET /meetups/{id}/midpoint/stream 용.
-    midpoint + poi 채널 구독 → SSE로 전달. midpoint_updated / poi_updated 모두 전송.
-    SSE는 long-lived connection이므로 예외·연결 해제 처리 필수.
+    Last-Event-ID 이후 이벤트를 XRANGE 로 읽어 SSE 프레임 목록으로. 반환: (프레임들, 이 id 까지 전달한 것으로 간주).
+    이어 보낼 수 없으면(id 형식 오류, 스트림 만료·잘림, SSE_REPLAY_MAX 초과, Redis 오류)
+    현재 마지막 id 를 실은 resync_required 하나 → 클라이언트는 재조회 후 그 위치부터 이어받음.
+    EMPTY_STREAM_ID(접속 당시 빈 스트림)는 스트림이 한 번도 잘리지 않았으면(길이 < SSE_REPLAY_MAXLEN) 처음부터 재전송.
     """
-    channel_mid = _channel(meetup_id)
-    channel_poi = _channel_poi(meetup_id)
-    pubsub = redis_client.pubsub()
+    key = _stream_key(meetup_id)
     try:
-        await pubsub.subscribe(channel_mid, channel_poi)
-        last_heartbeat = datetime.now(timezone.utc).timestamp()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.xrevrange(key, max="+", min="-", count=1)
+        pipe.xrange(key, min="-", max="+", count=1)
+        pipe.xlen(key)
+        start = _parse_stream_id(last_event_id)
+        if start is not None:
+            pipe.xrange(key, min=f"({last_event_id}", max="+", count=SSE_REPLAY_MAX + 1)
+        results = await pipe.execute()
+    except Exception:
+        return [_resync_frame(meetup_id, None)], None
+    last, oldest, length = results[0], results[1], results[2]
+    tail_id = last[0][0] if last else EMPTY_STREAM_ID
+    resync = [_resync_frame(meetup_id, tail_id)], _parse_stream_id(tail_id)
+    if start is None:
+        return resync
+    entries = results[3]
+    if start == (0, 0):
+        gap_free = length < SSE_REPLAY_MAXLEN
+    else:
+        # 가장 오래 남은 이벤트가 Last-Event-ID 보다 뒤(또는 스트림 만료) → 사이가 잘렸을 수 있음
+        gap_free = bool(oldest) and _parse_stream_id(oldest[0][0]) <= start
+    if not gap_free or len(entries) > SSE_REPLAY_MAX:
+        return resync
+    frames = [_frame(fields["c"], _with_event_id(event_id, fields["d"]), True) for event_id, fields in entries]
+    return frames, _parse_stream_id(entries[-1][0]) if entries else start
+
 
+async def _stream_events(
+    channels: Tuple[str, ...] = (),
+    patterns: Tuple[str, ...] = (),
+    replay_meetup_id: Optional[int] = None,
+    last_event_id: Optional[str] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    허브 구독 → SSE 프레임. 메시지가 없으면 큐에서 blocking 대기, HEARTBEAT_INTERVAL 마다 ": ping".
+    replay_meetup_id 가 있으면 프레임에 id: 를 붙이고, last_event_id 이후 이벤트를 먼저 재전송.
+    last_event_id 가 없으면 첫 프레임 stream_opened 에 현재 마지막 id(빈 스트림이면 0-0) → 이벤트를 하나도 받기 전에
+    끊겨도 클라이언트는 항상 id 를 가지고 재접속.
+    구독을 먼저 한 뒤 재전송하므로 그 사이 발행된 이벤트도 빠지지 않음 (재전송분과 겹치는 실시간 메시지는 건너뜀).
+    SSE는 long-lived connection이므로 예외·연결 해제 처리 필수 (해제 시 구독 참조 카운트 반환).
+    """
+    sub = await hub.subscribe(channels=channels, patterns=patterns)
+    loop = asyncio.get_running_loop()
+    with_id = replay_meetup_id is not None
+    try:
+        replayed_until: Optional[Tuple[int, int]] = None
+        if with_id and last_event_id:
+            frames, replayed_until = await _replay(replay_meetup_id, last_event_id)  # type: ignore[arg-type]
+            for frame in frames:
+                yield frame
+        elif with_id:
+            yield _opened_frame(replay_meetup_id, await _tail_id(replay_meetup_id))  # type: ignore[arg-type]
+        last_heartbeat = loop.time()
         while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            now = datetime.now(timezone.utc).timestamp()
-            if now - last_heartbeat >= HEARTBEAT_INTERVAL:
+            message = await sub.get(timeout=max(last_heartbeat + HEARTBEAT_INTERVAL - loop.time(), 0))
+            if loop.time() - last_heartbeat >= HEARTBEAT_INTERVAL:
                 yield ": ping\n\n"
-                last_heartbeat = now
-            if message and message.get("type") == "message":
-                data = message.get("data") or ""
-                ch = message.get("channel") or ""
-                if ch == channel_poi:
-                    # poi 채널: payload의 type에 따라 poi_confirmed / meetup_status_changed / poi_updated 구분
-                    try:
-                        parsed = json.loads(data)
-                        t = parsed.get("type")
-                        if t == "meetup_status_changed":
-                            event_name = "meetup_status_changed"
-                        elif t == "poi_confirmed":
-                            event_name = "poi_confirmed"
-                        else:
-                            event_name = "poi_updated"
-                    except Exception:
-                        event_name = "poi_updated"
-                else:
-                    event_name = "midpoint_updated"
-                yield f"event: {event_name}\ndata: {data}\n\n"
+                last_heartbeat = loop.time()
+            if message is None:
+                continue
+            ch, data = message
+            if replayed_until is not None:
+                event_id = _event_id_of(data)
+                parsed = _parse_stream_id(event_id) if event_id else None
+                if parsed is not None and parsed <= replayed_until:
+                    continue
+            yield _frame(ch, data, with_id)
     except asyncio.CancelledError:
         pass
     finally:
-        await pubsub.unsubscribe(channel_mid, channel_poi)
-        await pubsub.close()
+        await hub.unsubscribe(sub)
 
 
-async def stream_all_meetup_events() -> AsyncGenerator[str, None]:
+def stream_midpoint_events(meetup_id: int, last_event_id: Optional[str] = None) -> AsyncGenerator[str, None]:
     """
-    글로벌 SSE 스트림 (/meetups/stream) 용.
-    meetup:*:midpoint / meetup:*:poi 패턴을 모두 구독해 모든 모임의 이벤트를 전달.
+    GET /meetups/{id}/midpoint/stream 용.
+    midpoint + poi 채널 구독 → SSE로 전달 (id: = 모임 스트림 id). last_event_id 가 있으면 그 이후부터 재전송.
     """
-    pattern_mid = f"{CHANNEL_PREFIX}*{CHANNEL_SUFFIX}"
-    pattern_poi = f"{CHANNEL_PREFIX}*{CHANNEL_SUFFIX_POI}"
-    pubsub = redis_client.pubsub()
-    try:
-        await pubsub.psubscribe(pattern_mid, pattern_poi)
-        last_heartbeat = datetime.now(timezone.utc).timestamp()
+    return _stream_events(
+        channels=(_channel(meetup_id), _channel_poi(meetup_id)),
+        replay_meetup_id=meetup_id,
+        last_event_id=last_event_id,
+    )
 
-        while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            now = datetime.now(timezone.utc).timestamp()
-            if now - last_heartbeat >= HEARTBEAT_INTERVAL:
-                yield ": ping\n\n"
-                last_heartbeat = now
-            if message and message.get("type") in ("message", "pmessage"):
-                data = message.get("data") or ""
-                ch = message.get("channel") or ""
-                # meetup:*:poi 패턴이면 poi/상태 관련 이벤트, 아니면 midpoint_updated
-                if ch.endswith(CHANNEL_SUFFIX_POI):
-                    try:
-                        parsed = json.loads(data)
-                        t = parsed.get("type")
-                        if t == "meetup_status_changed":
-                            event_name = "meetup_status_changed"
-                        elif t == "poi_confirmed":
-                            event_name = "poi_confirmed"
-                        else:
-                            event_name = "poi_updated"
-                    except Exception:
-                        event_name = "poi_updated"
-                else:
-                    event_name = "midpoint_updated"
-                yield f"event: {event_name}\ndata: {data}\n\n"
-    except asyncio.CancelledError:
-        pass
-    finally:
-        await pubsub.punsubscribe(pattern_mid, pattern_poi)
-        await pubsub.close()
+
+def stream_all_meetup_events() -> AsyncGenerator[str, None]:
+    """
+    글로벌 SSE 스트림 (/meetups/stream) 용.
+    meetup:*:midpoint / meetup:*:poi 패턴을 모두 구독해 모든 모임의 이벤트를 전달 (모임별 스트림이라 재전송 없음).
+    """
+    return _stream_events(patterns=MEETUP_EVENT_PATTERNS)
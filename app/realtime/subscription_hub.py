@@ -0,0 +1,171 @@
+# 워커당 Redis pubsub 연결 하나를 모든 SSE 클라이언트·내부 리스너가 공유
+# - 채널/패턴별 참조 카운트: 첫 구독자가 생길 때 SUBSCRIBE, 마지막 구독자가 떠날 때 UNSUBSCRIBE
+# - 수신 태스크 하나가 blocking 으로 읽고(폴링 없음) 구독자별 asyncio.Queue 로 분배
+#   (이전: SSE 클라이언트마다 pubsub 연결 + get_message(timeout=1.0) 폴링 → 연결 수·초당 wakeup 이 클라이언트 수에 비례)
+# - 느린 구독자의 큐가 가득 차면 가장 오래된 메시지를 버림 (다른 구독자·수신 태스크를 막지 않음)
+# - Redis 끊김 시 지수 백오프 후 재연결 (redis-py 가 재연결 시 현재 채널/패턴 재구독), 끊긴 동안의 메시지는 유실
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_MAX = 256
+RECONNECT_DELAY_SEC = 1.0
+RECONNECT_DELAY_MAX_SEC = 30.0
+
+# (채널, data) — 패턴 구독이면 실제 채널명
+Message = Tuple[str, str]
+
+
+class Subscription:
+    """구독자 한 명: 받은 메시지 큐 + 구독 중인 채널/패턴."""
+
+    __slots__ = ("queue", "channels", "patterns")
+
+    def __init__(self, channels: Tuple[str, ...], patterns: Tuple[str, ...], maxsize: int) -> None:
+        self.queue: "asyncio.Queue[Message]" = asyncio.Queue(maxsize=maxsize)
+        self.channels = channels
+        self.patterns = patterns
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Message]:
+        """다음 메시지. timeout 안에 없으면 None."""
+        if timeout is None:
+            return await self.queue.get()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class SubscriptionHub:
+    def __init__(self, client: Redis) -> None:
+        self._client = client
+        self._pubsub: Any = None
+        self._reader: Optional[asyncio.Task] = None
+        self._channels: Dict[str, Set[Subscription]] = {}
+        self._patterns: Dict[str, Set[Subscription]] = {}
+        # SUBSCRIBE/UNSUBSCRIBE 명령 순서 = 참조 카운트 변경 순서 (동시 구독/해제 경합 방지)
+        self._lock = asyncio.Lock()
+        self.stats: Dict[str, int] = {"messages": 0, "delivered": 0, "dropped": 0, "reconnects": 0}
+
+    async def subscribe(
+        self,
+        channels: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        maxsize: int = SUBSCRIBER_QUEUE_MAX,
+    ) -> Subscription:
+        """채널/패턴 구독. Redis 명령은 해당 채널의 첫 구독자일 때만 전송. 실패 시 예외 (구독 상태 변경 없음)."""
+        sub = Subscription(tuple(channels), tuple(patterns), maxsize)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self._client.pubsub()
+            new_channels = [c for c in sub.channels if c not in self._channels]
+            new_patterns = [p for p in sub.patterns if p not in self._patterns]
+            if new_channels:
+                await self._pubsub.subscribe(*new_channels)
+            if new_patterns:
+                await self._pubsub.psubscribe(*new_patterns)
+            for c in sub.channels:
+                self._channels.setdefault(c, set()).add(sub)
+            for p in sub.patterns:
+                self._patterns.setdefault(p, set()).add(sub)
+            if self._reader is None or self._reader.done():
+                # pubsub 연결은 첫 subscribe 때 생기므로 수신 태스크는 그 뒤에 시작
+                self._reader = asyncio.create_task(self._read_forever())
+        return sub
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        """구독 해제. 마지막 구독자가 떠난 채널/패턴만 UNSUBSCRIBE. Redis 오류는 무시 (재연결 시 정리)."""
+        async with self._lock:
+            gone_channels = [c for c in sub.channels if self._release(self._channels, c, sub)]
+            gone_patterns = [p for p in sub.patterns if self._release(self._patterns, p, sub)]
+            if self._pubsub is None:
+                return
+            try:
+                if gone_channels:
+                    await self._pubsub.unsubscribe(*gone_channels)
+                if gone_patterns:
+                    await self._pubsub.punsubscribe(*gone_patterns)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _release(table: Dict[str, Set[Subscription]], key: str, sub: Subscription) -> bool:
+        subs = table.get(key)
+        if subs is None:
+            return False
+        subs.discard(sub)
+        if subs:
+            return False
+        del table[key]
+        return True
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        kind = message.get("type")
+        if kind == "message":
+            subs = self._channels.get(message.get("channel") or "")
+        elif kind == "pmessage":
+            subs = self._patterns.get(message.get("pattern") or "")
+        else:
+            return
+        self.stats["messages"] += 1
+        if not subs:
+            return
+        item: Message = (message.get("channel") or "", message.get("data") or "")
+        for sub in subs:
+            if sub.queue.full():
+                # 느린 구독자: 가장 오래된 메시지를 버리고 최신 유지
+                sub.queue.get_nowait()
+                self.stats["dropped"] += 1
+            sub.queue.put_nowait(item)
+            self.stats["delivered"] += 1
+
+    async def _read_forever(self) -> None:
+        delay = RECONNECT_DELAY_SEC
+        while True:
+            try:
+                # timeout=None: 메시지가 올 때까지 blocking (폴링 없음)
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                delay = RECONNECT_DELAY_SEC
+                if message:
+                    self._dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 다음 get_message 에서 재연결 + 현재 채널/패턴 재구독
+                self.stats["reconnects"] += 1
+                logger.warning("subscription hub disconnected; retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX_SEC)
+
+    async def close(self) -> None:
+        """앱 shutdown 시 수신 태스크 종료 + pubsub 연결 반납."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._channels.clear()
+        self._patterns.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        subscribers = {s for subs in self._channels.values() for s in subs}
+        subscribers.update(s for subs in self._patterns.values() for s in subs)
+        return {
+            "channels": len(self._channels),
+            "patterns": len(self._patterns),
+            "subscribers": len(subscribers),
+            **self.stats,
+        }
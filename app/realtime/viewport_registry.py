@@ -0,0 +1,275 @@
+# 글로벌 SSE 스트림(/meetups/stream?bbox=) 뷰포트 필터링
+# - 워커마다 구독자 뷰포트를 균일 격자로 보관 (뷰포트가 덮는 셀마다 등록, 너무 넓으면 wide 목록)
+# - 팬아웃 태스크 하나가 허브에서 meetup:*:midpoint / meetup:*:poi 를 받아
+#   모임 위치(meetup_locations 캐시)가 들어가는 뷰포트의 구독자 큐에만 전달
+#   (이전: 모든 클라이언트가 도시 전체 이벤트를 받음 → 송신량·클라이언트 CPU 가 전체 이벤트 수에 비례)
+# - SSE 프레임은 이벤트당 한 번만 만들어 구독자들이 공유
+# - 스트림 도중 뷰포트 변경: POST /meetups/stream/{stream_id}/viewport
+#   다른 워커가 가진 스트림이면 Redis 제어 채널(VIEWPORT_CONTROL_CHANNEL)로 전달 → 소유 워커가 반영
+
+import asyncio
+import json
+import logging
+import math
+import os
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
+
+from app.realtime.sse_pubsub import (
+    HEARTBEAT_INTERVAL,
+    MEETUP_EVENT_PATTERNS,
+    event_name_for,
+    hub,
+    meetup_id_of_channel,
+    redis_client,
+)
+from app.realtime.subscription_hub import SUBSCRIBER_QUEUE_MAX, Subscription
+from app.services.meetup_locations import get_meetup_location
+
+logger = logging.getLogger(__name__)
+
+# 격자 한 변 (도). 0.05° ≈ 5km (지도 화면 크기 수준)
+VIEWPORT_CELL_DEG = float(os.getenv("VIEWPORT_CELL_DEG", "0.05"))
+# 뷰포트가 이보다 많은 셀을 덮으면 셀 등록 대신 wide 목록 (이벤트마다 직접 비교)
+VIEWPORT_MAX_CELLS = int(os.getenv("VIEWPORT_MAX_CELLS", "256"))
+VIEWPORT_CONTROL_CHANNEL = "sse:viewport"
+FANOUT_QUEUE_MAX = 10000
+RECONNECT_DELAY_SEC = 1.0
+RECONNECT_DELAY_MAX_SEC = 30.0
+
+# (min_lat, min_lng, max_lat, max_lng)
+BBox = Tuple[float, float, float, float]
+
+
+class Viewer:
+    """뷰포트 구독자 한 명: 스트림 id + 현재 bbox + 등록된 셀 + 전달 큐."""
+
+    __slots__ = ("stream_id", "bbox", "cells", "sub")
+
+    def __init__(self, stream_id: str, bbox: BBox) -> None:
+        self.stream_id = stream_id
+        self.bbox = bbox
+        self.cells: Optional[List[Tuple[int, int]]] = None  # None 이면 wide
+        self.sub = Subscription((), (), SUBSCRIBER_QUEUE_MAX)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        min_lat, min_lng, max_lat, max_lng = self.bbox
+        return min_lat <= lat <= max_lat and min_lng <= lng <= max_lng
+
+
+class ViewportRegistry:
+    """
+    구독자 뷰포트 공간 인덱스 (워커 내, 이벤트 루프에서만 접근).
+    점(모임 위치) → 그 점을 포함하는 뷰포트의 구독자 목록.
+    """
+
+    def __init__(self, cell_deg: float = VIEWPORT_CELL_DEG, max_cells: int = VIEWPORT_MAX_CELLS) -> None:
+        self.cell_deg = cell_deg
+        self.max_cells = max_cells
+        self._viewers: Dict[str, Viewer] = {}
+        self._cells: Dict[Tuple[int, int], Set[Viewer]] = {}
+        self._wide: Set[Viewer] = set()
+
+    def __len__(self) -> int:
+        return len(self._viewers)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lng / self.cell_deg), math.floor(lat / self.cell_deg))
+
+    def _index(self, viewer: Viewer) -> None:
+        min_lat, min_lng, max_lat, max_lng = viewer.bbox
+        cx0, cy0 = self._cell(min_lat, min_lng)
+        cx1, cy1 = self._cell(max_lat, max_lng)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.max_cells:
+            viewer.cells = None
+            self._wide.add(viewer)
+            return
+        viewer.cells = [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+        for cell in viewer.cells:
+            self._cells.setdefault(cell, set()).add(viewer)
+
+    def _unindex(self, viewer: Viewer) -> None:
+        if viewer.cells is None:
+            self._wide.discard(viewer)
+            return
+        for cell in viewer.cells:
+            viewers = self._cells.get(cell)
+            if viewers is not None:
+                viewers.discard(viewer)
+                if not viewers:
+                    del self._cells[cell]
+        viewer.cells = None
+
+    def register(self, stream_id: str, bbox: BBox) -> Viewer:
+        viewer = Viewer(stream_id, _normalize(bbox))
+        self._viewers[stream_id] = viewer
+        self._index(viewer)
+        return viewer
+
+    def update(self, stream_id: str, bbox: BBox) -> bool:
+        """뷰포트 변경. 이 워커에 없는 스트림이면 False."""
+        viewer = self._viewers.get(stream_id)
+        if viewer is None:
+            return False
+        self._unindex(viewer)
+        viewer.bbox = _normalize(bbox)
+        self._index(viewer)
+        return True
+
+    def unregister(self, viewer: Viewer) -> None:
+        if self._viewers.get(viewer.stream_id) is viewer:
+            del self._viewers[viewer.stream_id]
+            self._unindex(viewer)
+
+    def match(self, lat: float, lng: float) -> List[Viewer]:
+        """(lat, lng) 를 포함하는 뷰포트의 구독자들."""
+        hits = [v for v in self._cells.get(self._cell(lat, lng), ()) if v.contains(lat, lng)]
+        hits.extend(v for v in self._wide if v.contains(lat, lng))
+        return hits
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"viewers": len(self._viewers), "cells": len(self._cells), "wide": len(self._wide)}
+
+
+def _normalize(bbox: BBox) -> BBox:
+    min_lat, min_lng, max_lat, max_lng = bbox
+    lat_lo, lat_hi = sorted((min_lat, max_lat))
+    lng_lo, lng_hi = sorted((min_lng, max_lng))
+    return lat_lo, lng_lo, lat_hi, lng_hi
+
+
+registry = ViewportRegistry()
+_task: Optional[asyncio.Task] = None
+stats: Dict[str, int] = {"events": 0, "delivered": 0, "dropped": 0, "unlocated": 0, "control": 0}
+
+
+def _deliver(viewer: Viewer, frame: str) -> None:
+    queue = viewer.sub.queue
+    if queue.full():
+        # 느린 구독자: 가장 오래된 프레임을 버리고 최신 유지 (SubscriptionHub 와 동일)
+        queue.get_nowait()
+        stats["dropped"] += 1
+    queue.put_nowait(("", frame))
+    stats["delivered"] += 1
+
+
+def _apply_control(data: str) -> None:
+    try:
+        msg = json.loads(data)
+        bbox = tuple(float(v) for v in msg["bbox"])
+        stream_id = str(msg["stream_id"])
+    except Exception:
+        return
+    if len(bbox) == 4 and registry.update(stream_id, bbox):  # type: ignore[arg-type]
+        stats["control"] += 1
+
+
+async def _fan_out(channel: str, data: str) -> None:
+    if channel == VIEWPORT_CONTROL_CHANNEL:
+        _apply_control(data)
+        return
+    stats["events"] += 1
+    if not len(registry):
+        return  # 뷰포트 구독자가 없으면 위치 조회 생략
+    meetup_id = meetup_id_of_channel(channel)
+    location = await get_meetup_location(meetup_id) if meetup_id is not None else None
+    if location is None:
+        stats["unlocated"] += 1
+        return
+    viewers = registry.match(*location)
+    if not viewers:
+        return
+    frame = f"event: {event_name_for(channel, data)}\ndata: {data}\n\n"
+    for viewer in viewers:
+        _deliver(viewer, frame)
+
+
+async def _run() -> None:
+    """허브 구독(이벤트 패턴 + 제어 채널) 후 blocking 수신. 최초 구독 실패는 지수 백오프로 재시도."""
+    delay = RECONNECT_DELAY_SEC
+    while True:
+        try:
+            sub = await hub.subscribe(
+                channels=(VIEWPORT_CONTROL_CHANNEL,),
+                patterns=MEETUP_EVENT_PATTERNS,
+                maxsize=FANOUT_QUEUE_MAX,
+            )
+            break
+        except Exception:
+            logger.warning("viewport fan-out subscribe failed; retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX_SEC)
+    try:
+        while True:
+            channel, data = await sub.get()  # type: ignore[misc]
+            try:
+                await _fan_out(channel, data)
+            except Exception:
+                # 위치 조회(DB) 실패 등: 해당 이벤트만 건너뜀
+                logger.warning("viewport fan-out failed: %s", channel, exc_info=True)
+    finally:
+        await hub.unsubscribe(sub)
+
+
+def start_viewport_fanout() -> None:
+    """앱 startup 에서 호출 (워커당 1개)."""
+    global _task
+    if _task is not None and not _task.done():
+        return
+    _task = asyncio.create_task(_run())
+
+
+async def stop_viewport_fanout() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+async def stream_viewport_events(bbox: BBox) -> AsyncGenerator[str, None]:
+    """
+    GET /meetups/stream?bbox= 용.
+    첫 프레임 stream_opened 로 stream_id 전달 (뷰포트 변경 시 사용), 이후 뷰포트 안 모임 이벤트만 전달.
+    메시지가 없으면 HEARTBEAT_INTERVAL 마다 ": ping". 연결 해제 시 레지스트리에서 제거.
+    """
+    viewer = registry.register(uuid.uuid4().hex, bbox)
+    loop = asyncio.get_running_loop()
+    try:
+        yield f'event: stream_opened\ndata: {{"stream_id": "{viewer.stream_id}"}}\n\n'
+        last_heartbeat = loop.time()
+        while True:
+            message = await viewer.sub.get(timeout=max(last_heartbeat + HEARTBEAT_INTERVAL - loop.time(), 0))
+            if loop.time() - last_heartbeat >= HEARTBEAT_INTERVAL:
+                yield ": ping\n\n"
+                last_heartbeat = loop.time()
+            if message is not None:
+                yield message[1]
+    except asyncio.CancelledError:
+        pass
+    finally:
+        registry.unregister(viewer)
+
+
+async def update_viewport(stream_id: str, bbox: BBox) -> bool:
+    """
+    스트림 뷰포트 변경. 이 워커의 스트림이면 바로 반영, 아니면 제어 채널로 전달 (소유 워커가 반영).
+    제어 채널 발행 실패(Redis 오류) 시 False.
+    """
+    if registry.update(stream_id, bbox):
+        return True
+    try:
+        await redis_client.publish(
+            VIEWPORT_CONTROL_CHANNEL, json.dumps({"stream_id": stream_id, "bbox": list(bbox)})
+        )
+    except Exception:
+        return False
+    return True
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"running": _task is not None and not _task.done(), **registry.get_stats(), **stats}
@@ -1,49 +1,89 @@
 # 모임 생성/조회 API
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from geoalchemy2 import WKTElement
 from geoalchemy2.shape import to_shape
+from pydantic import TypeAdapter
 from shapely.geometry import Point
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.meetup_crud import get_meetups_in_bbox
+from app.crud.meetup_crud import (
+    BboxCursor,
+    current_sync_xmin,
+    decode_bbox_cursor,
+    decode_sync_cursor,
+    encode_bbox_cursor,
+    encode_sync_cursor,
+    get_meetup_tile,
+    get_meetups_changed_in_bbox,
+    get_meetups_in_bbox,
+    get_meetups_in_radius,
+)
 from app.crud.participation_crud import (
     JoinError,
     LeaveError,
     join_meetup,
+    join_meetup_bulk,
     leave_meetup,
     recalculate_midpoint,
 )
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.meetup import Meetup, MeetupStatus
 from app.models.participation import Participation
+from app.realtime import outbox
 from app.realtime.sse_pubsub import (
-    publish_midpoint_update,
-    publish_meetup_status_changed,
-    publish_poi_confirmed,
+    meetup_status_changed_event,
+    midpoint_event,
+    poi_confirmed_event,
     stream_midpoint_events,
     stream_all_meetup_events,
 )
+from app.realtime.viewport_registry import stream_viewport_events, update_viewport
 from app.schemas.meetup import (
     ConfirmPoiBody,
     ConfirmedPoiOut,
     ConfirmedPoiSchema,
+    MeetupBboxDeltaOut,
+    MeetupCategoryLiteral,
+    MeetupClusterOut,
+    MeetupHeatmapCellOut,
     MeetupCreate,
     MeetupDetailOut,
     MeetupResponse,
     MeetupStatusLiteral,
     MidpointOut,
 )
-from app.schemas.participation import JoinBody, JoinLeaveBody
+from app.schemas.participation import JoinBody, JoinBulkBody, JoinBulkOut, JoinLeaveBody
+from app.services import bbox_cache, midpoint_coalescer, seat_admission
+from app.services.heatmap import HEATMAP_MAX_PRECISION, get_heatmap
+from app.services.map_cluster import get_clusters
+from app.services.meetup_index import MEETUP_INDEX_ENABLED, meetup_index
+from app.services.meetup_locations import remember_meetup_location
 from app.services.meetup_status import check_status_transition
+from app.services.midpoint_strategy import resolve_strategy
 from app.services.poi_service import get_pois_for_meetup
+from app.services.tile_cache import (
+    TILE_BUFFER,
+    TILE_EXTENT,
+    get_cached_tile,
+    invalidate_tiles_at,
+    set_cached_tile,
+)
 
 router = APIRouter(prefix="/meetups", tags=["Meetups"])
 
+# /bbox 응답 상한: 밀집 지역에서도 응답 크기·메모리가 일정하도록 limit 강제
+BBOX_DEFAULT_LIMIT = 200
+BBOX_MAX_LIMIT = 500
+
+# 캐시 저장용 직렬화 (응답 검증 없이 바로 JSON bytes)
+_MEETUP_LIST_ADAPTER = TypeAdapter(List[MeetupResponse])
+
 
 def _midpoint_to_dict(meetup: Meetup) -> Optional[Dict[str, float]]:
     """midpoint Geometry → {lat, lng} 또는 None (SSE/Redis 발행용)."""
@@ -87,6 +127,23 @@ def _confirmed_poi_out(meetup: Meetup) -> Optional[ConfirmedPoiOut]:
     )
 
 
+def _add_midpoint_event(
+    db: Union[Session, AsyncSession],
+    meetup_id: int,
+    midpoint: Optional[Tuple[float, float]],
+    current_count: int,
+) -> None:
+    """join/leave 결과 midpoint_updated 이벤트를 현재 트랜잭션의 outbox 에 추가."""
+    outbox.add_event(
+        db,
+        midpoint_event(
+            meetup_id,
+            {"lat": midpoint[0], "lng": midpoint[1]} if midpoint is not None else None,
+            current_count,
+        ),
+    )
+
+
 def _host_user_id_for_meetup(db: Session, meetup_id: int) -> Optional[int]:
     """모임 생성 시 첫 참여자(호스트 자동 참가)의 user_id. 없으면 None."""
     row = (
@@ -111,6 +168,17 @@ def _status_to_literal(meetup: Meetup) -> MeetupStatusLiteral:
     return raw  # type: ignore[return-value]
 
 
+def _parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    """bbox 쿼리 문자열 "min_lat,min_lng,max_lat,max_lng" → 튜플. 형식/범위 오류 시 400."""
+    try:
+        min_lat, min_lng, max_lat, max_lng = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be 'min_lat,min_lng,max_lat,max_lng'")
+    if not all(-90 <= v <= 90 for v in (min_lat, max_lat)) or not all(-180 <= v <= 180 for v in (min_lng, max_lng)):
+        raise HTTPException(status_code=400, detail="bbox coordinates out of range")
+    return min_lat, min_lng, max_lat, max_lng
+
+
 def _meetup_to_response(meetup: Meetup, distance_km: float | None = None) -> MeetupResponse:
     """location(Point)에서 lat/lng 추출해 MeetupResponse 생성. distance_km는 nearby 전용."""
     if meetup.location is None:
@@ -136,8 +204,12 @@ def _meetup_to_response(meetup: Meetup, distance_km: float | None = None) -> Mee
 
 
 @router.post("", response_model=MeetupResponse)
-def create_meetup(body: MeetupCreate, db: Session = Depends(get_db)) -> MeetupResponse:
-    """모임 생성. lat/lng → PostGIS POINT(4326) 저장."""
+def create_meetup(
+    body: MeetupCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> MeetupResponse:
+    """모임 생성. lat/lng → PostGIS POINT(4326) 저장. 응답 후 해당 위치 타일 캐시 무효화."""
     pt = Point(body.lng, body.lat)
     location = WKTElement(pt.wkt, srid=4326)
     meetup = Meetup(
@@ -147,6 +219,7 @@ def create_meetup(body: MeetupCreate, db: Session = Depends(get_db)) -> MeetupRe
         capacity=body.capacity,
         location=location,
         current_count=1,
+        midpoint_strategy=body.midpoint_strategy,
     )
     db.add(meetup)
     db.flush()  # meetup.id 확보를 위해 flush
@@ -161,7 +234,13 @@ def create_meetup(body: MeetupCreate, db: Session = Depends(get_db)) -> MeetupRe
 
     db.commit()
     db.refresh(meetup)
-    return _meetup_to_response(meetup)
+    remember_meetup_location(meetup.id, body.lat, body.lng)
+    response = _meetup_to_response(meetup)
+    if MEETUP_INDEX_ENABLED:
+        meetup_index.upsert(response, meetup.created_at)
+    background_tasks.add_task(invalidate_tiles_at, body.lat, body.lng)
+    background_tasks.add_task(bbox_cache.invalidate_at, body.lat, body.lng)
+    return response
 
 
 @router.get("/nearby", response_model=List[MeetupResponse])
@@ -172,41 +251,218 @@ def get_meetups_nearby(
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> List[MeetupResponse]:
-    """사용자 좌표 기준 반경 내 모임 검색. distance_km 포함, 가까운 순 정렬."""
-    pt = Point(lng, lat)
-    user_geog = func.ST_GeogFromText(f"SRID=4326;{pt.wkt}")
-    radius_m = radius_km * 1000
-    loc_geog = func.ST_GeogFromText(func.ST_AsText(Meetup.location))
-    distance_m = func.ST_Distance(loc_geog, user_geog)  # geography → 미터
-
-    q = (
-        db.query(Meetup, distance_m.label("distance_m"))
-        .filter(func.ST_DWithin(loc_geog, user_geog, radius_m))
-        .order_by(distance_m)
-        .limit(limit)
+    """사용자 좌표 기준 반경 내 모임 검색. distance_km 포함, 가까운 순 정렬. (projection 행 → 응답 직접 매핑)"""
+    rows = get_meetups_in_radius(db, lat, lng, radius_km * 1000, limit)
+    return [MeetupResponse.from_row(r, distance_km=round(r.distance_m / 1000.0, 6)) for r in rows]
+
+
+def _bbox_from_db(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    status: Optional[List[str]],
+    category: Optional[List[str]],
+    limit: int,
+    keyset: Optional[BboxCursor],
+) -> Tuple[List[MeetupResponse], Optional[str], str]:
+    """
+    DB bbox 조회 (limit+1 조회로 다음 페이지 판단, projection 행 → 응답 직접 매핑).
+    반환: (응답 목록, 다음 커서, 동기화 커서). 동기화 커서는 조회 전 스냅샷 xmin.
+    """
+    sync_cursor = encode_sync_cursor(current_sync_xmin(db))
+    meetups = get_meetups_in_bbox(
+        db, min_lat, min_lng, max_lat, max_lng,
+        statuses=status, categories=category, limit=limit + 1, cursor=keyset,
     )
-    rows = q.all()
-    return [_meetup_to_response(m, distance_km=round(d / 1000.0, 6)) for m, d in rows]
-
-
-@router.get("/bbox", response_model=List[MeetupResponse])
-def get_meetups_bbox(
+    next_cursor = None
+    if len(meetups) > limit:
+        meetups = meetups[:limit]
+        last = meetups[-1]
+        next_cursor = encode_bbox_cursor(last.created_at, last.id)
+    return [MeetupResponse.from_row(r) for r in meetups], next_cursor, sync_cursor
+
+
+def _bbox_delta_from_db(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    since_xid: int,
+    status: Optional[List[str]],
+    category: Optional[List[str]],
+) -> MeetupBboxDeltaOut:
+    """
+    since_xid 이후 변경분만 조회. 필터에 맞으면 upserted, 벗어났으면 removed.
+    다음 커서는 조회 전 스냅샷 xmin → 조회 시점에 진행 중이던 트랜잭션의 변경은 다음 요청에서 다시 포함
+    (이미 받은 행이 겹칠 수 있으나 클라이언트는 id 기준 덮어쓰기).
+    """
+    cursor = encode_sync_cursor(current_sync_xmin(db))
+    rows = get_meetups_changed_in_bbox(
+        db, min_lat, min_lng, max_lat, max_lng, since_xid, BBOX_MAX_LIMIT + 1,
+    )
+    if len(rows) > BBOX_MAX_LIMIT:
+        return MeetupBboxDeltaOut(upserted=[], removed=[], cursor=cursor, reset=True)
+    upserted: List[MeetupResponse] = []
+    removed: List[int] = []
+    for r in rows:
+        if (status and r.status not in status) or (category and r.category not in category):
+            removed.append(r.id)
+        else:
+            upserted.append(MeetupResponse.from_row(r))
+    return MeetupBboxDeltaOut(upserted=upserted, removed=removed, cursor=cursor)
+
+
+@router.get("/bbox", response_model=Union[List[MeetupResponse], MeetupBboxDeltaOut])
+async def get_meetups_bbox(
+    response: Response,
     min_lat: float = Query(..., ge=-90, le=90),
     min_lng: float = Query(..., ge=-180, le=180),
     max_lat: float = Query(..., ge=-90, le=90),
     max_lng: float = Query(..., ge=-180, le=180),
+    status: Optional[List[MeetupStatusLiteral]] = Query(None, description="상태 필터 (반복 지정 가능, 미지정 시 전체). 지도는 RECRUITING 만 지정 → 부분 인덱스/인메모리 인덱스 사용"),
+    category: Optional[List[MeetupCategoryLiteral]] = Query(None, description="카테고리 필터 (반복 지정 가능)"),
+    limit: int = Query(BBOX_DEFAULT_LIMIT, ge=1, le=BBOX_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    zoom: Optional[int] = Query(None, ge=0, le=22, description="지정 시 줌별 격자로 bbox를 스냅해 응답 캐시 사용"),
+    since: Optional[str] = Query(None, description="이전 응답의 X-Sync-Cursor (또는 증분 응답의 cursor) 값"),
     db: Session = Depends(get_db),
-) -> List[MeetupResponse]:
-    """지도 BBox(사각형) 영역 내 모임 조회. min/max 뒤바뀌어 와도 보정. created_at 내림차순."""
-    meetups = get_meetups_in_bbox(db, min_lat, min_lng, max_lat, max_lng)
-    return [_meetup_to_response(m) for m in meetups]
+) -> Union[List[MeetupResponse], MeetupBboxDeltaOut]:
+    """
+    지도 BBox(사각형) 영역 내 모임 조회. min/max 뒤바뀌어 와도 보정. (created_at, id) 내림차순.
+    status/category 필터, limit 상한, keyset 커서 페이지네이션. 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 전달.
+    zoom 지정 + 첫 페이지면 bbox를 격자 셀 경계로 넓혀(스냅) Redis 캐시에서 응답 (X-Cache: HIT/MISS).
+    zoom 지정 시 cursor 다음 페이지도 같은 스냅 bbox 로 조회 (캐시 없이) → 페이지마다 범위가 달라지지 않음.
+    전체 응답에는 X-Sync-Cursor 헤더 포함 → since 로 넘기면 그 이후 변경분만 MeetupBboxDeltaOut 으로 반환.
+    """
+    if since:
+        try:
+            since_xid = decode_sync_cursor(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since cursor")
+        return await run_in_threadpool(
+            _bbox_delta_from_db, db, min_lat, min_lng, max_lat, max_lng, since_xid, status, category,
+        )
+
+    keyset = None
+    if cursor:
+        try:
+            keyset = decode_bbox_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if MEETUP_INDEX_ENABLED and meetup_index.ready and status == ["RECRUITING"]:
+        # 모집 중 모임만 요청 → 워커 인메모리 인덱스에서 응답 (DB 미접근)
+        hits = meetup_index.query_bbox(
+            min_lat, min_lng, max_lat, max_lng, categories=category, limit=limit + 1, cursor=keyset,
+        )
+        if len(hits) > limit:
+            hits = hits[:limit]
+            last, last_created_at = hits[-1]
+            response.headers["X-Next-Cursor"] = encode_bbox_cursor(last_created_at, last.id)
+        # 인덱스는 마지막 DB 적재·정합성 검사 시점까지의 변경을 보장 → 그 적재 전 스냅샷 xmin 을 동기화 기준으로
+        response.headers["X-Sync-Cursor"] = encode_sync_cursor(meetup_index.sync_xmin)
+        return [resp for resp, _ in hits]
+
+    quantized = None
+    if zoom is not None:
+        quantized = bbox_cache.quantize_bbox(min_lat, min_lng, max_lat, max_lng, zoom)
+    if quantized is not None and keyset is None:
+        cells, snapped = quantized
+        key = bbox_cache.cache_key(zoom, cells, status, category, limit)
+        cached, gens = await bbox_cache.get_cached(key, zoom, cells)
+        if cached is not None:
+            headers = {"X-Cache": "HIT", "X-Sync-Cursor": cached.get("sync_cursor", "")}
+            if cached.get("next_cursor"):
+                headers["X-Next-Cursor"] = cached["next_cursor"]
+            return Response(content=cached["body"], media_type="application/json", headers=headers)
+        items, next_cursor, sync_cursor = await run_in_threadpool(
+            _bbox_from_db, db, *snapped, status, category, limit, None,
+        )
+        body = _MEETUP_LIST_ADAPTER.dump_json(items).decode()
+        await bbox_cache.set_cached(key, zoom, cells, gens, body, next_cursor, sync_cursor)
+        headers = {"X-Cache": "MISS", "X-Sync-Cursor": sync_cursor}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return Response(content=body, media_type="application/json", headers=headers)
+    if quantized is not None:
+        # 스냅된 첫 페이지의 X-Next-Cursor 로 이어 받는 요청: 모든 페이지가 같은 bbox 를 덮도록 같은 스냅 bbox 로 조회
+        # (다음 페이지는 캐시하지 않음)
+        min_lat, min_lng, max_lat, max_lng = quantized[1]
+
+    items, next_cursor, sync_cursor = await run_in_threadpool(
+        _bbox_from_db, db, min_lat, min_lng, max_lat, max_lng, status, category, limit, keyset,
+    )
+    response.headers["X-Sync-Cursor"] = sync_cursor
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+@router.get("/clusters", response_model=List[MeetupClusterOut])
+def get_meetups_clusters(
+    bbox: str = Query(..., description="min_lat,min_lng,max_lat,max_lng"),
+    zoom: int = Query(..., ge=0, le=22),
+    db: Session = Depends(get_db),
+) -> List[MeetupClusterOut]:
+    """지도 클러스터 (서버 집계). 확장 줌 미만은 격자별 개수, 이상은 개별 모임 마커."""
+    min_lat, min_lng, max_lat, max_lng = _parse_bbox(bbox)
+    return get_clusters(db, min_lat, min_lng, max_lat, max_lng, zoom)
+
+
+@router.get("/heatmap", response_model=List[MeetupHeatmapCellOut])
+def get_meetups_heatmap(
+    bbox: str = Query(..., description="min_lat,min_lng,max_lat,max_lng"),
+    precision: Optional[int] = Query(
+        None, ge=1, le=HEATMAP_MAX_PRECISION, description="geohash 자릿수 (미지정 시 bbox 크기로 자동 선택)"
+    ),
+    db: Session = Depends(get_db),
+) -> List[MeetupHeatmapCellOut]:
+    """지도 heatmap: geohash 셀별 모임 수 (status/category 분해). geometry 없이 geohash 인덱스로 집계."""
+    min_lat, min_lng, max_lat, max_lng = _parse_bbox(bbox)
+    return get_heatmap(db, min_lat, min_lng, max_lat, max_lng, precision)
+
+
+@router.get("/tiles/{z}/{x}/{y}.pbf")
+async def get_meetups_tile(
+    z: int,
+    x: int,
+    y: int,
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    모임 Mapbox Vector Tile (layer: meetups, 속성: id/status/category).
+    Redis 캐시 (z,x,y) → 미스 시 PostGIS ST_AsMVT로 생성. 상태 변경 이벤트로 해당 타일만 무효화.
+    """
+    if not (0 <= z <= 22) or not (0 <= x < 2 ** z) or not (0 <= y < 2 ** z):
+        raise HTTPException(status_code=400, detail="Invalid tile coordinates")
+    tile, gen = await get_cached_tile(z, x, y)
+    if tile is None:
+        # 동기 DB 호출은 스레드풀에서 (SSE 등 이벤트 루프 블로킹 방지)
+        tile = await run_in_threadpool(get_meetup_tile, db, z, x, y, "meetups", TILE_EXTENT, TILE_BUFFER)
+        await set_cached_tile(z, x, y, gen, tile)
+    return Response(
+        content=tile,
+        media_type="application/vnd.mapbox-vector-tile",
+        headers={"Cache-Control": "public, max-age=60"},
+    )
 
 
 @router.get("/stream")
-async def get_meetups_stream():
-    """SSE: 모든 meetups의 midpoint/poi/status 이벤트 글로벌 스트림."""
+async def get_meetups_stream(
+    bbox: Optional[str] = Query(None, description="min_lat,min_lng,max_lat,max_lng — 지정 시 화면 안 모임 이벤트만"),
+):
+    """
+    SSE: meetups의 midpoint/poi/status 이벤트 글로벌 스트림.
+    bbox 지정 시 모임 위치가 뷰포트 안인 이벤트만 전달, 첫 이벤트 stream_opened 의 stream_id 로
+    POST /meetups/stream/{stream_id}/viewport 를 호출해 스트림을 끊지 않고 뷰포트 변경.
+    bbox 가 없으면 모든 모임의 이벤트 (기존 동작).
+    """
+    events = stream_viewport_events(_parse_bbox(bbox)) if bbox else stream_all_meetup_events()
     return StreamingResponse(
-        stream_all_meetup_events(),
+        events,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -216,6 +472,17 @@ async def get_meetups_stream():
     )
 
 
+@router.post("/stream/{stream_id}/viewport", status_code=204)
+async def update_meetups_stream_viewport(
+    stream_id: str,
+    bbox: str = Query(..., description="min_lat,min_lng,max_lat,max_lng"),
+) -> Response:
+    """글로벌 스트림(bbox 지정)의 뷰포트 변경. 스트림이 다른 워커에 있으면 Redis 제어 채널로 전달."""
+    if not await update_viewport(stream_id, _parse_bbox(bbox)):
+        raise HTTPException(status_code=503, detail="Viewport update unavailable")
+    return Response(status_code=204)
+
+
 @router.get("/{meetup_id}", response_model=MeetupDetailOut)
 def get_meetup(
     meetup_id: int,
@@ -256,6 +523,7 @@ def get_meetup(
         lat=shape.y,
         lng=shape.x,
         midpoint=_midpoint_to_out(meetup),
+        midpoint_strategy=resolve_strategy(meetup.midpoint_strategy, meetup.category),
         confirmed_poi=_confirmed_poi_out(meetup),
         distance_km=None,
         is_participating=is_participating,
@@ -264,50 +532,111 @@ def get_meetup(
 
 
 @router.post("/{meetup_id}/join")
-async def post_join(meetup_id: int, body: JoinBody, db: Session = Depends(get_db)):
-    """모임 참여. lat/lng는 approx에 저장되어 중간지점 계산에 사용. 예외 시 rollback."""
+async def post_join(meetup_id: int, body: JoinBody, db: AsyncSession = Depends(get_async_db)):
+    """
+    모임 참여. lat/lng는 approx에 저장되어 중간지점 계산에 사용. 예외 시 rollback.
+    SEAT_ADMISSION_ENABLED 면 Redis 좌석 예약 후 진행 (만석이면 DB 접근 없이 400, DB 실패 시 예약 반환).
+    """
+    reserved = False
+    if seat_admission.SEAT_ADMISSION_ENABLED:
+        admitted = await seat_admission.reserve_seat(meetup_id)
+        if admitted is False:
+            raise HTTPException(status_code=400, detail="Meetup is full (capacity reached)")
+        reserved = admitted is True
     try:
-        current_count = join_meetup(db, meetup_id, body.user_id, body.lat, body.lng)
-        db.commit()  # ✅ 트랜잭션 소유권: 라우터
-        # commit 후 midpoint 갱신 → SSE 구독자에게 실시간 푸시
-        meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
-        if meetup:
-            await publish_midpoint_update(meetup_id, _midpoint_to_dict(meetup), meetup.current_count)
+        current_count, midpoint = await db.run_sync(join_meetup, meetup_id, body.user_id, body.lat, body.lng)
+        if not midpoint_coalescer.COALESCE_ENABLED:
+            # midpoint_updated 를 같은 트랜잭션의 outbox 에 기록 → relay 가 발행 (crud 반환값 사용, 재조회 없음)
+            _add_midpoint_event(db, meetup_id, midpoint, current_count)
+        await db.commit()  # ✅ 트랜잭션 소유권: 라우터
+        reserved = False  # 예약 좌석 확정
+        if midpoint_coalescer.COALESCE_ENABLED:
+            # 병합 모드: 창(MIDPOINT_COALESCE_MS)마다 한 번 재계산·발행
+            await midpoint_coalescer.mark_midpoint_dirty(meetup_id)
+        else:
+            outbox.notify()
         return {"message": "joined", "current_count": current_count}
 
     except JoinError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
     except Exception:
-        db.rollback()
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to join meetup")
+
+    finally:
+        if reserved:
+            await seat_admission.release_seat(meetup_id)
+
+
+@router.post("/{meetup_id}/join/bulk", response_model=JoinBulkOut)
+async def post_join_bulk(meetup_id: int, body: JoinBulkBody, db: AsyncSession = Depends(get_async_db)):
+    """
+    일괄 참여 (호스트가 일행 초대). 한 트랜잭션에서 남은 좌석을 요청 순서대로 배정하고
+    midpoint 재계산·발행은 배치당 1회. 사용자별 결과는 results 로 반환 (일부 실패해도 200).
+    """
+    try:
+        current_count, midpoint, results = await db.run_sync(
+            join_meetup_bulk, meetup_id, [(m.user_id, m.lat, m.lng) for m in body.members]
+        )
+        joined = sum(1 for _, status in results if status == "joined")
+        if joined and not midpoint_coalescer.COALESCE_ENABLED:
+            _add_midpoint_event(db, meetup_id, midpoint, current_count)
+        await db.commit()  # ✅ 트랜잭션 소유권: 라우터
+        if joined:
+            if seat_admission.SEAT_ADMISSION_ENABLED:
+                # Redis 좌석 카운터를 거치지 않았으므로 다음 join 때 DB에서 재시드
+                await seat_admission.reset_seats(meetup_id)
+            if midpoint_coalescer.COALESCE_ENABLED:
+                await midpoint_coalescer.mark_midpoint_dirty(meetup_id)
+            else:
+                outbox.notify()
+        return {
+            "message": "joined",
+            "current_count": current_count,
+            "joined": joined,
+            "results": [{"user_id": user_id, "status": status} for user_id, status in results],
+        }
+
+    except JoinError as e:
+        await db.rollback()
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    except Exception:
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to join meetup")
 
 
 @router.delete("/{meetup_id}/leave")
-async def delete_leave(meetup_id: int, body: JoinLeaveBody, db: Session = Depends(get_db)):
+async def delete_leave(meetup_id: int, body: JoinLeaveBody, db: AsyncSession = Depends(get_async_db)):
     """모임 참여 취소. 예외 시 rollback."""
     try:
-        current_count = leave_meetup(db, meetup_id, body.user_id)
-        db.commit()  # ✅ 트랜잭션 소유권: 라우터
-        # commit 후 midpoint 갱신 → SSE 구독자에게 실시간 푸시
-        meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
-        if meetup:
-            await publish_midpoint_update(meetup_id, _midpoint_to_dict(meetup), meetup.current_count)
+        current_count, midpoint = await db.run_sync(leave_meetup, meetup_id, body.user_id)
+        if not midpoint_coalescer.COALESCE_ENABLED:
+            _add_midpoint_event(db, meetup_id, midpoint, current_count)
+        await db.commit()  # ✅ 트랜잭션 소유권: 라우터
+        if seat_admission.SEAT_ADMISSION_ENABLED:
+            await seat_admission.release_seat(meetup_id)
+        if midpoint_coalescer.COALESCE_ENABLED:
+            # 병합 모드: 창(MIDPOINT_COALESCE_MS)마다 한 번 재계산·발행
+            await midpoint_coalescer.mark_midpoint_dirty(meetup_id)
+        else:
+            outbox.notify()
         return {"message": "left", "current_count": current_count}
 
     except LeaveError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to leave meetup")
 
 
 @router.post("/{meetup_id}/midpoint/recalculate")
 def post_recalculate_midpoint(meetup_id: int, db: Session = Depends(get_db)):
-    """중간지점 수동 재계산. 참여자들의 approx_lat/lng 중앙값으로 계산."""
+    """중간지점 수동 재계산. 참여자들의 approx_lat/lng 로 모임의 midpoint 전략에 따라 계산."""
     meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
     if meetup is None:
         raise HTTPException(status_code=404, detail="Meetup not found")
@@ -335,10 +664,10 @@ def post_recalculate_midpoint(meetup_id: int, db: Session = Depends(get_db)):
 async def post_confirm_poi(
     meetup_id: int,
     body: ConfirmPoiBody,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """호스트가 선택한 POI를 확정 저장 후 status=CONFIRMED, 실시간 이벤트 발행. 상태 전이: RECRUITING → CONFIRMED 만 허용."""
-    meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
+    meetup = await db.get(Meetup, meetup_id)
     if meetup is None:
         raise HTTPException(status_code=404, detail="모임을 찾을 수 없습니다.")
     current_status = _status_to_literal(meetup)
@@ -352,17 +681,18 @@ async def post_confirm_poi(
         meetup.confirmed_poi_address = body.address
         meetup.confirmed_at = datetime.now(timezone.utc)
         meetup.status = MeetupStatus.CONFIRMED.value
-        db.commit()
-        db.refresh(meetup)
-        # commit 성공 후 Redis 발행: poi_confirmed + meetup_status_changed (SSE 구독자에게 전달)
         poi_payload = {
-            "name": meetup.confirmed_poi_name,
-            "lat": meetup.confirmed_poi_lat,
-            "lng": meetup.confirmed_poi_lng,
-            "address": meetup.confirmed_poi_address or "",
+            "name": body.name,
+            "lat": body.lat,
+            "lng": body.lng,
+            "address": body.address or "",
         }
-        await publish_poi_confirmed(meetup_id, poi_payload)
-        await publish_meetup_status_changed(meetup_id, MeetupStatus.CONFIRMED.value)
+        # poi_confirmed + meetup_status_changed 를 같은 트랜잭션의 outbox 에 기록 (commit 되면 relay 가 발행)
+        outbox.add_event(db, poi_confirmed_event(meetup_id, poi_payload))
+        outbox.add_event(db, meetup_status_changed_event(meetup_id, MeetupStatus.CONFIRMED.value))
+        await db.commit()
+        await db.refresh(meetup)
+        outbox.notify()
         return {
             "message": "POI가 확정되었습니다.",
             "poi": poi_payload,
@@ -370,14 +700,14 @@ async def post_confirm_poi(
             "status": MeetupStatus.CONFIRMED.value,
         }
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="POI 확정 처리에 실패했습니다.")
 
 
 @router.post("/{meetup_id}/finish")
-async def post_finish_meetup(meetup_id: int, db: Session = Depends(get_db)):
+async def post_finish_meetup(meetup_id: int, db: AsyncSession = Depends(get_async_db)):
     """모임 종료. CONFIRMED → FINISHED 만 허용. DB 반영 후 meetup_status_changed 발행."""
-    meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
+    meetup = await db.get(Meetup, meetup_id)
     if meetup is None:
         raise HTTPException(status_code=404, detail="Meetup not found")
     current_status = _status_to_literal(meetup)
@@ -386,19 +716,20 @@ async def post_finish_meetup(meetup_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=409, detail=err)
     try:
         meetup.status = "FINISHED"
-        db.commit()
-        db.refresh(meetup)
-        await publish_meetup_status_changed(meetup_id, "FINISHED")
+        outbox.add_event(db, meetup_status_changed_event(meetup_id, "FINISHED"))
+        await db.commit()
+        await db.refresh(meetup)
+        outbox.notify()
         return {"message": "Meetup finished.", "status": "FINISHED"}
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to finish meetup")
 
 
 @router.post("/{meetup_id}/cancel")
-async def post_cancel_meetup(meetup_id: int, db: Session = Depends(get_db)):
+async def post_cancel_meetup(meetup_id: int, db: AsyncSession = Depends(get_async_db)):
     """모임 취소. RECRUITING → CANCELED 만 허용. DB 반영 후 meetup_status_changed 발행."""
-    meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
+    meetup = await db.get(Meetup, meetup_id)
     if meetup is None:
         raise HTTPException(status_code=404, detail="Meetup not found")
     current_status = _status_to_literal(meetup)
@@ -407,12 +738,13 @@ async def post_cancel_meetup(meetup_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=409, detail=err)
     try:
         meetup.status = "CANCELED"
-        db.commit()
-        db.refresh(meetup)
-        await publish_meetup_status_changed(meetup_id, "CANCELED")
+        outbox.add_event(db, meetup_status_changed_event(meetup_id, "CANCELED"))
+        await db.commit()
+        await db.refresh(meetup)
+        outbox.notify()
         return {"message": "Meetup canceled.", "status": "CANCELED"}
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to cancel meetup")
 
 
@@ -420,10 +752,10 @@ async def post_cancel_meetup(meetup_id: int, db: Session = Depends(get_db)):
 async def get_meetup_pois(
     meetup_id: int,
     force: bool = Query(False, description="true면 갱신 제한 무시하고 Kakao 재조회"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """중간지점 기준 주변 POI 추천 (Kakao Local). Redis 캐시·갱신 제한 적용. force=true 시 강제 갱신."""
-    meetup = db.query(Meetup).filter(Meetup.id == meetup_id).first()
+    meetup = await db.get(Meetup, meetup_id)
     if meetup is None:
         raise HTTPException(status_code=404, detail="모임을 찾을 수 없습니다.")
     midpoint_dict = _midpoint_to_dict(meetup)
@@ -445,10 +777,19 @@ async def get_meetup_pois(
 
 
 @router.get("/{meetup_id}/midpoint/stream")
-async def get_midpoint_stream(meetup_id: int):
-    """SSE: 해당 모임의 midpoint/poi 갱신 이벤트 실시간 스트림 (midpoint_updated, poi_updated)."""
+async def get_midpoint_stream(
+    meetup_id: int,
+    last_event_id: Optional[str] = Query(None, description="마지막으로 받은 이벤트 id (EventSource 재생성 시)"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    SSE: 해당 모임의 midpoint/poi 갱신 이벤트 실시간 스트림 (midpoint_updated, poi_updated).
+    이벤트마다 id: 포함 (첫 접속은 stream_opened 에 현재 위치). 재접속 시 Last-Event-ID 이후 이벤트를 먼저 재전송,
+    이어 보낼 수 없으면 resync_required 이벤트 → 클라이언트가 모임/POI 전체 재조회.
+    Last-Event-ID 헤더(브라우저 자동 재연결, 항상 최신)가 ?last_event_id= (새 EventSource 생성 시점 값)보다 우선.
+    """
     return StreamingResponse(
-        stream_midpoint_events(meetup_id),
+        stream_midpoint_events(meetup_id, last_event_id_header or last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
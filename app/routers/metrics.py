@@ -0,0 +1,37 @@
+# 운영 지표 API (캐시 적중률 등 튜닝용 JSON)
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.database import get_pool_stats
+from app.realtime import outbox, publisher, viewport_registry
+from app.realtime.sse_pubsub import hub
+from app.services import bbox_cache, meetup_index, midpoint_coalescer, seat_admission
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("")
+async def get_metrics() -> Dict[str, Any]:
+    """
+    bbox 응답 캐시 hit/miss/무효화 누적값, 인메모리 인덱스 정합성 검사 결과, midpoint 병합·좌석 예약 통계,
+    DB 커넥션 풀 사용량·checkout 대기 시간, 이벤트 outbox relay 발행량·지연,
+    일괄 발행 큐 깊이·flush 지연, 공유 pubsub 구독 채널·구독자 수, 뷰포트 스트림 구독자·전달 수 (워커별).
+    """
+    return {
+        "bbox_cache": await bbox_cache.get_stats(),
+        "meetup_index": {
+            "enabled": meetup_index.MEETUP_INDEX_ENABLED,
+            "ready": meetup_index.meetup_index.ready,
+            "size": len(meetup_index.meetup_index),
+            "last_reconcile": meetup_index.last_reconcile or None,
+        },
+        "midpoint_coalescer": midpoint_coalescer.get_stats(),
+        "seat_admission": seat_admission.get_stats(),
+        "db_pool": get_pool_stats(),
+        "event_outbox": outbox.get_stats(),
+        "publisher": publisher.get_stats(),
+        "subscription_hub": hub.get_stats(),
+        "viewport_fanout": viewport_registry.get_stats(),
+    }
@@ -1,11 +1,12 @@
 # 모임 API 요청/응답 스키마
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, get_args
 
 from pydantic import BaseModel, ConfigDict, Field
 
 MeetupStatusLiteral = Literal["RECRUITING", "CONFIRMED", "FINISHED", "CANCELED"]
+_STATUS_VALUES = set(get_args(MeetupStatusLiteral))
 MeetupCategoryLiteral = Literal[
     "STUDY",
     "MEAL",
@@ -18,6 +19,8 @@ MeetupCategoryLiteral = Literal[
     "FREE",
 ]
 
+MidpointStrategyLiteral = Literal["median", "geometric_median", "minimax"]
+
 
 class MeetupCreate(BaseModel):
     """모임 생성 요청."""
@@ -29,6 +32,8 @@ class MeetupCreate(BaseModel):
     host_user_id: int = Field(..., ge=1)
     lat: float = Field(..., ge=-90, le=90)
     lng: float = Field(..., ge=-180, le=180)
+    # 미지정 시 카테고리별(MIDPOINT_STRATEGY_BY_CATEGORY)·전역(MIDPOINT_STRATEGY) 기본값
+    midpoint_strategy: Optional[MidpointStrategyLiteral] = None
 
 
 class ConfirmPoiBody(BaseModel):
@@ -69,6 +74,51 @@ class MeetupResponse(BaseModel):
     # nearby에서만 의미 있음(사용자 위치 기준 거리). 단건 조회는 기준점이 없어 None.
     distance_km: Optional[float] = None
 
+    @classmethod
+    def from_row(cls, row: Any, distance_km: Optional[float] = None) -> "MeetupResponse":
+        """
+        projection 행(meetup_crud.MEETUP_LIST_COLUMNS) → MeetupResponse.
+        좌표는 DB에서 ST_Y/ST_X로 받은 float → WKB 디코딩 없음.
+        """
+        midpoint = None
+        if row.midpoint_lat is not None and row.midpoint_lng is not None:
+            midpoint = {"lat": row.midpoint_lat, "lng": row.midpoint_lng}
+        confirmed_poi = None
+        if row.confirmed_poi_name is not None or row.confirmed_poi_lat is not None:
+            confirmed_poi = ConfirmedPoiSchema(
+                name=row.confirmed_poi_name or "",
+                lat=row.confirmed_poi_lat or 0.0,
+                lng=row.confirmed_poi_lng or 0.0,
+                address=row.confirmed_poi_address or "",
+                confirmed_at=row.confirmed_at,
+            )
+        return cls(
+            id=row.id,
+            status=row.status if row.status in _STATUS_VALUES else "RECRUITING",
+            category=row.category or "FREE",
+            title=row.title,
+            description=row.description,
+            capacity=row.capacity,
+            current_count=row.current_count,
+            lat=row.lat,
+            lng=row.lng,
+            midpoint=midpoint,
+            confirmed_poi=confirmed_poi,
+            distance_km=distance_km,
+        )
+
+
+class MeetupBboxDeltaOut(BaseModel):
+    """GET /meetups/bbox?since=... 증분 응답. 클라이언트는 upserted 를 id 기준 덮어쓰고 removed 를 제거."""
+
+    upserted: List[MeetupResponse]
+    # 필터(status/category)에서 벗어난 모임 id (예: CANCELED 로 변경)
+    removed: List[int]
+    # 다음 요청의 since 값 (조회 전 DB 스냅샷 xmin)
+    cursor: str
+    # 변경이 너무 많으면 true → 증분 대신 전체 재조회 필요
+    reset: bool = False
+
 
 class MidpointOut(BaseModel):
     """단건 조회용 midpoint DTO."""
@@ -100,9 +150,38 @@ class MeetupDetailOut(BaseModel):
     lat: float
     lng: float
     midpoint: Optional[MidpointOut] = None
+    # midpoint 계산에 쓰이는 전략 (모임 지정 또는 기본값)
+    midpoint_strategy: MidpointStrategyLiteral = "median"
     confirmed_poi: Optional[ConfirmedPoiOut] = None
     distance_km: Optional[float] = None
     # Optional user-context fields. Provided only when user_id is supplied.
     is_participating: Optional[bool] = None
     is_host: Optional[bool] = None
 
+
+
+class MeetupClusterOut(BaseModel):
+    """GET /meetups/clusters 응답 항목. count>1 이면 클러스터, count=1 이면 단건 마커."""
+
+    lat: float
+    lng: float
+    count: int
+    # count=1 인 경우에만 채워짐 (마커 클릭 → 상세 조회용)
+    meetup_id: Optional[int] = None
+    # 확장 줌 이상(단건 모드)에서만 채워짐
+    status: Optional[MeetupStatusLiteral] = None
+    category: Optional[MeetupCategoryLiteral] = None
+    # 클러스터 클릭 시 이동할 줌 (단건이면 None)
+    expansion_zoom: Optional[int] = None
+
+
+class MeetupHeatmapCellOut(BaseModel):
+    """GET /meetups/heatmap 응답 항목. geohash 셀 하나의 모임 수 (상태/카테고리별 분해 포함)."""
+
+    geohash: str
+    # 셀 중심 좌표
+    lat: float
+    lng: float
+    count: int
+    by_status: Dict[str, int]
+    by_category: Dict[str, int]
@@ -1,5 +1,7 @@
 # 참여/취소 요청 스키마
 
+from typing import List
+
 from pydantic import BaseModel, Field
 
 
@@ -13,3 +15,25 @@ class JoinBody(BaseModel):
 class JoinLeaveBody(BaseModel):
     """취소 시 사용자 식별만 필요 (lat/lng 불필요)."""
     user_id: int
+
+
+# 일괄 참여 한 요청당 최대 인원 (잠금 유지 시간·요청 크기 제한)
+JOIN_BULK_MAX_MEMBERS = 50
+
+
+class JoinBulkBody(BaseModel):
+    """일괄 참여 (호스트가 일행 초대). 요청 순서대로 남은 좌석 배정."""
+    members: List[JoinBody] = Field(..., min_length=1, max_length=JOIN_BULK_MAX_MEMBERS)
+
+
+class JoinBulkResultOut(BaseModel):
+    """사용자별 결과: joined / already_joined / user_not_found / capacity_exceeded / duplicate_in_request."""
+    user_id: int
+    status: str
+
+
+class JoinBulkOut(BaseModel):
+    message: str
+    current_count: int
+    joined: int
+    results: List[JoinBulkResultOut]
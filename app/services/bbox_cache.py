@@ -0,0 +1,247 @@
+# /meetups/bbox 응답 캐시: bbox를 줌별 격자로 스냅(양자화)해 Redis에 직렬화 응답 저장
+# - 비슷한 pan/zoom 요청이 같은 키로 모임 → 캐시 재사용
+# - 캐시 키는 자신이 덮는 격자 셀 집합(bboxcell:*)에 등록, 모임 이벤트 시 해당 위치 셀의 키만 삭제
+# - hit/miss/무효화 횟수는 Redis 해시(bboxcache:stats)에 누적 → 격자 크기 튜닝용
+# - 셀마다 세대 번호(bboxgen:*): 무효화 시 INCR. miss 때 읽은 세대가 채우는 시점까지 그대로일 때만 저장
+#   (DB 조회 도중 무효화가 지나가면 옛 응답을 다시 캐시하지 않음)
+
+import hashlib
+import math
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.realtime.sse_pubsub import redis_client
+from app.services.meetup_locations import get_meetup_location
+
+BBOX_CACHE_TTL_SEC = int(os.getenv("BBOX_CACHE_TTL_SEC", "60"))
+# 캐시 대상 줌 범위 (너무 넓거나 너무 좁은 화면은 캐시하지 않음)
+BBOX_CACHE_MIN_ZOOM = int(os.getenv("BBOX_CACHE_MIN_ZOOM", "10"))
+BBOX_CACHE_MAX_ZOOM = int(os.getenv("BBOX_CACHE_MAX_ZOOM", "18"))
+# 줌별 셀 크기 = 타일 폭(360 / 2^zoom) / BBOX_CACHE_CELLS_PER_TILE
+BBOX_CACHE_CELLS_PER_TILE = int(os.getenv("BBOX_CACHE_CELLS_PER_TILE", "1"))
+# 스냅된 bbox가 이 개수보다 많은 셀을 덮으면 캐시하지 않음 (무효화 팬아웃 제한)
+BBOX_CACHE_MAX_CELLS = int(os.getenv("BBOX_CACHE_MAX_CELLS", "64"))
+
+CACHE_KEY_PREFIX = "bbox:"
+CELL_KEY_PREFIX = "bboxcell:"
+GEN_KEY_PREFIX = "bboxgen:"
+STATS_KEY = "bboxcache:stats"
+# 세대 키 TTL: 채우기(DB 조회 한 번)보다 충분히 길게, 이벤트가 없는 셀의 키는 결국 정리
+GEN_TTL_SEC = 86400
+
+# 조회 + hit/miss 집계를 한 번에. miss 면 덮는 셀들의 세대를 함께 반환 (채우기 검사용)
+# KEYS: 캐시 키, 통계 해시, 세대 키들
+_GET_LUA = """
+local v = redis.call('HGETALL', KEYS[1])
+if #v > 0 then
+    redis.call('HINCRBY', KEYS[2], 'hit', 1)
+    return {1, v}
+end
+redis.call('HINCRBY', KEYS[2], 'miss', 1)
+local gens = {}
+for i = 3, #KEYS do
+    gens[#gens + 1] = redis.call('GET', KEYS[i]) or ''
+end
+return {0, gens}
+"""
+
+# 세대가 miss 때와 같을 때만 저장 + 셀 인덱스 등록. 다르면 0 (stale_fills 집계)
+# KEYS: 캐시 키, 통계 해시, 세대 키 n개, 셀 키 n개 / ARGV: TTL, body, next_cursor, sync_cursor, 세대 n개
+_FILL_LUA = """
+local n = (#KEYS - 2) / 2
+for i = 1, n do
+    if (redis.call('GET', KEYS[2 + i]) or '') ~= ARGV[4 + i] then
+        redis.call('HINCRBY', KEYS[2], 'stale_fills', 1)
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], 'body', ARGV[2], 'next_cursor', ARGV[3], 'sync_cursor', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+for i = 1, n do
+    redis.call('SADD', KEYS[2 + n + i], KEYS[1])
+    redis.call('EXPIRE', KEYS[2 + n + i], ARGV[1])
+end
+return 1
+"""
+
+# 셀 세대 증가 + 등록된 캐시 키 삭제. 실제로 지운 키가 있을 때만 집계
+# (모든 워커의 리스너가 같은 이벤트로 호출 → 처음 지운 워커만 집계되어 워커 수만큼 부풀지 않음)
+# KEYS: 통계 해시, 세대 키 m개, 셀 키 m개 / ARGV: 세대 키 TTL
+_INVALIDATE_LUA = """
+local m = (#KEYS - 1) / 2
+local removed = 0
+for i = 1, m do
+    redis.call('INCR', KEYS[1 + i])
+    redis.call('EXPIRE', KEYS[1 + i], ARGV[1])
+    for _, k in ipairs(redis.call('SMEMBERS', KEYS[1 + m + i])) do
+        removed = removed + redis.call('DEL', k)
+    end
+    redis.call('DEL', KEYS[1 + m + i])
+end
+if removed > 0 then
+    redis.call('HINCRBY', KEYS[1], 'invalidations', 1)
+    redis.call('HINCRBY', KEYS[1], 'invalidated_keys', removed)
+end
+return removed
+"""
+
+# 응답 내용(midpoint, current_count, status, confirmed_poi)을 바꾸는 이벤트
+INVALIDATING_EVENTS = {"midpoint_updated", "meetup_status_changed", "poi_confirmed"}
+
+CellRange = Tuple[int, int, int, int]  # (cx0, cy0, cx1, cy1)
+
+
+def cell_deg(zoom: int) -> float:
+    return 360.0 / (2 ** zoom) / BBOX_CACHE_CELLS_PER_TILE
+
+
+def quantize_bbox(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    zoom: int,
+) -> Optional[Tuple[CellRange, Tuple[float, float, float, float]]]:
+    """
+    bbox를 바깥쪽으로 격자에 스냅. 반환: (셀 범위, 스냅된 (min_lat, min_lng, max_lat, max_lng)).
+    캐시 대상이 아니면(줌 범위 밖, 셀 수 초과) None.
+    """
+    if not (BBOX_CACHE_MIN_ZOOM <= zoom <= BBOX_CACHE_MAX_ZOOM):
+        return None
+    lat_lo, lat_hi = sorted([min_lat, max_lat])
+    lng_lo, lng_hi = sorted([min_lng, max_lng])
+    size = cell_deg(zoom)
+    cx0, cx1 = math.floor(lng_lo / size), math.floor(lng_hi / size)
+    cy0, cy1 = math.floor(lat_lo / size), math.floor(lat_hi / size)
+    if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > BBOX_CACHE_MAX_CELLS:
+        return None
+    snapped = (
+        max(cy0 * size, -90.0),
+        max(cx0 * size, -180.0),
+        min((cy1 + 1) * size, 90.0),
+        min((cx1 + 1) * size, 180.0),
+    )
+    return (cx0, cy0, cx1, cy1), snapped
+
+
+def cache_key(
+    zoom: int,
+    cells: CellRange,
+    statuses: Optional[Sequence[str]],
+    categories: Optional[Sequence[str]],
+    limit: int,
+) -> str:
+    """줌 + 셀 범위 + 필터 조합 → 캐시 키."""
+    filters = f"{','.join(sorted(statuses or []))}|{','.join(sorted(categories or []))}|{limit}"
+    digest = hashlib.sha1(filters.encode()).hexdigest()[:12]
+    cx0, cy0, cx1, cy1 = cells
+    return f"{CACHE_KEY_PREFIX}{zoom}:{cx0}:{cy0}:{cx1}:{cy1}:{digest}"
+
+
+def _cell_key(zoom: int, cx: int, cy: int) -> str:
+    return f"{CELL_KEY_PREFIX}{zoom}:{cx}:{cy}"
+
+
+def _gen_key(zoom: int, cx: int, cy: int) -> str:
+    return f"{GEN_KEY_PREFIX}{zoom}:{cx}:{cy}"
+
+
+def _covered(cells: CellRange) -> List[Tuple[int, int]]:
+    cx0, cy0, cx1, cy1 = cells
+    return [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+
+
+async def get_cached(
+    key: str,
+    zoom: int,
+    cells: CellRange,
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[str]]]:
+    """
+    캐시 조회 + hit/miss 집계 (Redis 왕복 1회).
+    반환: (hit 이면 캐시 값, miss 면 덮는 셀들의 세대 → set_cached 에 그대로 전달). Redis 오류 시 (None, None).
+    """
+    gen_keys = [_gen_key(zoom, cx, cy) for cx, cy in _covered(cells)]
+    try:
+        found, data = await redis_client.eval(_GET_LUA, 2 + len(gen_keys), key, STATS_KEY, *gen_keys)
+    except Exception:
+        return None, None
+    if found:
+        return dict(zip(data[::2], data[1::2])), None
+    return None, list(data)
+
+
+async def set_cached(
+    key: str,
+    zoom: int,
+    cells: CellRange,
+    gens: Optional[List[str]],
+    body: str,
+    next_cursor: Optional[str],
+    sync_cursor: str,
+) -> None:
+    """
+    직렬화된 응답 저장 후, 덮는 모든 셀의 인덱스 집합에 키 등록. sync_cursor는 응답 조회 전 스냅샷 xmin 기준.
+    gens(get_cached 의 miss 세대)와 지금 세대가 다르면 그 사이 무효화가 있었으므로 저장하지 않음.
+    """
+    if gens is None:
+        return
+    covered = _covered(cells)
+    gen_keys = [_gen_key(zoom, cx, cy) for cx, cy in covered]
+    cell_keys = [_cell_key(zoom, cx, cy) for cx, cy in covered]
+    try:
+        await redis_client.eval(
+            _FILL_LUA, 2 + len(gen_keys) + len(cell_keys), key, STATS_KEY, *gen_keys, *cell_keys,
+            BBOX_CACHE_TTL_SEC, body, next_cursor or "", sync_cursor, *gens,
+        )
+    except Exception:
+        pass
+
+
+async def invalidate_at(lat: float, lng: float) -> int:
+    """좌표가 속한 (줌별) 셀의 세대를 올리고 등록된 캐시 키만 삭제. 반환: 삭제한 키 수."""
+    gen_keys: List[str] = []
+    cell_keys: List[str] = []
+    for zoom in range(BBOX_CACHE_MIN_ZOOM, BBOX_CACHE_MAX_ZOOM + 1):
+        size = cell_deg(zoom)
+        cx, cy = math.floor(lng / size), math.floor(lat / size)
+        gen_keys.append(_gen_key(zoom, cx, cy))
+        cell_keys.append(_cell_key(zoom, cx, cy))
+    try:
+        return int(
+            await redis_client.eval(
+                _INVALIDATE_LUA, 1 + len(gen_keys) + len(cell_keys), STATS_KEY, *gen_keys, *cell_keys, GEN_TTL_SEC,
+            )
+        )
+    except Exception:
+        return 0
+
+
+async def get_stats() -> Dict[str, Any]:
+    """hit/miss/무효화 누적 통계 + hit rate. invalidations 는 캐시 키를 실제로 지운 무효화 횟수."""
+    try:
+        raw = await redis_client.hgetall(STATS_KEY)
+    except Exception:
+        return {"available": False}
+    stats = {k: int(v) for k, v in raw.items()}
+    hit, miss = stats.get("hit", 0), stats.get("miss", 0)
+    return {
+        "available": True,
+        "hit": hit,
+        "miss": miss,
+        "hit_rate": round(hit / (hit + miss), 4) if hit + miss else None,
+        "invalidations": stats.get("invalidations", 0),
+        "invalidated_keys": stats.get("invalidated_keys", 0),
+        "stale_fills": stats.get("stale_fills", 0),
+        "min_zoom": BBOX_CACHE_MIN_ZOOM,
+        "max_zoom": BBOX_CACHE_MAX_ZOOM,
+        "cells_per_tile": BBOX_CACHE_CELLS_PER_TILE,
+    }
+
+
+async def on_meetup_event(event_name: str, payload: Dict[str, Any]) -> None:
+    """event_listener 핸들러: 응답 내용이 바뀌는 이벤트 → 해당 모임 위치 셀만 무효화."""
+    if event_name not in INVALIDATING_EVENTS:
+        return
+    loc = await get_meetup_location(int(payload["meetup_id"]))
+    if loc is not None:
+        await invalidate_at(*loc)
@@ -0,0 +1,113 @@
+# geohash 유틸: 셀 경계 계산 + bbox를 덮는 셀의 문자열 범위(prefix range) 계산
+# meetups.geohash(ST_GeoHash(location, 12)) btree 인덱스를 범위 조건으로 스캔하기 위함
+
+from typing import List, Optional, Tuple
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"  # ASCII 오름차순 → 문자열 비교 순서 = 셀 번호 순서
+MAX_PRECISION = 12
+
+
+def _bits(precision: int) -> Tuple[int, int]:
+    """정밀도 → (경도 비트 수, 위도 비트 수). 비트는 경도부터 번갈아 배치."""
+    total = 5 * precision
+    return (total + 1) // 2, total // 2
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """정밀도별 셀 크기 (위도 높이, 경도 폭) 도 단위."""
+    lng_bits, lat_bits = _bits(precision)
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _interleave(xi: int, yi: int, precision: int) -> int:
+    """경도/위도 셀 번호 → geohash 정수 (경도 MSB부터 교차)."""
+    lng_bits, lat_bits = _bits(precision)
+    code = 0
+    for i in range(5 * precision):
+        if i % 2 == 0:
+            lng_bits -= 1
+            bit = (xi >> lng_bits) & 1
+        else:
+            lat_bits -= 1
+            bit = (yi >> lat_bits) & 1
+        code = (code << 1) | bit
+    return code
+
+
+def _to_str(code: int, precision: int) -> str:
+    return "".join(BASE32[(code >> (5 * (precision - 1 - i))) & 31] for i in range(precision))
+
+
+def _deinterleave(code: int, precision: int) -> Tuple[int, int]:
+    xi = yi = 0
+    for i in range(5 * precision):
+        bit = (code >> (5 * precision - 1 - i)) & 1
+        if i % 2 == 0:
+            xi = (xi << 1) | bit
+        else:
+            yi = (yi << 1) | bit
+    return xi, yi
+
+
+def encode(lat: float, lng: float, precision: int = MAX_PRECISION) -> str:
+    """좌표 → geohash 문자열 (PostGIS ST_GeoHash 와 같은 셀)."""
+    lng_bits, lat_bits = _bits(precision)
+    xi = min(int((lng + 180.0) / 360.0 * (1 << lng_bits)), (1 << lng_bits) - 1)
+    yi = min(int((lat + 90.0) / 180.0 * (1 << lat_bits)), (1 << lat_bits) - 1)
+    return _to_str(_interleave(xi, yi, precision), precision)
+
+
+def decode_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """geohash → 셀 경계 (min_lat, min_lng, max_lat, max_lng)."""
+    precision = len(geohash)
+    code = 0
+    for ch in geohash:
+        code = (code << 5) | BASE32.index(ch)
+    xi, yi = _deinterleave(code, precision)
+    lat_h, lng_w = cell_size(precision)
+    return -90.0 + yi * lat_h, -180.0 + xi * lng_w, -90.0 + (yi + 1) * lat_h, -180.0 + (xi + 1) * lng_w
+
+
+def decode_center(geohash: str) -> Tuple[float, float]:
+    """geohash → 셀 중심 (lat, lng)."""
+    min_lat, min_lng, max_lat, max_lng = decode_bounds(geohash)
+    return (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+
+
+def cover_ranges(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    precision: int,
+    max_cells: int,
+) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    bbox를 덮는 precision 셀들을 연속 구간으로 병합한 문자열 범위 목록 [(lo, hi)].
+    geohash >= lo AND geohash < hi (hi=None 이면 상한 없음) 로 btree 범위 스캔.
+    셀 수가 max_cells 초과면 None.
+    """
+    lat_lo, lat_hi = sorted([min_lat, max_lat])
+    lng_lo, lng_hi = sorted([min_lng, max_lng])
+    lng_bits, lat_bits = _bits(precision)
+    nx, ny = 1 << lng_bits, 1 << lat_bits
+    x0 = max(int((lng_lo + 180.0) / 360.0 * nx), 0)
+    x1 = min(int((lng_hi + 180.0) / 360.0 * nx), nx - 1)
+    y0 = max(int((lat_lo + 90.0) / 180.0 * ny), 0)
+    y1 = min(int((lat_hi + 90.0) / 180.0 * ny), ny - 1)
+    if (x1 - x0 + 1) * (y1 - y0 + 1) > max_cells:
+        return None
+
+    codes = sorted(_interleave(x, y, precision) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+    ranges: List[Tuple[str, Optional[str]]] = []
+    end_code = 1 << (5 * precision)
+    start = prev = codes[0]
+    for code in codes[1:] + [None]:  # type: ignore[operator]
+        if code is not None and code == prev + 1:
+            prev = code
+            continue
+        hi = prev + 1
+        ranges.append((_to_str(start, precision), _to_str(hi, precision) if hi < end_code else None))
+        if code is not None:
+            start = prev = code
+    return ranges
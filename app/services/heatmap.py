@@ -0,0 +1,62 @@
+# heatmap 집계 서비스: bbox → geohash 셀 범위 → DB GROUP BY 결과를 셀별 응답 DTO로 조립
+# geometry를 읽지 않고 meetups.geohash 인덱스만으로 집계 (도시 단위 줌아웃 화면, 밀집 지역 분석용)
+
+import os
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.crud.meetup_crud import get_meetup_geohash_counts
+from app.schemas.meetup import MeetupHeatmapCellOut
+from app.services import geohash
+
+# bbox를 덮는 셀 수 상한 (응답 크기·범위 조건 수 제한)
+HEATMAP_MAX_CELLS = int(os.getenv("HEATMAP_MAX_CELLS", "4096"))
+# precision 미지정 시 이 셀 수 이하가 되는 가장 세밀한 precision 선택
+HEATMAP_TARGET_CELLS = int(os.getenv("HEATMAP_TARGET_CELLS", "256"))
+HEATMAP_MAX_PRECISION = 8
+
+
+def auto_precision(min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> int:
+    """bbox를 HEATMAP_TARGET_CELLS 이하 셀로 덮는 가장 큰 precision (최소 1)."""
+    best = 1
+    for p in range(1, HEATMAP_MAX_PRECISION + 1):
+        if geohash.cover_ranges(min_lat, min_lng, max_lat, max_lng, p, HEATMAP_TARGET_CELLS) is None:
+            break
+        best = p
+    return best
+
+
+def get_heatmap(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    precision: Optional[int] = None,
+) -> List[MeetupHeatmapCellOut]:
+    """
+    bbox를 덮는 geohash 셀별 모임 수 (status/category 분해 포함).
+    경계 셀은 셀 전체를 집계 (bbox 밖 모임 포함) — 히트맵 표시 단위가 셀이므로 의도된 동작.
+    셀 수가 HEATMAP_MAX_CELLS를 넘으면 400.
+    """
+    if precision is None:
+        precision = auto_precision(min_lat, min_lng, max_lat, max_lng)
+    ranges = geohash.cover_ranges(min_lat, min_lng, max_lat, max_lng, precision, HEATMAP_MAX_CELLS)
+    if ranges is None:
+        raise HTTPException(status_code=400, detail="precision too fine for bbox; zoom in or lower precision")
+
+    rows = get_meetup_geohash_counts(db, ranges, precision)
+    cells: Dict[str, MeetupHeatmapCellOut] = {}
+    for r in rows:
+        cell = cells.get(r.cell)
+        if cell is None:
+            lat, lng = geohash.decode_center(r.cell)
+            cell = cells[r.cell] = MeetupHeatmapCellOut(
+                geohash=r.cell, lat=lat, lng=lng, count=0, by_status={}, by_category={}
+            )
+        cell.count += r.count
+        cell.by_status[r.status] = cell.by_status.get(r.status, 0) + r.count
+        cell.by_category[r.category] = cell.by_category.get(r.category, 0) + r.count
+    return sorted(cells.values(), key=lambda c: c.geohash)
@@ -0,0 +1,68 @@
+# 지도 클러스터링 서비스: 줌 레벨별 격자 크기 계산 + PostGIS 집계 결과 → 응답 DTO
+
+import os
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.crud.meetup_crud import get_meetup_clusters_in_bbox, get_meetup_points_in_bbox
+from app.schemas.meetup import MeetupClusterOut
+
+# 이 줌 이상에서는 클러스터 대신 개별 모임 반환 (프론트 supercluster maxZoom과 동일)
+CLUSTER_EXPAND_ZOOM = int(os.getenv("CLUSTER_EXPAND_ZOOM", "16"))
+# 256px 타일 한 장을 몇 칸으로 나눌지 (8 → 약 32px 셀)
+CLUSTER_CELLS_PER_TILE = int(os.getenv("CLUSTER_CELLS_PER_TILE", "8"))
+# 단건 모드 최대 반환 수 (페이로드 상한)
+CLUSTER_MAX_POINTS = int(os.getenv("CLUSTER_MAX_POINTS", "500"))
+
+
+def grid_size_deg(zoom: int) -> float:
+    """줌 레벨 → 격자 한 변 크기(도). 타일 폭(360 / 2^zoom)을 CLUSTER_CELLS_PER_TILE로 나눔."""
+    return 360.0 / (2 ** zoom) / CLUSTER_CELLS_PER_TILE
+
+
+def _status_value(raw: Optional[str]) -> Optional[str]:
+    allowed = {"RECRUITING", "CONFIRMED", "FINISHED", "CANCELED"}
+    return raw if raw in allowed else None
+
+
+def get_clusters(
+    db: Session,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    zoom: int,
+) -> List[MeetupClusterOut]:
+    """
+    줌 레벨에 따라 클러스터 또는 개별 모임 목록 반환.
+
+    - zoom < CLUSTER_EXPAND_ZOOM: ST_SnapToGrid 격자별 개수 + 평균 좌표 (셀 수로 응답 크기 상한)
+    - zoom >= CLUSTER_EXPAND_ZOOM: 개별 모임 (id/좌표/status/category만, CLUSTER_MAX_POINTS 상한)
+    """
+    if zoom >= CLUSTER_EXPAND_ZOOM:
+        rows = get_meetup_points_in_bbox(db, min_lat, min_lng, max_lat, max_lng, CLUSTER_MAX_POINTS)
+        return [
+            MeetupClusterOut(
+                lat=r.lat,
+                lng=r.lng,
+                count=1,
+                meetup_id=r.meetup_id,
+                status=_status_value(r.status),
+                category=r.category or "FREE",
+            )
+            for r in rows
+        ]
+
+    rows = get_meetup_clusters_in_bbox(db, min_lat, min_lng, max_lat, max_lng, grid_size_deg(zoom))
+    expansion_zoom = min(zoom + 1, CLUSTER_EXPAND_ZOOM)
+    return [
+        MeetupClusterOut(
+            lat=float(r.lat),
+            lng=float(r.lng),
+            count=r.count,
+            meetup_id=r.meetup_id if r.count == 1 else None,
+            expansion_zoom=expansion_zoom if r.count > 1 else None,
+        )
+        for r in rows
+    ]
@@ -0,0 +1,165 @@
+# 모임 midpoint 증분 중앙값: 좌표값별 개수 히스토그램 + 중앙값 위치 포인터
+# 참여 좌표는 200m 격자(GRID_DEG)로 스냅되어 서로 다른 값(bin) 수가 참여자 수보다 훨씬 적음
+# → join/leave 마다 전체 참여자(n명)를 다시 읽어 statistics.median 하는 대신
+#   bin 하나의 개수만 바꾸고 포인터를 최대 한 칸 이동 (bin 탐색 O(log k), 중앙값 O(1))
+# 단, 저장 형식이 bin 목록 전체(JSONB)라 갱신마다 파싱·직렬화·행 재기록과 새 bin 삽입/삭제는 O(k)
+# (k = 서로 다른 격자 값 수 ≤ n). 참여자 행 조회가 없어지는 것이 이득이고, 갱신 자체는 상수 시간이 아님
+# meetups.midpoint_hist(JSONB)에 {"n": 참여자 수, "lat": {...}, "lng": {...}} 형태로 저장
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class MedianHistogram:
+    """
+    한 축(위도 또는 경도)의 값별 개수 히스토그램.
+
+    values: 정렬된 서로 다른 값, counts: 값별 개수.
+    포인터 (idx, before): 하위 중앙값(순위 (n-1)//2)이 있는 bin 위치와 그 앞 bin들의 개수 합.
+    """
+
+    __slots__ = ("values", "counts", "n", "idx", "before")
+
+    def __init__(self) -> None:
+        self.values: List[float] = []
+        self.counts: List[int] = []
+        self.n = 0
+        self.idx = 0
+        self.before = 0
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "MedianHistogram":
+        """값 목록으로 새로 구성 (재구축용)."""
+        hist = cls()
+        merged: Dict[float, int] = {}
+        for v in values:
+            merged[v] = merged.get(v, 0) + 1
+        hist.values = sorted(merged)
+        hist.counts = [merged[v] for v in hist.values]
+        hist.n = sum(hist.counts)
+        hist._seek()
+        return hist
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MedianHistogram":
+        hist = cls()
+        hist.values = [float(v) for v in data["v"]]
+        hist.counts = [int(c) for c in data["c"]]
+        hist.n = sum(hist.counts)
+        hist.idx, hist.before = int(data["i"]), int(data["b"])
+        return hist
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"v": self.values, "c": self.counts, "i": self.idx, "b": self.before}
+
+    def _seek(self) -> None:
+        """포인터를 처음부터 다시 계산 (O(k), 재구축 시에만)."""
+        self.idx = self.before = 0
+        self._settle()
+
+    def _settle(self) -> None:
+        """포인터를 목표 순위의 bin으로 이동. add/remove 후에는 최대 한 칸."""
+        if self.n == 0:
+            self.idx = self.before = 0
+            return
+        rank = (self.n - 1) // 2
+        if self.idx >= len(self.values):
+            self.idx = len(self.values) - 1
+            self.before = self.n - self.counts[self.idx]
+        while rank < self.before:
+            self.idx -= 1
+            self.before -= self.counts[self.idx]
+        while rank >= self.before + self.counts[self.idx]:
+            self.before += self.counts[self.idx]
+            self.idx += 1
+
+    def add(self, value: float) -> None:
+        j = bisect_left(self.values, value)
+        if j < len(self.values) and self.values[j] == value:
+            self.counts[j] += 1
+            if j < self.idx:
+                self.before += 1
+        else:
+            self.values.insert(j, value)
+            self.counts.insert(j, 1)
+            if self.n and j <= self.idx:
+                # 포인터 bin 앞에 새 bin → 인덱스·앞 개수 모두 한 칸 밀림
+                self.idx += 1
+                self.before += 1
+        self.n += 1
+        self._settle()
+
+    def remove(self, value: float) -> bool:
+        """값 하나 제거. 없는 값이면 False (히스토그램이 DB와 어긋남 → 호출자가 재구축)."""
+        j = bisect_left(self.values, value)
+        if j >= len(self.values) or self.values[j] != value:
+            return False
+        self.counts[j] -= 1
+        if j < self.idx:
+            self.before -= 1
+        if self.counts[j] == 0:
+            del self.values[j]
+            del self.counts[j]
+            if j < self.idx:
+                self.idx -= 1
+        self.n -= 1
+        self._settle()
+        return True
+
+    def median(self) -> Optional[float]:
+        """statistics.median 과 같은 값 (짝수 개면 가운데 두 값의 평균). 비어 있으면 None."""
+        if self.n == 0:
+            return None
+        lo = self.values[self.idx]
+        if self.n % 2:
+            return lo
+        # 상위 중앙값: 순위 n//2 — 같은 bin 안이면 같은 값, 아니면 다음 bin
+        if self.n // 2 < self.before + self.counts[self.idx]:
+            hi = lo
+        else:
+            hi = self.values[self.idx + 1]
+        return (lo + hi) / 2
+
+
+def build_midpoint_hist(coords: Iterable[Tuple[float, float]]) -> Dict[str, Any]:
+    """(lat, lng) 목록 → meetups.midpoint_hist JSON."""
+    coords = list(coords)
+    return {
+        "n": len(coords),
+        "lat": MedianHistogram.from_values(lat for lat, _ in coords).to_json(),
+        "lng": MedianHistogram.from_values(lng for _, lng in coords).to_json(),
+    }
+
+
+def apply_midpoint_delta(
+    data: Dict[str, Any],
+    lat: float,
+    lng: float,
+    add: bool,
+) -> Optional[Tuple[Dict[str, Any], Optional[Tuple[float, float]]]]:
+    """
+    저장된 midpoint_hist 에 좌표 하나 추가/제거.
+    반환: (새 JSON, (median_lat, median_lng) 또는 None(참여자 없음)). 제거할 값이 없으면 None (재구축 필요).
+    """
+    return apply_midpoint_deltas(data, [(lat, lng)], add)
+
+
+def apply_midpoint_deltas(
+    data: Dict[str, Any],
+    coords: Iterable[Tuple[float, float]],
+    add: bool,
+) -> Optional[Tuple[Dict[str, Any], Optional[Tuple[float, float]]]]:
+    """apply_midpoint_delta 의 여러 좌표 버전 (일괄 참여). JSON 파싱·직렬화는 한 번."""
+    lat_hist = MedianHistogram.from_json(data["lat"])
+    lng_hist = MedianHistogram.from_json(data["lng"])
+    for lat, lng in coords:
+        if add:
+            lat_hist.add(lat)
+            lng_hist.add(lng)
+        elif not (lat_hist.remove(lat) and lng_hist.remove(lng)):
+            return None
+    new_data = {"n": lat_hist.n, "lat": lat_hist.to_json(), "lng": lng_hist.to_json()}
+    if lat_hist.n == 0:
+        return new_data, None
+    return new_data, (lat_hist.median(), lng_hist.median())  # type: ignore[return-value]
+
@@ -0,0 +1,319 @@
+# 워커 내 인메모리 공간 인덱스: RECRUITING 모임만 균일 격자(uniform grid)로 보관
+# - /meetups/bbox (status=RECRUITING) 를 DB 없이 응답
+# - 기동 시 워밍, meetup:*:midpoint / meetup:*:poi 이벤트로 갱신, 주기적으로 DB와 정합성 검사
+# - MEETUP_INDEX_ENABLED=true 일 때만 사용 (기본 비활성)
+
+import asyncio
+import logging
+import math
+import os
+import threading
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.engine import Row
+
+from app.crud.meetup_crud import BboxCursor, current_sync_xmin, get_recruiting_meetup_rows
+from app.database import SessionLocal
+from app.schemas.meetup import MeetupResponse
+
+logger = logging.getLogger(__name__)
+
+MEETUP_INDEX_ENABLED = os.getenv("MEETUP_INDEX_ENABLED", "false").lower() in ("1", "true", "yes")
+# 격자 한 변 (도). 0.01° ≈ 1km
+MEETUP_INDEX_CELL_DEG = float(os.getenv("MEETUP_INDEX_CELL_DEG", "0.01"))
+# DB 정합성 검사 주기 (초). 다른 워커에서 생성된 모임도 이 주기 안에 반영됨
+MEETUP_INDEX_RECONCILE_SEC = float(os.getenv("MEETUP_INDEX_RECONCILE_SEC", "30"))
+
+ACTIVE_STATUS = "RECRUITING"
+# 정합성 검사에서 midpoint 비교 허용 오차 (도). 이벤트(JSON float)와 DB(ST_Y/ST_X) 값의 마지막 비트 차이 무시
+MIDPOINT_TOL_DEG = 1e-9
+
+
+class MeetupGridIndex:
+    """
+    균일 격자 공간 인덱스.
+
+    좌표/id/생성시각은 슬롯 번호로 접근하는 array 에 연속 저장 (객체 오버헤드 최소화),
+    격자 셀은 슬롯 번호 목록만 가짐. 삭제된 슬롯은 free list로 재사용.
+    이벤트 루프(갱신)와 스레드풀(동기 라우터 조회)에서 동시에 접근하므로 Lock 사용.
+    """
+
+    def __init__(self, cell_deg: float = MEETUP_INDEX_CELL_DEG) -> None:
+        self.cell_deg = cell_deg
+        self._lock = threading.Lock()
+        self._ids = array("q")
+        self._lats = array("d")
+        self._lngs = array("d")
+        self._created_ts = array("d")
+        self._responses: List[Optional[MeetupResponse]] = []
+        self._created_at: List[Optional[datetime]] = []
+        self._slot_by_id: Dict[int, int] = {}
+        self._free: List[int] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self.ready = False
+        # 이 트랜잭션 id 미만의 DB 변경은 모두 반영됨 (적재 전 스냅샷 xmin, bbox 증분 동기화 커서 기준)
+        self.sync_xmin = 0
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lng / self.cell_deg), math.floor(lat / self.cell_deg))
+
+    # --- 갱신 ---
+
+    def _insert_locked(self, resp: MeetupResponse, created_at: Optional[datetime]) -> None:
+        ts = created_at.timestamp() if created_at is not None else 0.0
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = resp.id
+            self._lats[slot] = resp.lat
+            self._lngs[slot] = resp.lng
+            self._created_ts[slot] = ts
+            self._responses[slot] = resp
+            self._created_at[slot] = created_at
+        else:
+            slot = len(self._ids)
+            self._ids.append(resp.id)
+            self._lats.append(resp.lat)
+            self._lngs.append(resp.lng)
+            self._created_ts.append(ts)
+            self._responses.append(resp)
+            self._created_at.append(created_at)
+        self._slot_by_id[resp.id] = slot
+        self._cells.setdefault(self._cell(resp.lat, resp.lng), []).append(slot)
+
+    def _remove_locked(self, meetup_id: int) -> bool:
+        slot = self._slot_by_id.pop(meetup_id, None)
+        if slot is None:
+            return False
+        cell = self._cell(self._lats[slot], self._lngs[slot])
+        slots = self._cells.get(cell)
+        if slots is not None:
+            slots.remove(slot)
+            if not slots:
+                del self._cells[cell]
+        self._responses[slot] = None
+        self._created_at[slot] = None
+        self._free.append(slot)
+        return True
+
+    def upsert(self, resp: MeetupResponse, created_at: Optional[datetime]) -> None:
+        """모임 추가/교체. RECRUITING 이 아니면 제거."""
+        with self._lock:
+            self._remove_locked(resp.id)
+            if resp.status == ACTIVE_STATUS:
+                self._insert_locked(resp, created_at)
+
+    def remove(self, meetup_id: int) -> bool:
+        with self._lock:
+            return self._remove_locked(meetup_id)
+
+    def update_fields(self, meetup_id: int, **fields: Any) -> bool:
+        """위치 이외 필드(midpoint, current_count 등) 갱신. 인덱스에 없으면 False."""
+        with self._lock:
+            slot = self._slot_by_id.get(meetup_id)
+            if slot is None:
+                return False
+            resp = self._responses[slot]
+            if resp is not None:
+                self._responses[slot] = resp.model_copy(update=fields)
+            return True
+
+    def load(self, rows: Sequence[Row]) -> None:
+        """전체 교체 (워밍)."""
+        fresh = MeetupGridIndex(self.cell_deg)
+        for row in rows:
+            fresh._insert_locked(MeetupResponse.from_row(row), row.created_at)
+        with self._lock:
+            self._ids, self._lats, self._lngs = fresh._ids, fresh._lats, fresh._lngs
+            self._created_ts, self._responses, self._created_at = (
+                fresh._created_ts,
+                fresh._responses,
+                fresh._created_at,
+            )
+            self._slot_by_id, self._free, self._cells = fresh._slot_by_id, fresh._free, fresh._cells
+            self.ready = True
+
+    # --- 조회 ---
+
+    def query_bbox(
+        self,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        categories: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[BboxCursor] = None,
+    ) -> List[Tuple[MeetupResponse, datetime]]:
+        """
+        get_meetups_in_bbox(statuses=[RECRUITING]) 와 같은 결과를 메모리에서 계산.
+        (created_at, id) 내림차순, cursor 이후, limit 개. 반환: (응답, created_at) 목록.
+        """
+        lat_lo, lat_hi = sorted([min_lat, max_lat])
+        lng_lo, lng_hi = sorted([min_lng, max_lng])
+        cat_set: Optional[Set[str]] = set(categories) if categories else None
+        cursor_key = (cursor[0].timestamp(), cursor[1]) if cursor is not None else None
+
+        with self._lock:
+            cx0, cy0 = self._cell(lat_lo, lng_lo)
+            cx1, cy1 = self._cell(lat_hi, lng_hi)
+            n_cells = (cx1 - cx0 + 1) * (cy1 - cy0 + 1)
+            if n_cells > len(self._cells):
+                # 화면이 넓어 셀 순회가 더 비싸면 존재하는 셀만 순회
+                candidate_cells = [
+                    slots for (cx, cy), slots in self._cells.items()
+                    if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+                ]
+            else:
+                candidate_cells = [
+                    self._cells[(cx, cy)]
+                    for cx in range(cx0, cx1 + 1)
+                    for cy in range(cy0, cy1 + 1)
+                    if (cx, cy) in self._cells
+                ]
+
+            hits: List[Tuple[float, int, int]] = []
+            lats, lngs, ids, created = self._lats, self._lngs, self._ids, self._created_ts
+            for slots in candidate_cells:
+                for slot in slots:
+                    if not (lat_lo <= lats[slot] <= lat_hi and lng_lo <= lngs[slot] <= lng_hi):
+                        continue
+                    key = (created[slot], ids[slot])
+                    if cursor_key is not None and key >= cursor_key:
+                        continue
+                    resp = self._responses[slot]
+                    if resp is None or (cat_set is not None and resp.category not in cat_set):
+                        continue
+                    hits.append((key[0], key[1], slot))
+
+            hits.sort(reverse=True)
+            if limit is not None:
+                hits = hits[:limit]
+            return [(self._responses[slot], self._created_at[slot]) for _, _, slot in hits]  # type: ignore[misc]
+
+    def snapshot(self) -> Dict[int, MeetupResponse]:
+        with self._lock:
+            return {mid: self._responses[slot] for mid, slot in self._slot_by_id.items()}  # type: ignore[misc]
+
+
+meetup_index = MeetupGridIndex()
+_reconcile_task: Optional[asyncio.Task] = None
+last_reconcile: Dict[str, Any] = {}
+
+
+def _load_rows() -> Tuple[int, List[Row]]:
+    """(적재 전 스냅샷 xmin, RECRUITING 모임 행)."""
+    db = SessionLocal()
+    try:
+        sync_xmin = current_sync_xmin(db)
+        return sync_xmin, get_recruiting_meetup_rows(db)
+    finally:
+        db.close()
+
+
+async def warm_meetup_index() -> None:
+    """기동 시 RECRUITING 모임 전체 적재."""
+    sync_xmin, rows = await asyncio.to_thread(_load_rows)
+    meetup_index.load(rows)
+    meetup_index.sync_xmin = sync_xmin
+
+
+def _midpoint_close(a: Optional[dict], b: Optional[dict]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return math.isclose(a["lat"], b["lat"], abs_tol=MIDPOINT_TOL_DEG) and math.isclose(
+        a["lng"], b["lng"], abs_tol=MIDPOINT_TOL_DEG
+    )
+
+
+def _is_stale(held: MeetupResponse, fresh: MeetupResponse) -> bool:
+    """이벤트로 갱신되는 필드(current_count, midpoint)만 비교. midpoint 는 허용 오차 안이면 같다고 봄."""
+    return held.current_count != fresh.current_count or not _midpoint_close(held.midpoint, fresh.midpoint)
+
+
+async def reconcile_meetup_index() -> Dict[str, Any]:
+    """
+    DB와 정합성 검사. 누락(missing)/불필요(extra)/내용 불일치(stale) 개수를 세고 DB 기준으로 교정.
+    이벤트 유실·다른 워커에서의 생성을 이 주기 안에 흡수.
+    """
+    sync_xmin, rows = await asyncio.to_thread(_load_rows)
+    current = meetup_index.snapshot()
+    db_ids = set()
+    missing = stale = 0
+    for row in rows:
+        db_ids.add(row.id)
+        fresh = MeetupResponse.from_row(row)
+        held = current.get(row.id)
+        if held is None:
+            missing += 1
+            meetup_index.upsert(fresh, row.created_at)
+        elif _is_stale(held, fresh):
+            stale += 1
+            meetup_index.upsert(fresh, row.created_at)
+    extra_ids = set(current) - db_ids
+    for meetup_id in extra_ids:
+        meetup_index.remove(meetup_id)
+    meetup_index.ready = True
+    meetup_index.sync_xmin = sync_xmin
+    last_reconcile.update(
+        {
+            "at": datetime.now().isoformat(),
+            "size": len(meetup_index),
+            "missing": missing,
+            "stale": stale,
+            "extra": len(extra_ids),
+        }
+    )
+    return dict(last_reconcile)
+
+
+async def _reconcile_forever() -> None:
+    try:
+        await warm_meetup_index()
+        await asyncio.sleep(MEETUP_INDEX_RECONCILE_SEC)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        logger.warning("meetup index warm-up failed", exc_info=True)
+    while True:
+        try:
+            await reconcile_meetup_index()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("meetup index reconcile failed", exc_info=True)
+        await asyncio.sleep(MEETUP_INDEX_RECONCILE_SEC)
+
+
+async def on_meetup_event(event_name: str, payload: Dict[str, Any]) -> None:
+    """event_listener 핸들러: midpoint/current_count 갱신, RECRUITING 이탈 시 제거."""
+    meetup_id = int(payload["meetup_id"])
+    if event_name == "midpoint_updated":
+        fields: Dict[str, Any] = {"midpoint": payload.get("midpoint")}
+        if payload.get("current_count") is not None:
+            fields["current_count"] = payload["current_count"]
+        meetup_index.update_fields(meetup_id, **fields)
+    elif event_name == "meetup_status_changed" and payload.get("status") != ACTIVE_STATUS:
+        meetup_index.remove(meetup_id)
+
+
+def start_meetup_index() -> None:
+    """앱 startup 시 호출. 워밍 겸 주기적 정합성 검사 태스크 시작."""
+    global _reconcile_task
+    if MEETUP_INDEX_ENABLED and _reconcile_task is None:
+        _reconcile_task = asyncio.create_task(_reconcile_forever())
+
+
+async def stop_meetup_index() -> None:
+    global _reconcile_task
+    if _reconcile_task is not None:
+        _reconcile_task.cancel()
+        try:
+            await _reconcile_task
+        except asyncio.CancelledError:
+            pass
+        _reconcile_task = None
@@ -0,0 +1,41 @@
+# 모임 위치 조회 캐시: 이벤트 payload에는 meetup_id만 있으므로 위치 기반 무효화 시 사용
+# location은 생성 후 바뀌지 않으므로 워커 메모리에 LRU로 보관 (DB 조회는 최초 1회)
+
+import asyncio
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.crud.meetup_crud import get_meetup_lat_lng
+from app.database import SessionLocal
+
+LOCATION_CACHE_MAX = 50_000
+
+_cache: "OrderedDict[int, Tuple[float, float]]" = OrderedDict()
+
+
+def remember_meetup_location(meetup_id: int, lat: float, lng: float) -> None:
+    """이미 위치를 알고 있는 경우(생성 직후 등) 캐시에 직접 저장."""
+    _cache[meetup_id] = (lat, lng)
+    _cache.move_to_end(meetup_id)
+    while len(_cache) > LOCATION_CACHE_MAX:
+        _cache.popitem(last=False)
+
+
+def _load_location(meetup_id: int) -> Optional[Tuple[float, float]]:
+    db = SessionLocal()
+    try:
+        return get_meetup_lat_lng(db, meetup_id)
+    finally:
+        db.close()
+
+
+async def get_meetup_location(meetup_id: int) -> Optional[Tuple[float, float]]:
+    """meetup_id → (lat, lng). 캐시 miss 시 동기 DB 조회를 스레드에서 수행 (이벤트 루프 블로킹 방지)."""
+    cached = _cache.get(meetup_id)
+    if cached is not None:
+        _cache.move_to_end(meetup_id)
+        return cached
+    loc = await asyncio.to_thread(_load_location, meetup_id)
+    if loc is not None:
+        remember_meetup_location(meetup_id, *loc)
+    return loc
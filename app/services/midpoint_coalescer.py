@@ -0,0 +1,221 @@
+# join/leave 폭주 시 midpoint 발행(및 median 이외 전략의 재계산) 병합 (MIDPOINT_COALESCE_MS > 0 일 때만 사용)
+# - join/leave 는 commit 후 mark_midpoint_dirty() 만 호출 (모임별 변경 세대 번호 INCR + 미처리 목록 ZSET 등록)
+#   median 히스토그램 모드는 join/leave 트랜잭션에서 midpoint·히스토그램을 이미 갱신 → 여기서는 발행만 병합
+# - Redis SET NX 락을 잡은 워커 하나가 창(window)마다 확정 1회 + midpoint_updated 1건 (outbox 경유)
+# - 세대 번호가 처리 시점과 같을 때만 미처리 목록에서 제거 (Lua, 원자적) → 제거되지 않은 변경은 반드시 다시 처리
+#   - 락 해제 직후 세대 번호 재확인: 해제 직전 들어온 변경은 이 워커가 이어받음
+#   - 취소(shutdown)·오류: 락 해제 + 미처리 목록 점수를 0으로 → 어느 워커든 다음 복구 주기에 이어받음
+#   - 락 보유 워커가 죽음: 락 TTL 만료 후 복구 태스크(워커마다)가 오래된 미처리 항목을 찾아 이어받음
+# - Redis 장애 시 병합 없이 즉시 재계산 (이벤트는 outbox 에 남아 Redis 복구 후 발행)
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from app.crud.participation_crud import MIDPOINT_COALESCE_MS, recompute_midpoint_locked
+from app.database import AsyncSessionLocal
+from app.realtime import outbox
+from app.realtime.sse_pubsub import midpoint_event, redis_client
+
+logger = logging.getLogger(__name__)
+
+COALESCE_ENABLED = MIDPOINT_COALESCE_MS > 0
+# 락 TTL: 재계산 중 워커가 죽어도 다음 join 이 이어받을 수 있도록 (창마다 연장)
+LOCK_TTL_MS = max(MIDPOINT_COALESCE_MS * 10, 5000)
+DIRTY_TTL_SEC = 3600
+
+# 미처리 항목을 이어받기까지 기다리는 시간: 락 TTL 이 지나도 남아 있으면 보유 워커가 죽은 것
+RECOVERY_AFTER_MS = LOCK_TTL_MS + MIDPOINT_COALESCE_MS
+RECOVERY_INTERVAL_SEC = max(LOCK_TTL_MS / 2000, 1.0)
+RECOVERY_BATCH = 100
+
+DIRTY_KEY_PREFIX = "midpoint_dirty:"
+LOCK_KEY_PREFIX = "midpoint_lock:"
+# 미처리 모임 ZSET: member = meetup_id, score = 처리되지 않은 첫 표시 시각(ms)
+PENDING_KEY = "midpoint_pending"
+
+# 처리 완료: 세대 번호가 처리 시점과 같으면 미처리 목록에서 제거, 토큰이 일치하면 락 해제
+# (다른 워커가 TTL 만료 후 잡은 락을 지우지 않도록)
+_FINISH_LUA = """
+if (redis.call('get', KEYS[2]) or '') == ARGV[2] then
+    redis.call('zrem', KEYS[3], ARGV[3])
+end
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 이어받기: 아직 미처리면 점수를 0으로 (복구 주기에 바로 대상), 토큰이 일치하면 락 해제
+_HAND_OFF_LUA = """
+redis.call('zadd', KEYS[2], 'XX', 0, ARGV[2])
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 진행 중인 창 → (meetup_id, 락 토큰)
+_tasks: Dict[asyncio.Task, Tuple[int, str]] = {}
+_recovery_task: Optional[asyncio.Task] = None
+stats: Dict[str, int] = {"marks": 0, "flushes": 0, "fallbacks": 0, "errors": 0, "hand_offs": 0, "recovered": 0}
+
+
+def _dirty_key(meetup_id: int) -> str:
+    return f"{DIRTY_KEY_PREFIX}{meetup_id}"
+
+
+def _lock_key(meetup_id: int) -> str:
+    return f"{LOCK_KEY_PREFIX}{meetup_id}"
+
+
+async def _recompute(meetup_id: int) -> Optional[Tuple[int, Optional[Tuple[float, float]]]]:
+    async with AsyncSessionLocal() as db:
+        try:
+            result = await db.run_sync(recompute_midpoint_locked, meetup_id)
+            if result is not None:
+                current_count, midpoint = result
+                outbox.add_event(
+                    db,
+                    midpoint_event(
+                        meetup_id,
+                        {"lat": midpoint[0], "lng": midpoint[1]} if midpoint is not None else None,
+                        current_count,
+                    ),
+                )
+            await db.commit()
+            return result
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def _flush(meetup_id: int) -> None:
+    """재계산 1회 + midpoint_updated 1건 (같은 트랜잭션 outbox → relay 발행)."""
+    result = await _recompute(meetup_id)
+    stats["flushes"] += 1
+    if result is not None:
+        outbox.notify()
+
+
+async def _finish(meetup_id: int, token: str, generation: Optional[str]) -> None:
+    await redis_client.eval(
+        _FINISH_LUA, 3, _lock_key(meetup_id), _dirty_key(meetup_id), PENDING_KEY, token, generation or "", meetup_id
+    )
+
+
+async def _hand_off(meetup_id: int, token: str) -> None:
+    stats["hand_offs"] += 1
+    try:
+        await redis_client.eval(_HAND_OFF_LUA, 2, _lock_key(meetup_id), PENDING_KEY, token, meetup_id)
+    except Exception:
+        pass  # 락은 TTL 로 만료, 미처리 항목은 RECOVERY_AFTER_MS 후 복구 태스크가 이어받음
+
+
+async def _drain(meetup_id: int, token: str) -> None:
+    """락 보유 워커: 변경이 멈출 때까지 창마다 확정·발행."""
+    window = MIDPOINT_COALESCE_MS / 1000
+    dirty, lock = _dirty_key(meetup_id), _lock_key(meetup_id)
+    try:
+        while True:
+            await asyncio.sleep(window)
+            # 세대 번호를 먼저 읽고 처리 → 읽은 뒤 들어온 변경은 번호가 달라져 다음 창에서 처리
+            generation = await redis_client.get(dirty)
+            await _flush(meetup_id)
+            if await redis_client.get(dirty) != generation:
+                await redis_client.pexpire(lock, LOCK_TTL_MS)
+                continue
+            await _finish(meetup_id, token, generation)
+            # 해제 직전에 표시된 변경은 락 획득에 실패했으므로 여기서 이어받음
+            if await redis_client.get(dirty) == generation:
+                return
+            if not await redis_client.set(lock, token, nx=True, px=LOCK_TTL_MS):
+                return  # 다른 워커가 이어받음
+    except asyncio.CancelledError:
+        raise  # shutdown: stop_midpoint_coalescer 가 이어받기 표시
+    except Exception:
+        stats["errors"] += 1
+        logger.warning("midpoint coalescer failed: meetup %s", meetup_id, exc_info=True)
+        await _hand_off(meetup_id, token)
+
+
+def _spawn(meetup_id: int, token: str) -> None:
+    task = asyncio.create_task(_drain(meetup_id, token))
+    _tasks[task] = (meetup_id, token)
+    task.add_done_callback(lambda t: _tasks.pop(t, None))
+
+
+async def mark_midpoint_dirty(meetup_id: int) -> None:
+    """join/leave commit 후 호출. 락을 잡으면 이 워커가 창 단위 재계산·발행 담당."""
+    stats["marks"] += 1
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.incr(_dirty_key(meetup_id))
+        pipe.expire(_dirty_key(meetup_id), DIRTY_TTL_SEC)
+        pipe.zadd(PENDING_KEY, {str(meetup_id): int(time.time() * 1000)}, nx=True)
+        await pipe.execute()
+        token = uuid.uuid4().hex
+        if await redis_client.set(_lock_key(meetup_id), token, nx=True, px=LOCK_TTL_MS):
+            _spawn(meetup_id, token)
+    except Exception:
+        # Redis 장애: 병합 없이 즉시 재계산 (DB midpoint 는 최신 유지, 이벤트는 outbox 에서 재시도)
+        stats["fallbacks"] += 1
+        try:
+            await _flush(meetup_id)
+        except Exception:
+            logger.warning("midpoint recompute failed: meetup %s", meetup_id, exc_info=True)
+
+
+async def _recover_once() -> int:
+    """RECOVERY_AFTER_MS 이상 처리되지 않은 모임의 락을 잡아 이어받음. 반환: 이어받은 수."""
+    cutoff = int(time.time() * 1000) - RECOVERY_AFTER_MS
+    members = await redis_client.zrangebyscore(PENDING_KEY, "-inf", cutoff, start=0, num=RECOVERY_BATCH)
+    recovered = 0
+    for member in members:
+        meetup_id = int(member)
+        token = uuid.uuid4().hex
+        if await redis_client.set(_lock_key(meetup_id), token, nx=True, px=LOCK_TTL_MS):
+            _spawn(meetup_id, token)
+            recovered += 1
+    stats["recovered"] += recovered
+    return recovered
+
+
+async def _recover_forever() -> None:
+    while True:
+        await asyncio.sleep(RECOVERY_INTERVAL_SEC)
+        try:
+            await _recover_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("midpoint coalescer recovery failed", exc_info=True)
+
+
+def start_midpoint_coalescer() -> None:
+    """앱 startup 에서 호출 (워커당 1개): 중단된 병합 작업 복구 태스크."""
+    global _recovery_task
+    if COALESCE_ENABLED and (_recovery_task is None or _recovery_task.done()):
+        _recovery_task = asyncio.create_task(_recover_forever())
+
+
+async def stop_midpoint_coalescer() -> None:
+    """앱 shutdown 시 복구 태스크 종료 + 진행 중인 창 취소 후 이어받기 표시 (다른 워커가 다음 복구 주기에 처리)."""
+    global _recovery_task
+    if _recovery_task is not None:
+        _recovery_task.cancel()
+        await asyncio.gather(_recovery_task, return_exceptions=True)
+        _recovery_task = None
+    pending = list(_tasks.items())
+    for task, _ in pending:
+        task.cancel()
+    await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+    # 시작 전에 취소된 창도 있으므로 (except 절 미실행) 여기서 일괄 처리
+    for _, (meetup_id, token) in pending:
+        await _hand_off(meetup_id, token)
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"enabled": COALESCE_ENABLED, "window_ms": MIDPOINT_COALESCE_MS, "pending": len(_tasks), **stats}
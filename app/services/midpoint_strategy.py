@@ -0,0 +1,177 @@
+# 모임 midpoint 계산 전략
+# - median: 위도/경도 각각의 중앙값 (기본, 히스토그램 증분 갱신 가능)
+# - geometric_median: 모든 참여자까지 거리 합이 최소인 점 (Weiszfeld, NumPy 벡터화)
+# - minimax: 가장 먼 참여자까지 거리가 최소인 점 (최소 외접원 중심)
+# 모임별(meetups.midpoint_strategy) 또는 카테고리별(MIDPOINT_STRATEGY_BY_CATEGORY) 선택
+#
+# 거리 계산은 참여자 중심 위도 기준 등거리 투영(경도 × cos(lat0))으로 평면 근사
+# (모임 반경 수 km 규모에서는 오차 무시 가능)
+
+import math
+import os
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+MIDPOINT_STRATEGIES = ("median", "geometric_median", "minimax")
+DEFAULT_STRATEGY = os.getenv("MIDPOINT_STRATEGY", "median")
+# 예: "MEAL:geometric_median,OUTDOOR:minimax"
+MIDPOINT_STRATEGY_BY_CATEGORY: Dict[str, str] = {
+    cat.strip(): name.strip()
+    for cat, _, name in (
+        item.partition(":") for item in os.getenv("MIDPOINT_STRATEGY_BY_CATEGORY", "").split(",") if item.strip()
+    )
+    if name.strip() in MIDPOINT_STRATEGIES
+}
+# Weiszfeld 반복 상한 / 수렴 기준 (투영 좌표 이동량, 도 단위 ≈ 1cm)
+WEISZFELD_MAX_ITER = int(os.getenv("WEISZFELD_MAX_ITER", "64"))
+WEISZFELD_TOL_DEG = 1e-7
+
+MidpointFn = Callable[[np.ndarray, np.ndarray], Tuple[float, float]]
+
+
+def resolve_strategy(meetup_strategy: Optional[str], category: Optional[str]) -> str:
+    """모임 지정 > 카테고리 기본값 > MIDPOINT_STRATEGY 순으로 전략 이름 결정."""
+    if meetup_strategy in MIDPOINT_STRATEGIES:
+        return meetup_strategy  # type: ignore[return-value]
+    if category and category in MIDPOINT_STRATEGY_BY_CATEGORY:
+        return MIDPOINT_STRATEGY_BY_CATEGORY[category]
+    return DEFAULT_STRATEGY if DEFAULT_STRATEGY in MIDPOINT_STRATEGIES else "median"
+
+
+def _project(lats: np.ndarray, lngs: np.ndarray) -> Tuple[np.ndarray, float]:
+    """(lat, lng) → 평면 좌표 (N, 2) [x=lng·cos(lat0), y=lat], 그리고 cos(lat0)."""
+    k = math.cos(math.radians(float(lats.mean())))
+    return np.column_stack((lngs * k, lats)), k
+
+
+def median_midpoint(lats: np.ndarray, lngs: np.ndarray) -> Tuple[float, float]:
+    """좌표별 중앙값 (statistics.median 과 같은 값)."""
+    return float(np.median(lats)), float(np.median(lngs))
+
+
+def geometric_median_midpoint(lats: np.ndarray, lngs: np.ndarray) -> Tuple[float, float]:
+    """
+    Weiszfeld 반복으로 거리 합 최소점. 좌표별 중앙값에서 시작, 최대 WEISZFELD_MAX_ITER 회.
+    현재 점이 참여자 좌표와 겹치면(거리 0) 그 점의 가중치를 제외 (Vardi–Zhang 단순화).
+    """
+    pts, k = _project(lats, lngs)
+    if len(pts) <= 2:
+        # 두 점 이하: 선분 위 어느 점이든 최소 → 가운데
+        x, y = pts.mean(axis=0)
+        return float(y), float(x / k)
+    cur = np.median(pts, axis=0)
+    for _ in range(WEISZFELD_MAX_ITER):
+        d = np.hypot(pts[:, 0] - cur[0], pts[:, 1] - cur[1])
+        mask = d > 1e-12
+        if not mask.any():
+            break
+        w = 1.0 / d[mask]
+        nxt = (pts[mask] * w[:, None]).sum(axis=0) / w.sum()
+        if np.hypot(*(nxt - cur)) < WEISZFELD_TOL_DEG:
+            cur = nxt
+            break
+        cur = nxt
+    return float(cur[1]), float(cur[0] / k)
+
+
+def _circle_two(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, float]:
+    c = (a + b) / 2
+    return c, float(np.hypot(*(a - c)))
+
+
+def _circle_three(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> Optional[Tuple[np.ndarray, float]]:
+    """세 점의 외접원. 일직선이면 None."""
+    bx, by = b - a
+    cx, cy = c - a
+    d = 2 * (bx * cy - by * cx)
+    if abs(d) < 1e-18:
+        return None
+    ux = (cy * (bx * bx + by * by) - by * (cx * cx + cy * cy)) / d
+    uy = (bx * (cx * cx + cy * cy) - cx * (bx * bx + by * by)) / d
+    center = a + np.array([ux, uy])
+    return center, float(np.hypot(ux, uy))
+
+
+def minimax_midpoint(lats: np.ndarray, lngs: np.ndarray) -> Tuple[float, float]:
+    """
+    최소 외접원 중심 (Welzl 증분 알고리즘, 무작위 순서 → 기대 O(n)).
+    "현재 원 밖의 다음 점"을 NumPy로 한 번에 찾음 → Python 루프는 원이 바뀔 때만 돌고, 단계마다 n 회 이하.
+    """
+    pts, k = _project(lats, lngs)
+    pts = pts[np.random.default_rng(0).permutation(len(pts))]
+    eps = 1e-12
+
+    def next_outside(center: np.ndarray, r: float, start: int, stop: int) -> int:
+        """pts[start:stop] 중 원 밖인 첫 점의 인덱스, 없으면 -1."""
+        seg = pts[start:stop]
+        idx = np.flatnonzero(np.hypot(seg[:, 0] - center[0], seg[:, 1] - center[1]) > r + eps)
+        return start + int(idx[0]) if len(idx) else -1
+
+    center, r = pts[0].copy(), 0.0
+    i = next_outside(center, r, 1, len(pts))
+    while i >= 0:
+        # pts[i] 는 새 원의 경계 위: pts[:i] 로 다시 구성
+        center, r = pts[i].copy(), 0.0
+        j = next_outside(center, r, 0, i)
+        while j >= 0:
+            center, r = _circle_two(pts[i], pts[j])
+            m = next_outside(center, r, 0, j)
+            while m >= 0:
+                circle = _circle_three(pts[i], pts[j], pts[m])
+                if circle is None:
+                    # 일직선: 가장 먼 두 점을 지름으로
+                    circle = max(
+                        (_circle_two(pts[i], pts[j]), _circle_two(pts[i], pts[m]), _circle_two(pts[j], pts[m])),
+                        key=lambda cr: cr[1],
+                    )
+                center, r = circle
+                m = next_outside(center, r, m + 1, j)
+            j = next_outside(center, r, j + 1, i)
+        i = next_outside(center, r, i + 1, len(pts))
+    return float(center[1]), float(center[0] / k)
+
+
+_STRATEGY_FNS: Dict[str, MidpointFn] = {
+    "median": median_midpoint,
+    "geometric_median": geometric_median_midpoint,
+    "minimax": minimax_midpoint,
+}
+
+
+def compute_midpoint(strategy: str, coords: Sequence[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """(lat, lng) 목록 → 전략별 midpoint (lat, lng). 비어 있으면 None."""
+    if not coords:
+        return None
+    arr = np.asarray(coords, dtype=float)
+    return _STRATEGY_FNS.get(strategy, median_midpoint)(arr[:, 0], arr[:, 1])
+
+
+if __name__ == "__main__":
+    # 마이크로 벤치마크: python -m app.services.midpoint_strategy
+    import random
+    import statistics
+    import timeit
+
+    random.seed(1)
+    for n in (10, 100, 1000):
+        coords = [(37.45 + random.random() * 0.15, 126.9 + random.random() * 0.2) for _ in range(n)]
+        mid = compute_midpoint("median", coords)
+        assert mid == (statistics.median(c[0] for c in coords), statistics.median(c[1] for c in coords))
+        # minimax: 모든 점이 원 안 (투영 좌표 기준), 가장 먼 점까지 거리 ≤ 중앙값 기준 거리
+        arr = np.asarray(coords)
+        k = math.cos(math.radians(arr[:, 0].mean()))
+
+        def far(p: Tuple[float, float]) -> float:
+            return float(np.hypot((arr[:, 1] - p[1]) * k, arr[:, 0] - p[0]).max())
+
+        def total(p: Tuple[float, float]) -> float:
+            return float(np.hypot((arr[:, 1] - p[1]) * k, arr[:, 0] - p[0]).sum())
+
+        assert far(compute_midpoint("minimax", coords)) <= far(mid) + 1e-12
+        assert total(compute_midpoint("geometric_median", coords)) <= total(mid) + 1e-12
+        line = [f"n={n:>5}"]
+        for name in MIDPOINT_STRATEGIES:
+            t = timeit.timeit(lambda: compute_midpoint(name, coords), number=50) / 50
+            line.append(f"{name}: {t * 1000:7.3f} ms")
+        print("   ".join(line))
@@ -7,7 +7,8 @@ import time
 from typing import Any, Dict, List, Optional
 
 from app.integrations.kakao_local import search_poi_near
-from app.realtime.sse_pubsub import publish_poi_update, redis_client
+from app.realtime import publisher
+from app.realtime.sse_pubsub import poi_updated_event, redis_client
 
 POI_CACHE_TTL_SEC = int(os.getenv("POI_CACHE_TTL_SEC", "120"))
 POI_MIN_REFRESH_SEC = float(os.getenv("POI_MIN_REFRESH_SEC", "3"))
@@ -103,8 +104,8 @@ async def get_pois_for_meetup(
     await redis_client.set(f"{LAST_MIDPOINT_KEY}{meetup_id}", f"{mid_lat},{mid_lng}")
     await redis_client.set(f"{LAST_POI_TS_KEY}{meetup_id}", str(now_ts))
 
-    # SSE로 poi_updated 발행
+    # SSE로 poi_updated 발행 (일괄 발행 큐에 넣고 기다리지 않음)
     midpoint = {"lat": mid_lat, "lng": mid_lng}
-    await publish_poi_update(meetup_id, midpoint, pois)
+    publisher.enqueue(poi_updated_event(meetup_id, midpoint, pois))
 
     return pois
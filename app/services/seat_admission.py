@@ -0,0 +1,210 @@
+# 인기 모임 join 입장 제어: Redis 좌석 카운터로 정원 초과 요청을 Postgres 전에 거절
+# - meetup_seats:{id} = 남은 좌석 수 (capacity - current_count, RECRUITING 이 아니면 CLOSED_SEATS). 첫 join 때 DB에서 시드
+# - join 전 Lua 로 원자적 예약(남은 좌석 > 0 이면 DECR) → 0 이면 즉시 400
+# - CLOSED_SEATS(모집 중 아님)면 예약하지 않고 DB 경로로 → 확정/모집 종료 409 를 DB가 판정
+# - DB join 실패(중복 참여, 상태 변경, 오류 등) 시 예약 반환(INCR), leave 성공 시 좌석 반환
+# - 주기적으로 DB와 비교해 카운터 드리프트 교정 (DB의 조건부 UPDATE 가 최종 판정, 이 계층은 빠른 거절용)
+# - SEAT_ADMISSION_ENABLED=true 일 때만 사용 (기본 비활성). Redis 장애 시 통과(fail-open)
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.crud.meetup_crud import get_meetup_seat_rows
+from app.database import SessionLocal
+from app.models.meetup import MeetupStatus
+from app.realtime.sse_pubsub import redis_client
+
+logger = logging.getLogger(__name__)
+
+SEAT_ADMISSION_ENABLED = os.getenv("SEAT_ADMISSION_ENABLED", "false").lower() in ("1", "true", "yes")
+# 카운터 TTL: 조용해진 모임의 키는 만료 → 다음 join 때 DB에서 다시 시드
+SEAT_TTL_SEC = int(os.getenv("SEAT_TTL_SEC", "600"))
+# 드리프트 검사 주기 (초)
+SEAT_RECONCILE_SEC = float(os.getenv("SEAT_RECONCILE_SEC", "30"))
+
+SEAT_KEY_PREFIX = "meetup_seats:"
+# RECRUITING 이 아닌 모임의 카운터 값 (만석 0 과 구분)
+CLOSED_SEATS = -1
+RECONCILE_BATCH = 200
+
+# 반환: 1 예약 성공, 0 만석, -1 카운터 없음(시드 필요), -2 모집 중 아님(CLOSED_SEATS)
+_RESERVE_LUA = """
+local v = redis.call('GET', KEYS[1])
+if not v then return -1 end
+local n = tonumber(v)
+if n < 0 then return -2 end
+if n == 0 then return 0 end
+redis.call('DECR', KEYS[1])
+return 1
+"""
+
+# 카운터가 있고 모집 중일 때만 좌석 반환 (만료된 키를 되살리지 않음 — 다음 시드가 DB 기준으로 생성)
+_RELEASE_LUA = """
+local v = redis.call('GET', KEYS[1])
+if v and tonumber(v) >= 0 then
+    return redis.call('INCR', KEYS[1])
+end
+return -1
+"""
+
+# 드리프트 교정: 직전 검사에서 관측한 값과 지금 값이 같을 때만 덮어씀
+# (검사 사이에 예약/반환이 있었다면 진행 중인 join 일 수 있으므로 다음 주기로 미룸)
+_CORRECT_LUA = """
+local v = redis.call('GET', KEYS[1])
+if not v or v ~= ARGV[1] then return 0 end
+redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+return 1
+"""
+
+_reconcile_task: Optional[asyncio.Task] = None
+# 드리프트 후보: meetup_id → (관측한 Redis 값, DB 기준 남은 좌석)
+_suspect: Dict[int, Tuple[str, int]] = {}
+stats: Dict[str, int] = {"admitted": 0, "rejected": 0, "released": 0, "seeded": 0, "drift_fixed": 0, "errors": 0}
+
+
+def _seat_key(meetup_id: int) -> str:
+    return f"{SEAT_KEY_PREFIX}{meetup_id}"
+
+
+def _remaining(row: Any) -> int:
+    if row.status != MeetupStatus.RECRUITING.value:
+        return CLOSED_SEATS
+    return max(row.capacity - row.current_count, 0)
+
+
+def _load_remaining(meetup_ids: List[int]) -> Dict[int, int]:
+    db = SessionLocal()
+    try:
+        return {row.id: _remaining(row) for row in get_meetup_seat_rows(db, meetup_ids)}
+    finally:
+        db.close()
+
+
+async def reserve_seat(meetup_id: int) -> Optional[bool]:
+    """
+    좌석 하나 예약. True: 예약됨(DB join 후 실패하면 release_seat 필요), False: 만석 → 즉시 거절,
+    None: 판단 불가(모임 없음, 모집 중 아님, Redis 장애) → DB 경로로 진행 (404/409 는 DB가 판정).
+    """
+    key = _seat_key(meetup_id)
+    try:
+        result = await redis_client.eval(_RESERVE_LUA, 1, key)
+        if result == -1:
+            remaining = (await asyncio.to_thread(_load_remaining, [meetup_id])).get(meetup_id)
+            if remaining is None:
+                return None  # 모임 없음 → DB 경로에서 404
+            if await redis_client.set(key, remaining, nx=True, ex=SEAT_TTL_SEC):
+                stats["seeded"] += 1
+            result = await redis_client.eval(_RESERVE_LUA, 1, key)
+    except Exception:
+        stats["errors"] += 1
+        return None
+    if result == 1:
+        stats["admitted"] += 1
+        return True
+    if result == 0:
+        stats["rejected"] += 1
+        return False
+    return None
+
+
+async def release_seat(meetup_id: int) -> None:
+    """예약 반환 (DB join 실패) 또는 좌석 반환 (leave 성공)."""
+    try:
+        if await redis_client.eval(_RELEASE_LUA, 1, _seat_key(meetup_id)) != -1:
+            stats["released"] += 1
+    except Exception:
+        stats["errors"] += 1  # 드리프트 검사/TTL 만료로 교정
+
+
+async def reset_seats(meetup_id: int) -> None:
+    """상태 변경 등으로 정원 판단이 바뀐 경우 카운터 삭제 → 다음 join 때 DB에서 재시드."""
+    try:
+        await redis_client.delete(_seat_key(meetup_id))
+    except Exception:
+        pass
+
+
+async def reconcile_seats() -> Dict[str, int]:
+    """
+    Redis 좌석 카운터를 DB(capacity - current_count)와 비교.
+    어긋난 값이 두 번 연속 같은 상태로 관측되면 교정 (진행 중인 예약과의 경합 회피).
+    """
+    checked = fixed = 0
+    seen: Dict[int, Tuple[str, int]] = {}
+    async for batch in _scan_batches():
+        values = await redis_client.mget([_seat_key(mid) for mid in batch])
+        truth = await asyncio.to_thread(_load_remaining, batch)
+        for meetup_id, value in zip(batch, values):
+            if value is None:
+                continue
+            checked += 1
+            expected = truth.get(meetup_id)
+            if expected is None:
+                await redis_client.delete(_seat_key(meetup_id))  # 삭제된 모임
+                continue
+            if int(value) == expected:
+                continue
+            if _suspect.get(meetup_id) == (value, expected):
+                if await redis_client.eval(_CORRECT_LUA, 1, _seat_key(meetup_id), value, expected):
+                    fixed += 1
+            else:
+                seen[meetup_id] = (value, expected)
+    _suspect.clear()
+    _suspect.update(seen)
+    stats["drift_fixed"] += fixed
+    return {"checked": checked, "fixed": fixed, "suspect": len(seen)}
+
+
+async def _scan_batches():
+    batch: List[int] = []
+    async for key in redis_client.scan_iter(match=f"{SEAT_KEY_PREFIX}*", count=RECONCILE_BATCH):
+        try:
+            batch.append(int(key[len(SEAT_KEY_PREFIX):]))
+        except ValueError:
+            continue
+        if len(batch) >= RECONCILE_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _reconcile_forever() -> None:
+    while True:
+        await asyncio.sleep(SEAT_RECONCILE_SEC)
+        try:
+            await reconcile_seats()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("seat admission reconcile failed", exc_info=True)
+
+
+async def on_meetup_event(event_name: str, payload: Dict[str, Any]) -> None:
+    """event_listener 핸들러: 상태 변경 시 카운터 삭제 (RECRUITING 이탈 → 다음 시드는 CLOSED_SEATS)."""
+    if event_name == "meetup_status_changed":
+        await reset_seats(int(payload["meetup_id"]))
+
+
+def start_seat_admission() -> None:
+    """앱 startup 시 호출. 드리프트 검사 태스크 시작."""
+    global _reconcile_task
+    if SEAT_ADMISSION_ENABLED and _reconcile_task is None:
+        _reconcile_task = asyncio.create_task(_reconcile_forever())
+
+
+async def stop_seat_admission() -> None:
+    global _reconcile_task
+    if _reconcile_task is not None:
+        _reconcile_task.cancel()
+        try:
+            await _reconcile_task
+        except asyncio.CancelledError:
+            pass
+        _reconcile_task = None
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"enabled": SEAT_ADMISSION_ENABLED, **stats}
@@ -0,0 +1,136 @@
+# MVT 타일 Redis 캐시: (z, x, y) 키로 바이너리 저장, meetup 이벤트로 해당 위치 타일만 무효화
+# - 타일마다 세대 번호(tilegen:*): 무효화 시 INCR. miss 때 읽은 세대가 저장 시점까지 그대로일 때만 저장
+#   (타일 생성 도중 무효화가 지나가면 옛 타일을 다시 캐시하지 않음)
+# - 모든 워커의 리스너가 같은 이벤트를 받으므로 event_id 별 완료 표시(tileinv:*)로 무효화는 한 번만
+
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.realtime.sse_pubsub import REDIS_URL
+from app.services.meetup_locations import get_meetup_location
+
+TILE_CACHE_TTL_SEC = int(os.getenv("TILE_CACHE_TTL_SEC", "300"))
+# 이 줌까지만 캐시 (그 이상은 타일 수가 많고 재사용률이 낮음)
+TILE_CACHE_MAX_ZOOM = int(os.getenv("TILE_CACHE_MAX_ZOOM", "18"))
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+TILE_KEY_PREFIX = "tile:"
+TILE_GEN_PREFIX = "tilegen:"
+INVALIDATED_PREFIX = "tileinv:"
+# 세대 키 TTL: 타일 생성(DB 조회 한 번)보다 충분히 길게, 이벤트가 없는 타일의 키는 결국 정리
+GEN_TTL_SEC = 86400
+# 이벤트별 완료 표시 TTL (워커들이 같은 이벤트를 받는 시간차보다 충분히 길게)
+INVALIDATED_TTL_SEC = 600
+
+# 타일은 바이너리이므로 decode_responses=False 별도 클라이언트 사용
+tile_redis = redis.from_url(REDIS_URL, decode_responses=False)
+
+# 타일 속성(status/category)에 영향을 주는 이벤트만 무효화 대상
+INVALIDATING_EVENTS = {"meetup_status_changed"}
+
+# 세대가 miss 때와 같을 때만 저장. KEYS: 타일 키, 세대 키 / ARGV: miss 때 세대, 타일, TTL
+_FILL_LUA = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then return 0 end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+# 세대 증가 + 타일 삭제. ARGV[2] == '1' 이면 KEYS[1](이벤트 완료 표시)을 선점한 워커만 수행 (나머지 -1)
+# KEYS: 완료 표시 키, 세대 키 n개, 타일 키 n개 / ARGV: 세대 키 TTL, 완료 표시 사용 여부, 완료 표시 TTL
+_INVALIDATE_LUA = """
+if ARGV[2] == '1' and not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[3]) then
+    return -1
+end
+local n = (#KEYS - 1) / 2
+for i = 2, 1 + n do
+    redis.call('INCR', KEYS[i])
+    redis.call('EXPIRE', KEYS[i], ARGV[1])
+end
+return redis.call('DEL', unpack(KEYS, 2 + n))
+"""
+
+
+def _tile_key(z: int, x: int, y: int) -> str:
+    return f"{TILE_KEY_PREFIX}{z}:{x}:{y}"
+
+
+def _gen_key(z: int, x: int, y: int) -> str:
+    return f"{TILE_GEN_PREFIX}{z}:{x}:{y}"
+
+
+def tiles_for_point(lat: float, lng: float) -> List[Tuple[int, int, int]]:
+    """
+    좌표를 포함하는(버퍼 포함) 모든 캐시 대상 타일 (z, x, y) 목록.
+    타일 경계 근처 점은 이웃 타일의 buffer에도 그려지므로 줌마다 최대 4개.
+    """
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    lat_rad = math.radians(lat)
+    fx = (lng + 180.0) / 360.0
+    fy = (1.0 - math.log(math.tan(lat_rad) + 1.0 / math.cos(lat_rad)) / math.pi) / 2.0
+    pad = TILE_BUFFER / TILE_EXTENT
+    tiles: List[Tuple[int, int, int]] = []
+    for z in range(TILE_CACHE_MAX_ZOOM + 1):
+        n = 2 ** z
+        xs = {min(max(int(math.floor(fx * n + d)), 0), n - 1) for d in (-pad, pad)}
+        ys = {min(max(int(math.floor(fy * n + d)), 0), n - 1) for d in (-pad, pad)}
+        tiles.extend((z, x, y) for x in xs for y in ys)
+    return tiles
+
+
+async def get_cached_tile(z: int, x: int, y: int) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    (캐시된 타일, miss 때 세대 → set_cached_tile 에 그대로 전달). Redis 왕복 1회.
+    미스면 타일 None, 캐시 대상 밖/Redis 오류면 (None, None) (DB에서 생성, 저장 안 함).
+    """
+    if z > TILE_CACHE_MAX_ZOOM:
+        return None, None
+    try:
+        pipe = tile_redis.pipeline(transaction=False)
+        pipe.get(_tile_key(z, x, y))
+        pipe.get(_gen_key(z, x, y))
+        tile, gen = await pipe.execute()
+    except Exception:
+        return None, None
+    return tile, gen or b""
+
+
+async def set_cached_tile(z: int, x: int, y: int, gen: Optional[bytes], tile: bytes) -> None:
+    """gen(get_cached_tile 의 miss 세대)이 지금 세대와 같을 때만 저장 (그 사이 무효화됐으면 버림)."""
+    if gen is None:
+        return
+    try:
+        await tile_redis.eval(_FILL_LUA, 2, _tile_key(z, x, y), _gen_key(z, x, y), gen, tile, TILE_CACHE_TTL_SEC)
+    except Exception:
+        pass
+
+
+async def invalidate_tiles_at(lat: float, lng: float, event_id: Optional[str] = None) -> None:
+    """
+    좌표가 포함된 모든 줌 레벨 타일 삭제 (모임 생성/상태 변경 시).
+    event_id 가 있으면 그 이벤트에 대해 워커 하나만 수행.
+    """
+    tiles = tiles_for_point(lat, lng)
+    done_key = f"{INVALIDATED_PREFIX}{event_id or ''}"
+    try:
+        await tile_redis.eval(
+            _INVALIDATE_LUA, 1 + 2 * len(tiles), done_key,
+            *(_gen_key(*t) for t in tiles), *(_tile_key(*t) for t in tiles),
+            GEN_TTL_SEC, "1" if event_id else "0", INVALIDATED_TTL_SEC,
+        )
+    except Exception:
+        pass
+
+
+async def on_meetup_event(event_name: str, payload: Dict[str, Any]) -> None:
+    """event_listener 핸들러: 상태 변경 이벤트 → 해당 모임 위치 타일 무효화."""
+    if event_name not in INVALIDATING_EVENTS:
+        return
+    meetup_id = int(payload["meetup_id"])
+    loc = await get_meetup_location(meetup_id)
+    if loc is not None:
+        event_id = payload.get("event_id")
+        await invalidate_tiles_at(*loc, event_id=f"{meetup_id}:{event_id}" if event_id else None)
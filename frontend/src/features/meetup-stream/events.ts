@@ -6,7 +6,13 @@
 import type { QueryClient } from '@tanstack/react-query';
 import { meetupKeys, poiKeys } from '@/shared/api';
 import type { MeetupDetailOut, MeetupResponse } from '@/types';
-import type { SSEMidpointUpdated, SSEPoiUpdated, SSEPoiConfirmed, SSEMeetupStatusChanged } from '@/types/sse';
+import type {
+  SSEMidpointUpdated,
+  SSEPoiUpdated,
+  SSEPoiConfirmed,
+  SSEMeetupStatusChanged,
+  SSEResyncRequired,
+} from '@/types/sse';
 
 function patchDetail(
   queryClient: QueryClient,
@@ -69,12 +75,19 @@ export function applyMeetupStatusChanged(queryClient: QueryClient, data: SSEMeet
   const { meetup_id, status } = data;
   patchDetail(queryClient, meetup_id, { status: status as MeetupDetailOut['status'] });
 
+  // 지도 목록은 RECRUITING 만 조회하므로 모집이 끝난 모임은 목록에서 제거
   const listQueries = queryClient.getQueriesData<MeetupResponse[]>({ queryKey: meetupKeys.lists() });
   listQueries.forEach(([queryKey, list]) => {
     if (!Array.isArray(list)) return;
-    const updated = list.map((m) =>
-      m.id === meetup_id ? { ...m, status: status as MeetupResponse['status'] } : m
-    );
+    const updated = list
+      .filter((m) => m.id !== meetup_id || status === 'RECRUITING')
+      .map((m) => (m.id === meetup_id ? { ...m, status: status as MeetupResponse['status'] } : m));
     queryClient.setQueryData(queryKey, updated);
   });
 }
+
+/** resync_required: 놓친 이벤트를 이어받을 수 없음 → detail + POI 캐시 무효화(재조회) */
+export function applyResyncRequired(queryClient: QueryClient, data: SSEResyncRequired): void {
+  queryClient.invalidateQueries({ queryKey: meetupKeys.detail(data.meetup_id) });
+  queryClient.invalidateQueries({ queryKey: poiKeys.list(data.meetup_id) });
+}
@@ -6,8 +6,14 @@ import {
   applyPoiUpdated,
   applyPoiConfirmed,
   applyMeetupStatusChanged,
+  applyResyncRequired,
 } from '../events';
-import type { SSEMidpointUpdated, SSEPoiConfirmed, SSEMeetupStatusChanged } from '@/types/sse';
+import type {
+  SSEMidpointUpdated,
+  SSEPoiConfirmed,
+  SSEMeetupStatusChanged,
+  SSEResyncRequired,
+} from '@/types/sse';
 import type { SSEPoiUpdated } from '@/types/sse';
 
 const STREAM_PATH = '/meetups';
@@ -25,6 +31,8 @@ function parseJsonSafe<T>(raw: string): T | null {
 /**
  * SSE stream for a single meetup. Patches TanStack Query cache on events.
  * Reconnects on error/close with exponential backoff; cleanup on unmount.
+ * 재접속 시 마지막으로 받은 이벤트 id(첫 stream_opened 포함)를 ?last_event_id= 로 전달 → 놓친 이벤트만 재전송
+ * (새 EventSource 는 Last-Event-ID 헤더를 이어받지 않음). 이어받을 수 없으면 resync_required → 재조회.
  */
 export function useMeetupStream(meetupId: number | null): void {
   const queryClient = useQueryClient();
@@ -32,11 +40,13 @@ export function useMeetupStream(meetupId: number | null): void {
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const attemptRef = useRef(0);
   const connectionIdRef = useRef(0);
+  const lastEventIdRef = useRef<string | null>(null);
 
   useEffect(() => {
     if (meetupId == null || meetupId <= 0) return;
 
     const connectionId = ++connectionIdRef.current;
+    lastEventIdRef.current = null;
     const debug = config.debugSse;
     const base = config.streamBaseUrl || '';
     const url = `${base}${STREAM_PATH}/${meetupId}/midpoint/stream`;
@@ -45,33 +55,54 @@ export function useMeetupStream(meetupId: number | null): void {
       if (connectionIdRef.current !== connectionId) {
         return;
       }
-      const es = new EventSource(url);
+      const lastEventId = lastEventIdRef.current;
+      const es = new EventSource(
+        lastEventId ? `${url}?last_event_id=${encodeURIComponent(lastEventId)}` : url
+      );
       eventSourceRef.current = es;
       if (debug) {
         // eslint-disable-next-line no-console
-        console.debug('[SSE] open meetup stream', { meetupId, connectionId });
+        console.debug('[SSE] open meetup stream', { meetupId, connectionId, lastEventId });
       }
 
+      const track = (e: MessageEvent) => {
+        if (e.lastEventId) lastEventIdRef.current = e.lastEventId;
+      };
+
+      // 첫 접속: 현재 스트림 위치(id) → 이벤트를 받기 전에 끊겨도 재접속 시 놓친 이벤트 재전송
+      es.addEventListener('stream_opened', track);
+
       es.addEventListener('midpoint_updated', (e: MessageEvent) => {
+        track(e);
         const data = parseJsonSafe<SSEMidpointUpdated>(e.data);
         if (data) applyMidpointUpdated(queryClient, data);
       });
 
       es.addEventListener('poi_updated', (e: MessageEvent) => {
+        track(e);
         const data = parseJsonSafe<SSEPoiUpdated>(e.data);
         if (data) applyPoiUpdated(queryClient, data);
       });
 
       es.addEventListener('poi_confirmed', (e: MessageEvent) => {
+        track(e);
         const data = parseJsonSafe<SSEPoiConfirmed>(e.data);
         if (data) applyPoiConfirmed(queryClient, data);
       });
 
       es.addEventListener('meetup_status_changed', (e: MessageEvent) => {
+        track(e);
         const data = parseJsonSafe<SSEMeetupStatusChanged>(e.data);
         if (data) applyMeetupStatusChanged(queryClient, data);
       });
 
+      es.addEventListener('resync_required', (e: MessageEvent) => {
+        // 재조회 후 서버가 알려 준 현재 위치부터 이어받음
+        track(e);
+        const data = parseJsonSafe<SSEResyncRequired>(e.data);
+        if (data) applyResyncRequired(queryClient, data);
+      });
+
       es.onopen = () => {
         attemptRef.current = 0;
       };
@@ -1,6 +1,7 @@
 import { useEffect, useRef } from 'react';
 import { useQueryClient } from '@tanstack/react-query';
 import { config } from '@/config';
+import { apiPost } from '@/shared/api';
 import {
   applyMidpointUpdated,
   applyMeetupStatusChanged,
@@ -12,8 +13,17 @@ import type {
   SSEMidpointUpdated,
   SSEPoiUpdated,
   SSEPoiConfirmed,
+  SSEStreamOpened,
 } from '@/types/sse';
 
+/** 서버가 이벤트를 걸러 보낼 화면 범위 */
+export interface StreamViewport {
+  minLat: number;
+  minLng: number;
+  maxLat: number;
+  maxLng: number;
+}
+
 function parseJsonSafe<T>(raw: string): T | null {
   try {
     return JSON.parse(raw) as T;
@@ -22,21 +32,60 @@ function parseJsonSafe<T>(raw: string): T | null {
   }
 }
 
+function toBboxParam(v: StreamViewport): string {
+  return [v.minLat, v.minLng, v.maxLat, v.maxLng].join(',');
+}
+
+/** 서버 뷰포트 갱신 (best-effort: 실패 시 다음 화면 이동 때 다시 시도) */
+function postViewport(
+  url: string,
+  streamId: string,
+  bbox: string,
+  sentBboxRef: { current: string | null }
+): void {
+  if (bbox === sentBboxRef.current) return;
+  sentBboxRef.current = bbox;
+  apiPost<void>(`${url}/${streamId}/viewport?bbox=${encodeURIComponent(bbox)}`).catch(() => {
+    sentBboxRef.current = null;
+  });
+}
+
 /**
  * Optional global meetups SSE stream (e.g. /meetups/stream).
  * If VITE_MEETUPS_STREAM_URL is not set, this hook is a no-op.
+ * viewport 지정 시 ?bbox= 로 화면 안 모임 이벤트만 받고, 화면이 바뀌면 스트림을 유지한 채
+ * POST {stream}/{stream_id}/viewport 로 서버 뷰포트만 갱신.
  */
-export function useMeetupsStream(): void {
+export function useMeetupsStream(viewport?: StreamViewport | null): void {
   const queryClient = useQueryClient();
   const esRef = useRef<EventSource | null>(null);
+  const streamIdRef = useRef<string | null>(null);
+  /** 서버에 반영된 bbox (중복 갱신 방지) */
+  const sentBboxRef = useRef<string | null>(null);
+  const bboxParam = viewport ? toBboxParam(viewport) : null;
+  const bboxRef = useRef(bboxParam);
+  bboxRef.current = bboxParam;
+  const filtered = bboxParam != null;
 
   useEffect(() => {
     const url = config.meetupsStreamUrl;
     if (!url) return;
 
-    const es = new EventSource(url);
+    const initialBbox = bboxRef.current;
+    const es = new EventSource(
+      initialBbox ? `${url}?bbox=${encodeURIComponent(initialBbox)}` : url
+    );
     esRef.current = es;
 
+    es.addEventListener('stream_opened', (e: MessageEvent) => {
+      const data = parseJsonSafe<SSEStreamOpened>(e.data);
+      if (!data) return;
+      // 브라우저 자동 재연결 시 URL의 최초 bbox 로 열리므로 현재 화면으로 다시 맞춤
+      streamIdRef.current = data.stream_id;
+      sentBboxRef.current = initialBbox;
+      if (bboxRef.current) postViewport(url, data.stream_id, bboxRef.current, sentBboxRef);
+    });
+
     es.addEventListener('meetup_status_changed', (e: MessageEvent) => {
       const data = parseJsonSafe<SSEMeetupStatusChanged>(e.data);
       if (!data) return;
@@ -63,12 +112,21 @@ export function useMeetupsStream(): void {
 
     es.onerror = () => {
       // For now, let browser reconnect automatically; this is best-effort optional stream.
+      streamIdRef.current = null;
     };
 
     return () => {
       es.close();
       esRef.current = null;
+      streamIdRef.current = null;
     };
-  }, [queryClient]);
-}
+    // 뷰포트 변경은 스트림을 다시 열지 않고 아래 effect 에서 POST (필터 사용 여부가 바뀔 때만 재연결)
+  }, [queryClient, filtered]);
 
+  useEffect(() => {
+    const url = config.meetupsStreamUrl;
+    const streamId = streamIdRef.current;
+    if (!url || !streamId || !bboxParam) return;
+    postViewport(url, streamId, bboxParam, sentBboxRef);
+  }, [bboxParam]);
+}
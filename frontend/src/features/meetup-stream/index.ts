@@ -1,8 +1,10 @@
 export { useMeetupStream } from './hooks/useMeetupStream';
 export { useMeetupsStream } from './hooks/useMeetupsStream';
+export type { StreamViewport } from './hooks/useMeetupsStream';
 export {
   applyMidpointUpdated,
   applyPoiUpdated,
   applyPoiConfirmed,
   applyMeetupStatusChanged,
+  applyResyncRequired,
 } from './events';
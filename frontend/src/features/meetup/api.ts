@@ -1,5 +1,5 @@
 import { apiGet, apiPost, apiDelete } from '@/shared/api';
-import type { MeetupCategory, MeetupDetailOut, MeetupResponse } from '@/types';
+import type { MeetupCategory, MeetupDetailOut, MeetupResponse, MeetupStatus } from '@/types';
 
 const BASE = '/meetups';
 
@@ -15,12 +15,13 @@ export async function createMeetup(body: {
   return apiPost<MeetupResponse>(BASE, body);
 }
 
+/** status 미지정 시 서버는 모든 상태를 반환 (RECRUITING 만 지정해야 부분 인덱스·인메모리 인덱스 사용) */
 export async function fetchMeetupsByBbox(
   minLat: number,
   minLng: number,
   maxLat: number,
   maxLng: number,
-  init?: { signal?: AbortSignal }
+  init?: { signal?: AbortSignal; status?: MeetupStatus[] }
 ): Promise<MeetupResponse[]> {
   const params = new URLSearchParams({
     min_lat: String(minLat),
@@ -28,7 +29,8 @@ export async function fetchMeetupsByBbox(
     max_lat: String(maxLat),
     max_lng: String(maxLng),
   });
-  return apiGet<MeetupResponse[]>(`${BASE}/bbox?${params}`, init);
+  init?.status?.forEach((s) => params.append('status', s));
+  return apiGet<MeetupResponse[]>(`${BASE}/bbox?${params}`, { signal: init?.signal });
 }
 
 export async function fetchMeetupDetail(id: number, userId?: number): Promise<MeetupDetailOut> {
@@ -17,10 +17,12 @@ import {
 import { CreateMeetupButton } from '@/features/create-meetup/CreateMeetupButton';
 import { CreateMeetupBottomSheet } from '@/features/create-meetup/CreateMeetupBottomSheet';
 import { MeetupBottomSheet, MeetupDetail } from '@/features/meetup-detail';
-import type { MeetupCategory, MeetupResponse } from '@/types';
+import type { MeetupCategory, MeetupResponse, MeetupStatus } from '@/types';
 
 /** Fallback center when geolocation is unavailable (e.g. Gangnam). */
 const DEFAULT_CENTER: [number, number] = [37.5, 127.0];
+/** 지도에는 모집 중 모임만 표시 (서버 부분 인덱스 WHERE status = 'RECRUITING' 사용) */
+const MAP_STATUSES: MeetupStatus[] = ['RECRUITING'];
 const ALL_MEETUP_CATEGORIES: MeetupCategory[] = [
   'STUDY',
   'MEAL',
@@ -47,7 +49,7 @@ export function MapPage() {
   const { data: meetups = [] } = useQuery({
     queryKey: meetupKeys.list(bbox),
     queryFn: ({ signal }) =>
-      fetchMeetupsByBbox(bbox.minLat, bbox.minLng, bbox.maxLat, bbox.maxLng, { signal }),
+      fetchMeetupsByBbox(bbox.minLat, bbox.minLng, bbox.maxLat, bbox.maxLng, { signal, status: MAP_STATUSES }),
   });
 
   const filteredMeetups = useMemo(() => {
@@ -61,7 +63,7 @@ export function MapPage() {
   }, [meetups, selectedCategory]);
 
   const points = useClusters(filteredMeetups, bbox, zoom);
-  useMeetupsStream();
+  useMeetupsStream(bbox);
   useMeetupStream(selectedId);
 
   useEffect(() => {
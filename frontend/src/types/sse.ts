@@ -1,6 +1,9 @@
 /**
  * SSE 이벤트 payload 타입.
- * event: midpoint_updated | poi_updated | poi_confirmed | meetup_status_changed
+ * event: midpoint_updated | poi_updated | poi_confirmed | meetup_status_changed | resync_required
+ * 모임 스트림은 첫 이벤트 stream_opened 의 id: 로 현재 위치 전달 (빈 스트림이면 0-0)
+ * 글로벌 스트림(?bbox=)은 첫 이벤트로 stream_opened (stream_id)
+ * 모임 스트림 이벤트는 event_id(= SSE id:) 포함 — 재접속 시 Last-Event-ID 로 이어받기
  */
 
 export interface SSEMidpointUpdated {
@@ -33,6 +36,16 @@ export interface SSEMeetupStatusChanged {
   ts: string;
 }
 
+/** 재전송 불가(기록 만료 등): 해당 모임 데이터 전체 재조회 필요 */
+export interface SSEResyncRequired {
+  meetup_id: number;
+}
+
+/** /meetups/stream?bbox= 첫 이벤트: 뷰포트 변경(POST .../{stream_id}/viewport)에 사용 */
+export interface SSEStreamOpened {
+  stream_id: string;
+}
+
 export type SSEPayload =
   | SSEMidpointUpdated
   | SSEPoiUpdated
@@ -0,0 +1,51 @@
+# join_meetup FK 위반 판별: psycopg2(동기 Session)와 asyncpg(AsyncSession.run_sync) 예외 형태 모두에서
+# 사용자/모임 부재를 제약 이름으로 구분하는지
+
+from types import SimpleNamespace
+
+import asyncpg
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_dbapi
+from sqlalchemy.exc import IntegrityError
+
+from app.crud.participation_crud import JoinError, join_meetup
+
+
+def _psycopg2_error(constraint: str) -> IntegrityError:
+    """psycopg2: 드라이버 예외의 diag.constraint_name."""
+    orig = Exception("fk violation")
+    orig.diag = SimpleNamespace(constraint_name=constraint)  # type: ignore[attr-defined]
+    return IntegrityError("INSERT", {}, orig)
+
+
+def _asyncpg_error(constraint: str) -> IntegrityError:
+    """asyncpg: SQLAlchemy 어댑터 예외(diag 없음)의 __cause__ 가 asyncpg 예외."""
+    cause = asyncpg.exceptions.ForeignKeyViolationError("fk violation")
+    cause.constraint_name = constraint
+    orig = AsyncAdapt_asyncpg_dbapi(asyncpg).IntegrityError("fk violation")
+    orig.__cause__ = cause
+    assert not hasattr(orig, "diag")
+    return IntegrityError("INSERT", {}, orig)
+
+
+class _RaisingSession:
+    def __init__(self, error: IntegrityError) -> None:
+        self.error = error
+
+    def execute(self, *args, **kwargs):
+        raise self.error
+
+
+@pytest.mark.parametrize("make_error", [_psycopg2_error, _asyncpg_error])
+@pytest.mark.parametrize(
+    "constraint, message",
+    [
+        ("participations_user_id_fkey", "User not found"),
+        ("participations_meetup_id_fkey", "Meetup not found"),
+    ],
+)
+def test_fk_violation_maps_to_missing_entity(make_error, constraint: str, message: str) -> None:
+    with pytest.raises(JoinError) as info:
+        join_meetup(_RaisingSession(make_error(constraint)), 1, 2, 37.5, 127.0)  # type: ignore[arg-type]
+    assert info.value.status_code == 404
+    assert info.value.message == message
@@ -0,0 +1,46 @@
+# MedianHistogram 정합성: 무작위 join/leave 시퀀스에서 매 단계 statistics.median 과 일치 (JSON 왕복 포함)
+
+import json
+import math
+import random
+import statistics
+from typing import List, Tuple
+
+import pytest
+
+from app.services.median_histogram import apply_midpoint_delta, build_midpoint_hist
+
+GRID_DEG = 0.0018
+
+
+def _snapped(rng: random.Random) -> Tuple[float, float]:
+    lat, lng = 37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4
+    return math.floor(lat / GRID_DEG) * GRID_DEG, math.floor(lng / GRID_DEG) * GRID_DEG
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_statistics_median(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(60):
+        members: List[Tuple[float, float]] = [_snapped(rng) for _ in range(rng.randint(0, 5))]
+        data = build_midpoint_hist(members)
+        for _ in range(rng.randint(1, 400)):
+            if members and rng.random() < 0.45:
+                coord = members.pop(rng.randrange(len(members)))
+                result = apply_midpoint_delta(data, *coord, add=False)
+            else:
+                # 같은 격자 값 중복이 자주 생기도록 일부는 기존 참여자 좌표 재사용
+                coord = rng.choice(members) if members and rng.random() < 0.3 else _snapped(rng)
+                members.append(coord)
+                result = apply_midpoint_delta(data, *coord, add=True)
+            assert result is not None
+            data, mid = json.loads(json.dumps(result[0])), result[1]
+            expected = (
+                (statistics.median(c[0] for c in members), statistics.median(c[1] for c in members))
+                if members else None
+            )
+            assert mid == expected
+
+
+def test_remove_missing_value_requests_rebuild() -> None:
+    assert apply_midpoint_delta(build_midpoint_hist([(1.0, 2.0)]), 3.0, 4.0, add=False) is None
@@ -0,0 +1,18 @@
+# 인메모리 인덱스 정합성 검사: 이벤트로 받은 midpoint 와 DB 값의 부동소수 끝자리 차이는 stale 로 세지 않음
+
+from app.schemas.meetup import MeetupResponse
+from app.services.meetup_index import _is_stale
+
+HELD = MeetupResponse(id=1, title="t", capacity=4, current_count=2, lat=37.5, lng=127.0,
+                      midpoint={"lat": 37.5012, "lng": 127.0034})
+
+
+def test_midpoint_float_noise_is_not_stale() -> None:
+    fresh = HELD.model_copy(update={"midpoint": {"lat": 37.5012 + 1e-14, "lng": 127.0034 - 1e-14}})
+    assert not _is_stale(HELD, fresh)
+
+
+def test_event_fields_changed_are_stale() -> None:
+    assert _is_stale(HELD, HELD.model_copy(update={"current_count": 3}))
+    assert _is_stale(HELD, HELD.model_copy(update={"midpoint": {"lat": 37.51, "lng": 127.0034}}))
+    assert _is_stale(HELD, HELD.model_copy(update={"midpoint": None}))